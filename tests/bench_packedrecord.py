@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+#
+# Compares publishing a 30 field record with one SmartDashboard.putNumber
+# per field against publishing it as a single PackedRecord. No results
+# are recorded here; the times depend on the machine, so run it where
+# you want to know them.
+#
+# Run with: python bench_packedrecord.py
+#
+
+import timeit
+
+from wpilib import PackedRecord, PackedRecordPublisher, SmartDashboard
+
+NFIELDS = 30
+NLOOPS = 10000
+
+State = type(
+    "State",
+    (PackedRecord,),
+    {"__annotations__": {f"f{i}": float for i in range(NFIELDS)}},
+)
+
+
+def main():
+    state = State(**{f"f{i}": float(i) for i in range(NFIELDS)})
+    names = [f"bench/fields/f{i}" for i in range(NFIELDS)]
+    publisher = PackedRecordPublisher(State, "bench/packed")
+
+    def per_field():
+        for name, field in zip(names, State._fields):
+            SmartDashboard.putNumber(name, getattr(state, field))
+
+    def packed():
+        publisher.publish(state)
+
+    t_fields = timeit.timeit(per_field, number=NLOOPS) / NLOOPS
+    t_packed = timeit.timeit(packed, number=NLOOPS) / NLOOPS
+
+    print(f"{NFIELDS} putNumber calls: {t_fields * 1e6:8.1f} us/loop")
+    print(f"1 packed record:     {t_packed * 1e6:8.1f} us/loop")
+    print(f"ratio:               {t_fields / t_packed:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
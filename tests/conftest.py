@@ -0,0 +1,16 @@
+import time
+
+import pytest
+
+
+def _wait_for(fn, timeout=2.0):
+    end = time.monotonic() + timeout
+    while not fn():
+        assert time.monotonic() < end, "timed out"
+        time.sleep(0.002)
+
+
+@pytest.fixture
+def wait_for():
+    """Polls a condition until it is true, failing after a timeout"""
+    return _wait_for
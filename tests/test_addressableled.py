@@ -0,0 +1,131 @@
+import time
+
+import numpy as np
+import pytest
+
+import wpilib
+from wpilib.simulation import AddressableLEDSim
+
+
+@pytest.fixture
+def led():
+    led = wpilib.AddressableLED(0)
+    led.setLength(5)
+    led.start()
+    yield led, AddressableLEDSim(led)
+    led.stop()
+
+
+def test_addressable_led_set_data_rgb(led):
+    led, sim = led
+    data = np.array(
+        [[255, 0, 0], [0, 255, 0], [0, 0, 255], [1, 2, 3], [0, 0, 0]], dtype=np.uint8
+    )
+    led.setData(data)
+    np.testing.assert_array_equal(sim.getData(), data)
+
+    # the data was copied, so the buffer can be reused
+    data[0] = 7
+    assert sim.getData()[0].tolist() == [255, 0, 0]
+
+
+def test_addressable_led_set_data_rgb_padding(led):
+    led, sim = led
+    data = np.zeros((5, 4), dtype=np.uint8)
+    data[:, 0] = 10  # r
+    data[:, 1] = 20  # g
+    data[:, 2] = 30  # b
+    data[:, 3] = 99  # padding
+    led.setData(data)
+    assert sim.getData().tolist() == [[10, 20, 30]] * 5
+
+
+def test_addressable_led_set_data_converted(led):
+    led, sim = led
+    # other dtypes and lists are converted
+    led.setData(np.full((5, 3), 7, dtype=np.int64))
+    assert sim.getData().tolist() == [[7, 7, 7]] * 5
+    led.setData([[1, 2, 3]] * 5)
+    assert sim.getData().tolist() == [[1, 2, 3]] * 5
+
+
+def test_addressable_led_set_data_raw(led):
+    led, sim = led
+    data = np.zeros((5, 4), dtype=np.uint8)
+    data[:, 0] = 10  # b
+    data[:, 1] = 20  # g
+    data[:, 2] = 30  # r
+    led.setDataRaw(memoryview(data))
+    assert sim.getData().tolist() == [[30, 20, 10]] * 5
+
+    with pytest.raises(ValueError):
+        led.setDataRaw(np.zeros((5, 3), dtype=np.uint8))
+
+
+def test_addressable_led_set_data_objects(led):
+    led, sim = led
+    led.setData([wpilib.AddressableLED.LEDData(1, 2, 3)] * 5)
+    assert sim.getData().tolist() == [[1, 2, 3]] * 5
+
+
+def test_addressable_led_set_data_bad_shape(led):
+    led, _ = led
+    with pytest.raises(ValueError):
+        led.setData(np.zeros((5, 2), dtype=np.uint8))
+
+
+def test_addressable_led_sim_set_data(led):
+    _, sim = led
+    sim.setData([[1, 2, 3], [4, 5, 6]])
+    assert sim.getData().tolist() == [[1, 2, 3], [4, 5, 6]]
+
+
+def test_animator_render(led):
+    led, _ = led
+    animator = wpilib.AddressableLEDAnimator(led, 5)
+    red = wpilib.Color8Bit(255, 0, 0)
+    blue = wpilib.Color8Bit(0, 0, 255)
+
+    animator.setSolid(red)
+    assert animator.renderFrame(0).tolist() == [[255, 0, 0]] * 5
+
+    animator.setChase(red, blue, 2, 1.0)
+    frame = animator.renderFrame(0)
+    assert frame[:2].tolist() == [[255, 0, 0]] * 2
+    assert frame[2:].tolist() == [[0, 0, 255]] * 3
+    frame = animator.renderFrame(4)
+    assert frame[[4, 0]].tolist() == [[255, 0, 0]] * 2
+
+    animator.setBlend(red, blue, 2)
+    assert animator.renderFrame(0)[0].tolist() == [255, 0, 0]
+    assert animator.renderFrame(1)[0].tolist() == [0, 0, 255]
+    assert animator.renderFrame(0.5)[0].tolist() == [128, 0, 128]
+
+    animator.setGradient(red, blue)
+    frame = animator.renderFrame(0)
+    assert frame[0].tolist() == [255, 0, 0]
+    assert frame[-1].tolist() == [0, 0, 255]
+
+    animator.setRainbow(255, 255, 0)
+    frame = animator.renderFrame(0)
+    assert len({tuple(c) for c in frame.tolist()}) == 5
+    # a rainbow with a cycle time of 0 doesn't move
+    np.testing.assert_array_equal(animator.renderFrame(10), frame)
+
+
+def test_animator_thread(led):
+    led, sim = led
+    animator = wpilib.AddressableLEDAnimator(led, 5, 0.005)
+    animator.setSolid(wpilib.Color8Bit(0, 255, 0))
+
+    with animator:
+        assert animator.isRunning()
+        for _ in range(200):
+            if animator.getFrameCount() >= 2:
+                break
+            time.sleep(0.005)
+
+    assert not animator.isRunning()
+    assert animator.getFrameCount() >= 2
+    assert animator.getLastFrame().tolist() == [[0, 255, 0]] * 5
+    assert sim.getData().tolist() == [[0, 255, 0]] * 5
@@ -0,0 +1,106 @@
+import threading
+
+import pytest
+
+import wpilib
+from wpilib.simulation import DIOSim
+
+
+class Recorder:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = []
+
+    def __call__(self, timestamps, rising):
+        with self.lock:
+            self.calls.append((timestamps.tolist(), rising.tolist()))
+
+    def edges(self):
+        with self.lock:
+            return [r for _, rising in self.calls for r in rising]
+
+
+def _toggle(wait_for, sim, interrupt, value):
+    count = interrupt.getEdgeCount()
+    sim.setValue(value)
+    wait_for(lambda: interrupt.getEdgeCount() > count)
+
+
+def test_asynchronous_interrupt(wait_for):
+    dio = wpilib.DigitalInput(0)
+    sim = DIOSim(dio)
+    sim.setValue(False)
+
+    recorder = Recorder()
+    interrupt = wpilib.AsynchronousInterrupt(dio, recorder)
+    interrupt.setInterruptEdges(True, True)
+
+    with interrupt:
+        assert interrupt.isRunning()
+        _toggle(wait_for, sim, interrupt, True)
+        _toggle(wait_for, sim, interrupt, False)
+        wait_for(lambda: len(recorder.edges()) == 2)
+
+    assert not interrupt.isRunning()
+    assert recorder.edges() == [True, False]
+    timestamps = [t for ts, _ in recorder.calls for t in ts]
+    assert timestamps == sorted(timestamps)
+    assert interrupt.getDroppedCount() == 0
+
+
+def test_coalesced_callbacks(wait_for):
+    dio = wpilib.DigitalInput(1)
+    sim = DIOSim(dio)
+    sim.setValue(False)
+
+    # long enough that all of the edges arrive within one period
+    dispatcher = wpilib.InterruptDispatcher(0.5)
+    recorder = Recorder()
+    interrupt = wpilib.AsynchronousInterrupt(dio, recorder, dispatcher, capacity=4)
+    interrupt.setInterruptEdges(True, True)
+
+    # the first round is delivered immediately, then rounds are rate limited
+    with interrupt:
+        _toggle(wait_for, sim, interrupt, True)
+        wait_for(lambda: len(recorder.calls) == 1)
+
+        for i in range(6):
+            _toggle(wait_for, sim, interrupt, i % 2 == 1)
+
+        wait_for(lambda: len(recorder.calls) == 2)
+
+    # the buffer only holds the newest four edges
+    assert recorder.calls[1][1] == [False, True, False, True]
+    assert interrupt.getEdgeCount() == 7
+    assert interrupt.getDroppedCount() == 2
+    assert dispatcher.getDispatchCount() == 2
+
+
+def test_shared_dispatcher(wait_for):
+    inputs = [wpilib.DigitalInput(ch) for ch in (2, 3)]
+    sims = [DIOSim(dio) for dio in inputs]
+    for sim in sims:
+        sim.setValue(False)
+
+    recorders = [Recorder(), Recorder()]
+    interrupts = [
+        wpilib.AsynchronousInterrupt(dio, recorder)
+        for dio, recorder in zip(inputs, recorders)
+    ]
+    assert interrupts[0].getDispatcher() is interrupts[1].getDispatcher()
+
+    for interrupt in interrupts:
+        interrupt.start()
+    try:
+        for sim, interrupt in zip(sims, interrupts):
+            _toggle(wait_for, sim, interrupt, True)
+        wait_for(lambda: all(r.edges() == [True] for r in recorders))
+    finally:
+        for interrupt in interrupts:
+            interrupt.stop()
+
+
+def test_bad_capacity():
+    dio = wpilib.DigitalInput(4)
+    with pytest.raises(RuntimeError):
+        wpilib.AsynchronousInterrupt(dio, lambda t, r: None, capacity=0)
@@ -0,0 +1,121 @@
+import pathlib
+
+import numpy as np
+import pytest
+
+from wpiutil.log import DataLog
+
+import wpilib
+from wpilib._impl import wpilog
+
+
+@pytest.fixture
+def log(tmp_path: pathlib.Path):
+    log = DataLog(str(tmp_path), "entries.wpilog")
+    yield log
+    log.flush()
+
+
+def _write(tmp_path: pathlib.Path, fn) -> pathlib.Path:
+    log = DataLog(str(tmp_path), "entries.wpilog")
+    fn(log)
+    # destroying the log writes everything to disk and closes the file
+    del log
+    return tmp_path / "entries.wpilog"
+
+
+def _read(path: pathlib.Path, name: str):
+    with open(path, "rb") as fp:
+        records = [r for r in wpilog.iter_records(fp) if r.entry.name == name]
+    return [r.timestamp for r in records], [
+        wpilog.decode(r.entry, r.payload) for r in records
+    ]
+
+
+def test_double_entry_append_many(tmp_path: pathlib.Path):
+    def write(log):
+        entry = wpilib.DataLogDoubleEntry(log, "/test/double")
+        entry.append(1.0)
+        entry.append(2.0, 1000)
+        entry.appendMany(np.arange(3.0) + 10, np.array([2000, 2001, 2002]))
+        entry.appendMany([20.0, 21.0], None)
+        entry.appendMany(np.array([30.0]))
+        entry.finish()
+
+    timestamps, values = _read(_write(tmp_path, write), "/test/double")
+    assert values == [1.0, 2.0, 10.0, 11.0, 12.0, 20.0, 21.0, 30.0]
+    assert timestamps[1:5] == [1000, 2000, 2001, 2002]
+
+    # records without a timestamp get the current time
+    now = [timestamps[0]] + timestamps[5:]
+    assert all(t > 0 for t in now)
+    assert now[1:] == sorted(now[1:])
+
+
+def test_scalar_entries(tmp_path: pathlib.Path):
+    def write(log):
+        wpilib.DataLogBooleanEntry(log, "/test/bool").appendMany(
+            np.array([True, False, True]), None
+        )
+        wpilib.DataLogIntegerEntry(log, "/test/int").appendMany(
+            np.arange(5, dtype=np.int64) - 2, np.arange(5, dtype=np.int64) + 100
+        )
+
+    path = _write(tmp_path, write)
+
+    timestamps, values = _read(path, "/test/bool")
+    assert values == [True, False, True]
+    assert all(t > 0 for t in timestamps)
+
+    timestamps, values = _read(path, "/test/int")
+    assert values == [-2, -1, 0, 1, 2]
+    assert timestamps == [100, 101, 102, 103, 104]
+
+
+def test_array_entries(tmp_path: pathlib.Path):
+    def write(log):
+        entry = wpilib.DataLogDoubleArrayEntry(log, "/test/darray")
+        entry.append([1.0, 2.0, 3.0], 10)
+        entry.appendMany(
+            np.arange(12.0).reshape(4, 3), np.arange(4, dtype=np.int64) + 20
+        )
+        # not contiguous, so it is copied first
+        entry.appendMany(np.arange(8.0).reshape(2, 4)[:, ::2])
+
+        raw = wpilib.DataLogRawEntry(log, "/test/raw")
+        raw.append(b"\x01\x02\x03")
+        raw.appendMany(np.arange(16, dtype=np.uint8).reshape(2, 8), None)
+        raw.appendMany(np.full((1, 2), 7, dtype=np.uint8), np.array([50]))
+
+    path = _write(tmp_path, write)
+
+    timestamps, values = _read(path, "/test/darray")
+    assert values == [
+        [1.0, 2.0, 3.0],
+        [0.0, 1.0, 2.0],
+        [3.0, 4.0, 5.0],
+        [6.0, 7.0, 8.0],
+        [9.0, 10.0, 11.0],
+        [0.0, 2.0],
+        [4.0, 6.0],
+    ]
+    assert timestamps[:5] == [10, 20, 21, 22, 23]
+    assert all(t > 0 for t in timestamps[5:])
+
+    timestamps, values = _read(path, "/test/raw")
+    assert values == [
+        b"\x01\x02\x03",
+        bytes(range(8)),
+        bytes(range(8, 16)),
+        b"\x07\x07",
+    ]
+    assert all(t > 0 for t in timestamps[:3])
+    assert timestamps[3] == 50
+
+
+def test_append_many_bad_timestamps(log):
+    entry = wpilib.DataLogDoubleEntry(log, "/test/bad")
+    with pytest.raises(ValueError):
+        entry.appendMany(np.arange(10.0), np.arange(5, dtype=np.int64))
+    with pytest.raises(ValueError):
+        entry.appendMany(np.zeros((2, 2)), None)
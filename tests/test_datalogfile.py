@@ -0,0 +1,124 @@
+import pathlib
+import struct
+
+import numpy as np
+import pytest
+
+from wpiutil.log import DataLog
+
+import wpilib
+from wpilib.datalogfile import DataLogFile
+
+
+@pytest.fixture
+def logfile(tmp_path: pathlib.Path) -> pathlib.Path:
+    log = DataLog(str(tmp_path), "test.wpilog")
+
+    doubles = wpilib.DataLogDoubleEntry(log, "/test/double")
+    doubles.appendMany(np.arange(100.0), np.arange(100, dtype=np.int64) * 1000)
+
+    strings = wpilib.DataLogRawEntry(log, "/test/string", "", "string")
+    strings.append(b"hello", 5000)
+    strings.append(b"world", 6000)
+
+    arrays = wpilib.DataLogDoubleArrayEntry(log, "/test/array")
+    arrays.appendMany(np.ones((3, 2)), np.array([1, 2, 3], dtype=np.int64))
+
+    # destroying the log writes everything to disk and closes the file
+    del doubles, strings, arrays, log
+    return tmp_path / "test.wpilog"
+
+
+def test_datalogfile_read(logfile: pathlib.Path):
+    with DataLogFile(logfile) as log:
+        entry = log.getEntry("/test/double")
+        assert entry.type == "double"
+        assert len(entry) == 100
+        np.testing.assert_array_equal(entry.timestamps, np.arange(100) * 1000)
+        np.testing.assert_array_equal(entry.getValues(), np.arange(100.0))
+
+        ts, values = entry.slice(10_000, 20_000)
+        np.testing.assert_array_equal(ts, np.arange(10, 20) * 1000)
+        np.testing.assert_array_equal(values, np.arange(10.0, 20.0))
+
+        assert log.getEntry("/test/string").getValues() == ["hello", "world"]
+
+        arrays = log.getEntry("/test/array").getValues()
+        assert len(arrays) == 3
+        np.testing.assert_array_equal(arrays[0], [1.0, 1.0])
+
+
+def test_datalogfile_persisted_index(logfile: pathlib.Path):
+    with DataLogFile(logfile) as log:
+        expected = log.getEntry("/test/double").getValues()
+
+    assert (logfile.parent / "test.wpilog.idx").exists()
+
+    with DataLogFile(logfile) as log:
+        assert log._indexMap is not None
+        np.testing.assert_array_equal(
+            log.getEntry("/test/double").getValues(), expected
+        )
+
+
+def test_datalogfile_no_persist(logfile: pathlib.Path):
+    with DataLogFile(logfile, persistIndex=False) as log:
+        assert "/test/double" in log.entries
+
+    assert not (logfile.parent / "test.wpilog.idx").exists()
+
+
+def test_datalogfile_invalid(tmp_path: pathlib.Path):
+    path = tmp_path / "bad.wpilog"
+    path.write_bytes(b"not a log file")
+    with pytest.raises(ValueError):
+        DataLogFile(path)
+
+
+def _record(entry: int, timestamp: int, payload: bytes) -> bytes:
+    # 4 byte id, 4 byte size, 8 byte timestamp
+    return struct.pack("<BIIQ", 0x7F, entry, len(payload), timestamp) + payload
+
+
+def _start(entry: int, name: str, typ: str) -> bytes:
+    payload = struct.pack("<BI", 0, entry)
+    for s in (name, typ, ""):
+        payload += struct.pack("<I", len(s)) + s.encode()
+    return _record(0, 0, payload)
+
+
+def _finish(entry: int) -> bytes:
+    return _record(0, 0, struct.pack("<BI", 1, entry))
+
+
+def test_datalogfile_malformed(tmp_path: pathlib.Path):
+    path = tmp_path / "malformed.wpilog"
+    path.write_bytes(
+        b"WPILOG"
+        + struct.pack("<HI", 0x0100, 0)
+        + _start(1, "/test/double", "double")
+        + _record(1, 10, struct.pack("<d", 1.0))
+        + _record(1, 20, b"bad")
+        + _record(1, 30, struct.pack("<d", 3.0))
+        # started again with a different type
+        + _finish(1)
+        + _start(2, "/test/double", "string")
+        + _record(2, 40, b"four")
+    )
+
+    with DataLogFile(path, persistIndex=False) as log:
+        entry = log.getEntry("/test/double", "double")
+        assert len(entry) == 2
+        ts, values = entry.slice()
+        np.testing.assert_array_equal(ts, [10, 30])
+        np.testing.assert_array_equal(values, [1.0, 3.0])
+        ts, values = entry.slice(20, 40)
+        np.testing.assert_array_equal(ts, [30])
+        np.testing.assert_array_equal(values, [3.0])
+
+        entry = log.getEntry("/test/double")
+        assert entry.type == "string"
+        assert entry is log.getEntry("/test/double", "string")
+        ts, values = entry.slice()
+        np.testing.assert_array_equal(ts, [40])
+        assert values == ["four"]
@@ -0,0 +1,113 @@
+import gzip
+import pathlib
+
+import numpy as np
+import pytest
+
+import wpilib
+from wpilib._impl import wpilog
+from wpilib.datalogfile import DataLogFile
+
+
+def _write(logs: wpilib.RotatingDataLogManager, n: int) -> None:
+    entry = wpilib.DataLogDoubleEntry(logs.getLog(), "/test/value")
+    entry.appendMany(np.arange(n, dtype=np.float64), np.arange(n, dtype=np.int64) + 1)
+
+
+def test_rotation_segments(tmp_path: pathlib.Path):
+    logs = wpilib.RotatingDataLogManager(
+        str(tmp_path), maxSegmentSize=4096, logNetworkTables=False
+    )
+    _write(logs, 2000)
+    logs.close()
+
+    segments = sorted(tmp_path.glob(logs.session + "_*.wpilog.gz"))
+    assert len(segments) > 1
+    assert not list(tmp_path.glob("*.wpilog"))
+
+    # each segment can be read on its own
+    for segment in segments:
+        with gzip.open(segment, "rb") as fp:
+            assert any(r.entry.name == "/test/value" for r in wpilog.iter_records(fp))
+
+    # and the session reads as one log
+    with wpilib.RotatingDataLogManager.openSession(str(tmp_path)) as fp:
+        values = [
+            wpilog.decode(r.entry, r.payload)
+            for r in wpilog.iter_records(fp)
+            if r.entry.name == "/test/value"
+        ]
+    assert values == list(np.arange(2000, dtype=np.float64))
+
+
+def test_rotation_join(tmp_path: pathlib.Path):
+    logs = wpilib.RotatingDataLogManager(
+        str(tmp_path / "logs"),
+        maxSegmentSize=4096,
+        compression=None,
+        logNetworkTables=False,
+    )
+    _write(logs, 500)
+    logs.rotate()
+    logs.log("done")
+    logs.close()
+
+    joined = tmp_path / "joined.wpilog"
+    wpilib.RotatingDataLogManager.joinSession(str(joined), str(tmp_path / "logs"))
+
+    with open(joined, "rb") as fp:
+        names = [r.entry.name for r in wpilog.iter_records(fp)]
+    assert names.count("/test/value") == 500
+    assert names.count("messages") == 1
+
+    # the entries restated at the start of each segment continue the
+    # entries that were already started
+    with DataLogFile(joined, persistIndex=False) as log:
+        entry = log.getEntry("/test/value")
+        assert len(entry._slots) == 1
+        np.testing.assert_array_equal(entry.timestamps, np.arange(500) + 1)
+        np.testing.assert_array_equal(entry.getValues(), np.arange(500.0))
+        assert log.getEntry("messages").getValues() == ["done"]
+
+
+def test_rotation_retention(tmp_path: pathlib.Path):
+    logs = wpilib.RotatingDataLogManager(
+        str(tmp_path),
+        maxSegmentSize=4096,
+        maxTotalSize=16384,
+        compression=None,
+        logNetworkTables=False,
+    )
+    _write(logs, 10000)
+    logs.close()
+
+    total = sum(p.stat().st_size for p in tmp_path.glob("*.wpilog"))
+    assert total <= 16384
+
+
+def test_rotation_closed(tmp_path: pathlib.Path):
+    logs = wpilib.RotatingDataLogManager(
+        str(tmp_path), compression=None, logNetworkTables=False
+    )
+    entry = wpilib.DataLogDoubleEntry(logs.getLog(), "/test/value")
+    entry.append(1.0, 1)
+    logs.log("hello")
+    logs.close()
+
+    # the log can still be used, but nothing is written
+    segments = sorted(tmp_path.glob(logs.session + "_*.wpilog.gz"))
+    entry.append(2.0, 2)
+    entry.finish()
+    assert sorted(tmp_path.glob(logs.session + "_*.wpilog.gz")) == segments
+    assert not list(tmp_path.glob("*.wpilog"))
+    with logs.openSession(str(tmp_path), logs.session) as fp:
+        records = [r for r in wpilog.iter_records(fp) if r.entry.name == "/test/value"]
+    assert [r.timestamp for r in records] == [1]
+
+    with pytest.raises(RuntimeError):
+        logs.getLog()
+    with pytest.raises(RuntimeError):
+        logs.log("goodbye")
+
+    # closing again does nothing
+    logs.close()
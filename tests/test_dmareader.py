@@ -0,0 +1,87 @@
+import threading
+
+import numpy as np
+import pytest
+
+import wpilib
+
+
+@pytest.fixture
+def reader():
+    encoder = wpilib.Encoder(0, 1)
+    analog = wpilib.AnalogInput(0)
+    reader = wpilib.DMAReader()
+    assert reader.addEncoder(encoder) == 0
+    assert reader.addAnalogInput(analog) == 1
+    assert reader.getChannelCount() == 2
+    reader.setTimedTrigger(0.001)
+    reader.start(1024)
+    yield reader
+    reader.stop()
+
+
+def test_dma_reader_read_into(reader):
+    for i in range(5):
+        reader.addSimSample(1000 * i, [i * 0.5, i * 0.25])
+
+    timestamps = np.zeros(3, dtype=np.uint64)
+    values = np.zeros((3, 2))
+    assert reader.readInto(timestamps, values) == 3
+    assert timestamps.tolist() == [0, 1000, 2000]
+    assert values.tolist() == [[0.0, 0.0], [0.5, 0.25], [1.0, 0.5]]
+
+    # the same arrays can be reused
+    assert reader.readInto(timestamps, values) == 2
+    assert timestamps[:2].tolist() == [3000, 4000]
+    assert values[:2].tolist() == [[1.5, 0.75], [2.0, 1.0]]
+
+    assert reader.readInto(timestamps, values) == 0
+
+
+def test_dma_reader_read(reader):
+    reader.addSimSample(10, [1, 2])
+    reader.addSimSample(20, [3, 4])
+
+    timestamps, values = reader.read()
+    assert timestamps.dtype == np.uint64
+    assert timestamps.tolist() == [10, 20]
+    assert values.tolist() == [[1, 2], [3, 4]]
+
+    timestamps, values = reader.read()
+    assert timestamps.shape == (0,)
+    assert values.shape == (0, 2)
+
+
+def test_dma_reader_timeout(reader):
+    t = threading.Timer(0.05, reader.addSimSample, (5, [1, 1]))
+    t.start()
+    try:
+        timestamps, _ = reader.read(timeout=2)
+    finally:
+        t.join()
+    assert timestamps.tolist() == [5]
+
+
+def test_dma_reader_bad_arrays(reader):
+    with pytest.raises(TypeError):
+        reader.readInto(np.zeros(3, dtype=np.uint64), np.zeros((3, 2), np.float32))
+    with pytest.raises(TypeError):
+        reader.readInto(np.zeros(3, dtype=np.int64), np.zeros((3, 2)))
+    with pytest.raises(TypeError):
+        reader.readInto(np.zeros(3, dtype=np.uint64), np.zeros((2, 3)).T)
+
+    # wrong shapes
+    timestamps = np.zeros(3, dtype=np.uint64)
+    with pytest.raises(ValueError):
+        reader.readInto(timestamps, np.zeros(6))
+    with pytest.raises(ValueError):
+        reader.readInto(timestamps, np.zeros((3, 3)))
+    with pytest.raises(ValueError):
+        reader.readInto(timestamps, np.zeros((2, 2)))
+
+
+def test_dma_reader_errors(reader):
+    with pytest.raises(RuntimeError):
+        reader.addSimSample(0, [1.0])
+    with pytest.raises(RuntimeError):
+        reader.addDigitalSource(wpilib.DigitalInput(5))
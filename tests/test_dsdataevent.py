@@ -0,0 +1,60 @@
+import asyncio
+import threading
+import time
+
+import wpilib
+from wpilib.simulation import DriverStationSim
+
+
+def test_dsdataevent_wait():
+    event = wpilib.DSDataEvent()
+    assert not event.wait(0.01)
+
+    DriverStationSim.notifyNewData()
+    assert event.wait(1.0)
+    assert event.getLastWakeTime() > 0
+
+
+def test_dsdataevent_refreshed():
+    event = wpilib.DSDataEvent(refreshed=True)
+    wpilib.DriverStation.refreshData()
+    assert event.wait(1.0)
+
+
+def test_dsdataevent_await():
+    event = wpilib.DSDataEvent()
+
+    async def main():
+        asyncio.get_running_loop().call_later(0.01, DriverStationSim.notifyNewData)
+        assert await event
+        assert not await event.waitAsync(0.01)
+
+    asyncio.run(main())
+
+
+def test_dsdrivenrobot():
+    class Robot(wpilib.DSDrivenRobot):
+        def __init__(self):
+            super().__init__(0.5)
+            self.loops = 0
+
+        def robotPeriodic(self):
+            self.loops += 1
+
+    robot = Robot()
+    th = threading.Thread(target=robot.startCompetition, daemon=True)
+    th.start()
+    try:
+        for i in range(3):
+            DriverStationSim.notifyNewData()
+            deadline = time.monotonic() + 1.0
+            while robot.getPacketLoopCount() <= i and time.monotonic() < deadline:
+                time.sleep(0.001)
+    finally:
+        robot.endCompetition()
+        th.join(2)
+
+    assert not th.is_alive()
+    assert robot.loops >= 3
+    assert robot.getPacketLoopCount() >= 3
+    assert robot.getMaxLatency() >= robot.getLastLatency() >= 0
@@ -0,0 +1,95 @@
+import pytest
+
+import wpilib
+from wpilib.event import BooleanEvent, EventLoop
+from wpilib.simulation import DriverStationSim, XboxControllerSim
+
+
+class Counter:
+    def __init__(self, value=True):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+def test_shared_condition_evaluated_once():
+    loop = EventLoop()
+    cond = Counter(False)
+    event = BooleanEvent(loop, cond)
+
+    results = []
+    event.ifHigh(lambda: results.append("a"))
+    (event & (lambda: True)).ifHigh(lambda: results.append("and"))
+    (event | (lambda: False)).ifHigh(lambda: results.append("or"))
+    (~event).ifHigh(lambda: results.append("not"))
+    event.rising().ifHigh(lambda: results.append("rising"))
+
+    calls = cond.calls
+    loop.poll()
+    assert cond.calls == calls + 1
+    assert results == ["not"]
+
+    results.clear()
+    cond.value = True
+    loop.poll()
+    assert cond.calls == calls + 2
+    assert results == ["a", "and", "or", "rising"]
+
+
+def test_condition_outside_poll():
+    loop = EventLoop()
+    cond = Counter()
+    event = BooleanEvent(loop, cond)
+
+    assert event.getAsBoolean()
+    cond.value = False
+    assert not event.getAsBoolean()
+    assert cond.calls == 2
+
+
+def test_event_operators():
+    loop = EventLoop()
+    a = Counter(True)
+    b = Counter(False)
+    ea = BooleanEvent(loop, a)
+    eb = BooleanEvent(loop, b)
+
+    assert not (ea & eb).getAsBoolean()
+    assert (ea | eb).getAsBoolean()
+    assert (~eb).getAsBoolean()
+
+
+@pytest.fixture
+def xbox():
+    controller = wpilib.XboxController(2)
+    sim = XboxControllerSim(controller)
+    sim.setButtonCount(10)
+    yield controller, sim
+    DriverStationSim.resetData()
+
+
+def test_controller_events(xbox):
+    controller, sim = xbox
+    loop = EventLoop()
+
+    results = []
+    a = controller.A(loop)
+    b = controller.B(loop)
+    (a & b).ifHigh(lambda: results.append("ab"))
+    a.rising().ifHigh(lambda: results.append("a"))
+
+    sim.setAButton(True)
+    sim.notifyNewData()
+    loop.poll()
+    assert results == ["a"]
+
+    sim.setBButton(True)
+    sim.notifyNewData()
+    loop.poll()
+    assert results == ["a", "ab"]
+
+    # events don't consume the press edges
+    assert controller.getAButtonPressed()
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from wpilib import Field2d
+from wpimath.geometry import Pose2d, Rotation2d
+from wpimath.trajectory import TrajectoryConfig, TrajectoryGenerator
+
+
+def test_field_object_set_poses_array():
+    field = Field2d()
+    obj = field.getObject("particles")
+
+    arr = np.array([[1.0, 2.0, 0.5], [3.0, 4.0, -1.0]])
+    obj.setPoses(arr)
+
+    poses = obj.getPoses()
+    assert len(poses) == 2
+    assert poses[1].X() == pytest.approx(3.0)
+    assert poses[1].Y() == pytest.approx(4.0)
+    assert poses[1].rotation().radians() == pytest.approx(-1.0)
+
+    np.testing.assert_allclose(obj.getPosesArray(), arr)
+
+
+def test_field_object_set_poses_array_empty():
+    obj = Field2d().getObject("empty")
+    obj.setPoses([Pose2d(1, 1, Rotation2d(0))])
+    obj.setPoses(np.empty((0, 3)))
+    assert obj.getPosesArray().shape == (0, 3)
+
+
+def test_field_object_set_poses_array_bad_shape():
+    obj = Field2d().getObject("bad")
+    with pytest.raises(ValueError):
+        obj.setPoses(np.zeros((4, 2)))
+
+
+def test_field_object_set_trajectory_limits():
+    traj = TrajectoryGenerator.generateTrajectory(
+        [Pose2d(0, 0, Rotation2d(0)), Pose2d(5, 2, Rotation2d(0))],
+        TrajectoryConfig(1, 1),
+    )
+    states = traj.states()
+    obj = Field2d().getObject("traj")
+
+    obj.setTrajectory(traj)
+    assert len(obj.getPoses()) == len(states)
+
+    obj.setTrajectory(traj, maxPoints=10)
+    poses = obj.getPosesArray()
+    assert len(poses) == 10
+    assert poses[-1][0] == pytest.approx(states[-1].pose.X())
+
+    obj.setTrajectory(traj, decimation=4)
+    assert len(obj.getPoses()) == (len(states) - 1) // 4 + 1 + (
+        (len(states) - 1) % 4 != 0
+    )
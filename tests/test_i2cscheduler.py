@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+import wpilib
+from wpilib.simulation import I2CBusSim
+
+
+@pytest.fixture
+def bus():
+    return I2CBusSim(wpilib.I2C.Port.kOnboard)
+
+
+def test_i2c_read_into(bus):
+    i2c = wpilib.I2C(wpilib.I2C.Port.kOnboard, 0x1D)
+    bus.setReadData([1, 2, 3, 4])
+
+    buf = bytearray(6)
+    assert i2c.readInto(0x32, buf) is False
+    assert buf == b"\x01\x02\x03\x04\x00\x00"
+    assert bus.getLastWrite() == [0x32]
+
+    view = memoryview(buf)[:2]
+    assert i2c.readOnlyInto(view) is False
+    assert buf[:2] == b"\x01\x02"
+
+    with pytest.raises(Exception):
+        i2c.readInto(0x32, b"\x00\x00")
+
+
+def test_i2c_scheduler(bus, wait_for):
+    accel = wpilib.I2C(wpilib.I2C.Port.kOnboard, 0x1D)
+    gyro = wpilib.I2C(wpilib.I2C.Port.kOnboard, 0x68)
+    bus.setReadData([10, 20, 30, 40, 50, 60])
+
+    scheduler = wpilib.I2CScheduler(0.002)
+    assert scheduler.addRead(accel, 0x32, 6) == 0
+    assert scheduler.addTransaction(gyro, [0x1B], 2) == 1
+    assert scheduler.getTransactionCount() == 2
+    assert scheduler.getReceiveSize(1) == 2
+    assert scheduler.getTotalReceiveSize() == 8
+
+    data = bytearray(6)
+    assert scheduler.readInto(0, data) == 0
+
+    with scheduler:
+        assert scheduler.isRunning()
+        wait_for(lambda: scheduler.getCycleCount() >= 2)
+
+        with pytest.raises(RuntimeError):
+            scheduler.addRead(accel, 0, 1)
+
+    assert not scheduler.isRunning()
+    count = scheduler.getCycleCount()
+
+    assert scheduler.readInto(0, data) != 0
+    assert data == bytes([10, 20, 30, 40, 50, 60])
+    assert scheduler.getData(1) == bytes([10, 20])
+    assert not scheduler.getAborted(0)
+
+    allData = np.zeros(8, dtype=np.uint8)
+    timestamps = np.zeros(2, dtype=np.uint64)
+    aborted = np.ones(2, dtype=bool)
+    assert scheduler.readAllInto(allData, timestamps, aborted) == count
+    assert allData.tolist() == [10, 20, 30, 40, 50, 60, 10, 20]
+    assert timestamps[0] != 0 and timestamps[1] >= timestamps[0]
+    assert not aborted.any()
+
+    with pytest.raises(TypeError):
+        scheduler.readAllInto(allData, timestamps.astype(np.int32), aborted)
+
+
+def test_i2c_scheduler_bad_index():
+    scheduler = wpilib.I2CScheduler()
+    with pytest.raises(RuntimeError):
+        scheduler.getReceiveSize(0)
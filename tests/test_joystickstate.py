@@ -0,0 +1,87 @@
+import pytest
+
+import wpilib
+from wpilib.simulation import DriverStationSim, XboxControllerSim
+
+
+@pytest.fixture
+def xbox():
+    controller = wpilib.XboxController(1)
+    sim = XboxControllerSim(controller)
+    sim.setAxisCount(6)
+    sim.setButtonCount(10)
+    sim.setPOVCount(1)
+    yield controller, sim
+    DriverStationSim.resetData()
+
+
+def test_joystick_snapshot(xbox):
+    controller, sim = xbox
+    sim.setLeftX(0.5)
+    sim.setAButton(True)
+    sim.setPOV(90)
+    sim.notifyNewData()
+
+    state0, state1 = wpilib.DriverStation.getJoystickSnapshot([0, 1])
+    assert not state0.isConnected()
+    assert state1.getPort() == 1
+    assert state1.getAxis(wpilib.XboxController.Axis.kLeftX) == pytest.approx(0.5)
+    assert state1.getAxes()[wpilib.XboxController.Axis.kLeftX] == pytest.approx(0.5)
+    assert state1.getButton(wpilib.XboxController.Button.kA)
+    assert state1.getButtonPressed(wpilib.XboxController.Button.kA)
+    assert state1.getButtons() == 1 << (wpilib.XboxController.Button.kA - 1)
+    assert state1.getPOV() == 90
+
+    # edges are relative to the previous read
+    (state1,) = wpilib.DriverStation.getJoystickSnapshot([1])
+    assert state1.getButton(wpilib.XboxController.Button.kA)
+    assert state1.getPressed() == 0
+
+    sim.setAButton(False)
+    sim.notifyNewData()
+    (state1,) = wpilib.DriverStation.getJoystickSnapshot([1])
+    assert state1.getReleased() == 1 << (wpilib.XboxController.Button.kA - 1)
+
+    # and are independent of the DriverStation edges
+    assert wpilib.DriverStation.getStickButtonPressed(
+        1, wpilib.XboxController.Button.kA
+    )
+
+
+def test_joystick_bad_port():
+    with pytest.raises(RuntimeError):
+        wpilib.DriverStation.getJoystickSnapshot([wpilib.DriverStation.kJoystickPorts])
+
+
+def test_controller_state(xbox):
+    controller, sim = xbox
+    sim.setRightY(-0.25)
+    sim.setBButton(True)
+    sim.notifyNewData()
+
+    state = controller.getState()
+    assert isinstance(state, wpilib.XboxControllerState)
+    assert state.getRightY() == pytest.approx(-0.25)
+    assert state.getBButton()
+    assert state.getBButtonPressed()
+    assert not state.getAButton()
+
+    # the same state is returned until the driver station data is refreshed
+    assert controller.getState().getBButtonPressed()
+
+    sim.setBButton(False)
+    sim.notifyNewData()
+    state = controller.getState()
+    assert not state.getBButton()
+    assert state.getBButtonReleased()
+
+
+def test_generic_hid_state(xbox):
+    _, sim = xbox
+    sim.setRawAxis(2, 0.75)
+    sim.notifyNewData()
+
+    hid = wpilib.interfaces.GenericHID(1)
+    state = hid.getState()
+    assert isinstance(state, wpilib.JoystickState)
+    assert state.getAxis(2) == pytest.approx(0.75)
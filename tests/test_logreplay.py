@@ -0,0 +1,67 @@
+import pathlib
+import struct
+
+import pytest
+
+from wpiutil.log import DataLog
+
+import wpilib
+from wpilib.simulation import (
+    DriverStationSim,
+    EncoderSim,
+    LogReplay,
+    resumeTiming,
+)
+
+
+@pytest.fixture
+def logfile(tmp_path: pathlib.Path) -> pathlib.Path:
+    log = DataLog(str(tmp_path), "replay.wpilog")
+
+    enabled = wpilib.DataLogBooleanEntry(log, "DS:enabled")
+    enabled.append(False, 1_000_000)
+    enabled.append(True, 1_100_000)
+
+    axes = wpilib.DataLogRawEntry(log, "DS:joystick0/axes", "", "float[]")
+    axes.append(struct.pack("<2f", 0.5, -0.25), 1_100_000)
+
+    distance = wpilib.DataLogDoubleEntry(log, "/sensors/distance")
+    for i in range(10):
+        distance.append(i * 0.1, 1_000_000 + i * 20_000)
+
+    del enabled, axes, distance, log
+    return tmp_path / "replay.wpilog"
+
+
+@pytest.fixture
+def replay(logfile: pathlib.Path):
+    with LogReplay(str(logfile)) as replay:
+        yield replay
+    resumeTiming()
+
+
+def test_logreplay_driverstation(replay: LogReplay):
+    replay.step(0.02)
+    assert not DriverStationSim.getEnabled()
+
+    for _ in range(5):
+        replay.step(0.02)
+
+    assert DriverStationSim.getEnabled()
+    assert wpilib.DriverStation.getStickAxis(0, 0) == pytest.approx(0.5)
+    assert wpilib.DriverStation.getStickAxis(0, 1) == pytest.approx(-0.25)
+
+
+def test_logreplay_mapped(replay: LogReplay):
+    encoder = wpilib.Encoder(0, 1)
+    # the simulated count is an integer, so the distances need finer pulses
+    encoder.setDistancePerPulse(0.001)
+    sim = EncoderSim(encoder)
+    replay.map("/sensors/distance", sim.setDistance)
+
+    replay.step(0.02)
+    assert encoder.getDistance() == pytest.approx(0.1)
+
+    replay.run()
+    assert replay.isFinished()
+    assert encoder.getDistance() == pytest.approx(0.9)
@@ -1,4 +1,4 @@
-from wpilib import Mechanism2d
+from wpilib import Color8Bit, Mechanism2d
 
 
 def test_create_mechanism():
@@ -9,3 +9,110 @@ def test_create_mechanism():
     assert l2 is not None
 
     # TODO... check that they do something?
+
+
+def test_mechanism_batch():
+    m = Mechanism2d(100, 100)
+    root = m.getRoot("r1", 10, 10)
+    l1 = root.appendLigament("l1", 4, 3)
+    l2 = l1.appendLigament("l2", 4, 3)
+
+    with m.batch() as batch:
+        l1.setAngle(30)
+        l2.setLength(8)
+        l2.setColor(Color8Bit(255, 0, 0))
+        assert batch.getPendingCount() == 2
+        # getters reflect the pending value
+        assert l1.getAngle() == 30
+
+    assert batch.getPendingCount() == 0
+    assert l1.getAngle() == 30
+    assert l2.getLength() == 8
+    assert l2.getColor().red == 255
+
+    # unchanged values are not published again
+    with m.batch() as batch:
+        l1.setAngle(30)
+        l2.setLength(9)
+
+    assert batch.getSkippedCount() == 1
+    assert l2.getLength() == 9
+
+
+def test_mechanism_batch_discard():
+    m = Mechanism2d(100, 100)
+    l1 = m.getRoot("r1", 10, 10).appendLigament("l1", 4, 3)
+
+    with m.batch() as batch:
+        l1.setAngle(90)
+        batch.discard()
+
+    assert l1.getAngle() == 3
+
+
+def test_mechanism_batch_other_mechanism():
+    m1 = Mechanism2d(100, 100)
+    l1 = m1.getRoot("r1", 10, 10).appendLigament("l1", 4, 3)
+    m2 = Mechanism2d(100, 100)
+    l2 = m2.getRoot("r2", 10, 10).appendLigament("l2", 4, 3)
+    l3 = l2.appendLigament("l3", 4, 3)
+
+    with m1.batch() as batch:
+        l1.setAngle(30)
+        # ligaments of other mechanisms are published immediately
+        l2.setAngle(40)
+        l3.setLength(6)
+        assert batch.getPendingCount() == 1
+
+        with m2.batch() as batch2:
+            l1.setAngle(35)
+            l3.setLength(7)
+            assert batch.getPendingCount() == 1
+            assert batch2.getPendingCount() == 1
+
+        assert l3.getLength() == 7
+
+    assert l1.getAngle() == 35
+    assert l2.getAngle() == 40
+
+
+def test_mechanism_batch_exception():
+    m = Mechanism2d(100, 100)
+    l1 = m.getRoot("r1", 10, 10).appendLigament("l1", 4, 3)
+
+    try:
+        with m.batch() as batch:
+            l1.setAngle(90)
+            raise ValueError("oops")
+    except ValueError:
+        pass
+
+    assert batch.getPendingCount() == 0
+    assert l1.getAngle() == 3
+
+    # the batch can still be used afterwards
+    with batch:
+        l1.setAngle(45)
+    assert l1.getAngle() == 45
+
+
+def test_mechanism_batch_nested_exception():
+    m = Mechanism2d(100, 100)
+    l1 = m.getRoot("r1", 10, 10).appendLigament("l1", 4, 3)
+
+    with m.batch() as batch:
+        l1.setAngle(30)
+        try:
+            with batch:
+                l1.setAngle(60)
+                l1.setLength(8)
+                raise ValueError("oops")
+        except ValueError:
+            pass
+
+        # only the changes of the inner block are discarded
+        assert l1.getAngle() == 30
+        assert l1.getLength() == 4
+
+    assert l1.getAngle() == 30
+    assert l1.getLength() == 4
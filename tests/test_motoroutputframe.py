@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+import wpilib
+from wpilib.simulation import PWMSim, RoboRioSim
+
+
+@pytest.fixture
+def motors():
+    motors = [wpilib.PWMSparkMax(i) for i in range(4)]
+    yield motors
+    motors.clear()
+    RoboRioSim.resetData()
+
+
+def test_motor_output_frame_set(motors):
+    frame = wpilib.MotorOutputFrame(*motors)
+    assert len(frame) == 4
+
+    motors[1].setInverted(True)
+    frame.set(np.array([0.25, 0.5, -0.75, 1.0]))
+
+    assert PWMSim(0).getSpeed() == pytest.approx(0.25, abs=0.01)
+    assert PWMSim(1).getSpeed() == pytest.approx(-0.5, abs=0.01)
+    assert PWMSim(2).getSpeed() == pytest.approx(-0.75, abs=0.01)
+    assert frame.get() == pytest.approx([0.25, 0.5, -0.75, 1.0], abs=0.01)
+    assert all(motor.isAlive() for motor in motors)
+
+
+def test_motor_output_frame_set_voltage(motors):
+    RoboRioSim.setVInVoltage(12)
+    frame = wpilib.MotorOutputFrame(*motors)
+    frame.setVoltage([6, -3, 0, 12])
+    assert frame.get() == pytest.approx([0.5, -0.25, 0, 1.0], abs=0.01)
+
+
+def test_motor_output_frame_bad_size(motors):
+    frame = wpilib.MotorOutputFrame(*motors)
+    with pytest.raises(RuntimeError):
+        frame.set([0.0, 0.0])
+
+
+def test_motor_output_frame_bad_arg():
+    with pytest.raises(TypeError):
+        wpilib.MotorOutputFrame(1)
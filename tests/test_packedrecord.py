@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from wpilib import PackedRecord, PackedRecordPublisher, SmartDashboard
+from wpilib.packedrecord import Float32, UInt8
+
+
+class ArmState(PackedRecord):
+    position: float
+    velocity: float = 2.0
+    current: Float32
+    mode: UInt8 = 3
+    enabled: bool
+
+
+def test_packed_record_roundtrip():
+    state = ArmState(position=1.5, enabled=True)
+    assert state.velocity == 2.0
+    assert state.current == 0.0
+
+    data = state.pack()
+    assert len(data) == ArmState.getSize() == 8 + 8 + 4 + 1 + 1
+    assert ArmState.unpack(data) == state
+
+
+def test_packed_record_schema():
+    schema = json.loads(ArmState.getSchema())
+    assert schema["name"] == "ArmState"
+    assert schema["format"] == "<ddfB?"
+    assert [f["type"] for f in schema["fields"]] == [
+        "float64",
+        "float64",
+        "float32",
+        "uint8",
+        "bool",
+    ]
+
+
+def test_packed_record_bad_field():
+    with pytest.raises(TypeError):
+
+        class Bad(PackedRecord):
+            name: str
+
+    with pytest.raises(TypeError):
+        ArmState(nope=1)
+
+
+def test_packed_record_publisher():
+    publisher = PackedRecordPublisher(ArmState, "packed/arm")
+    assert SmartDashboard.getString("packed/arm.schema", "") == ArmState.getSchema()
+
+    state = ArmState(position=3.0)
+    publisher.publish(state)
+    assert SmartDashboard.getRaw("packed/arm", b"") == state.pack()
@@ -0,0 +1,62 @@
+import pytest
+
+import wpilib
+from wpilib.simulation import PowerDistributionSim
+
+
+@pytest.fixture
+def pdh():
+    pdh = wpilib.PowerDistribution(1, wpilib.PowerDistribution.ModuleType.kRev)
+    sim = PowerDistributionSim(pdh)
+    for channel in range(24):
+        sim.setCurrent(channel, channel * 0.5)
+    sim.setVoltage(12.25)
+    sim.setTemperature(31.0)
+    yield pdh, sim
+    sim.resetData()
+
+
+def test_get_all_currents(pdh):
+    pdh, sim = pdh
+    currents = pdh.getAllCurrents()
+    assert currents.tolist() == pytest.approx([ch * 0.5 for ch in range(24)])
+
+
+def test_sampler_caches_readings(pdh):
+    pdh, sim = pdh
+    sampler = wpilib.PowerDistributionSampler(pdh)
+    assert sampler.getSampleCount() == 0
+    assert sampler.getTimestamp() == 0
+    assert len(sampler.getAllCurrents()) == 24
+
+    sampler.sampleNow()
+    assert sampler.getSampleCount() == 1
+    assert sampler.getTimestamp() > 0
+    assert sampler.getVoltage() == pytest.approx(12.25)
+    assert sampler.getTemperature() == pytest.approx(31.0)
+    assert sampler.getCurrent(3) == pytest.approx(1.5)
+    assert sampler.getAllCurrents()[23] == pytest.approx(11.5)
+
+    # cached until the next reading
+    sim.setCurrent(3, 7.0)
+    assert sampler.getCurrent(3) == pytest.approx(1.5)
+
+    with pytest.raises(RuntimeError):
+        sampler.getCurrent(24)
+
+
+def test_sampler_background(pdh, wait_for):
+    pdh, sim = pdh
+    sampler = wpilib.PowerDistributionSampler(pdh, 0.005)
+    sim.setCurrent(0, 4.0)
+    with sampler:
+        assert sampler.isRunning()
+        wait_for(lambda: sampler.getSampleCount() >= 3)
+    assert not sampler.isRunning()
+    assert sampler.getCurrent(0) == pytest.approx(4.0)
+
+
+def test_num_channels():
+    ModuleType = wpilib.PowerDistribution.ModuleType
+    assert wpilib.PowerDistributionSampler.getNumChannels(ModuleType.kCTRE) == 16
+    assert wpilib.PowerDistributionSampler.getNumChannels(ModuleType.kRev) == 24
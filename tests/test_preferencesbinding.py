@@ -0,0 +1,122 @@
+import dataclasses
+import threading
+
+import ntcore
+import pytest
+
+from wpilib import Preferences, PreferencesBinding
+
+
+@dataclasses.dataclass
+class Tuning:
+    kP: float = 0.25
+    count: int = 3
+    enabled: bool = True
+    name: str = "arm"
+
+
+def test_preferences_binding_dataclass():
+    binding = PreferencesBinding(Tuning, prefix="test1/")
+    try:
+        assert isinstance(binding.values, Tuning)
+        assert binding.values.kP == 0.25
+        assert binding.values.count == 3
+        assert binding.values.enabled is True
+        assert binding.values.name == "arm"
+        assert Preferences.containsKey("test1/kP")
+    finally:
+        binding.close()
+
+
+def test_preferences_binding_existing_value():
+    Preferences.setDouble("test2/kP", 4.5)
+    binding = PreferencesBinding({"kP": 1.0}, prefix="test2/")
+    try:
+        assert binding.values.kP == 4.5
+    finally:
+        binding.close()
+
+
+def test_preferences_binding_coalesced_writes():
+    binding = PreferencesBinding({"kP": 1.0}, prefix="test3/")
+    try:
+        binding.set("kP", 2.0)
+        binding.set("kP", 3.0)
+        assert binding.values.kP == 3.0
+        assert Preferences.getDouble("test3/kP") == 1.0
+
+        binding.flush()
+        assert Preferences.getDouble("test3/kP") == 3.0
+    finally:
+        binding.close()
+
+
+def test_preferences_binding_listener():
+    changed = threading.Event()
+    changes = []
+
+    def onChange(name, value):
+        changes.append((name, value))
+        changed.set()
+
+    binding = PreferencesBinding(Tuning, prefix="test4/", onChange=onChange)
+    try:
+        inst = ntcore.NetworkTableInstance.getDefault()
+        entry = inst.getEntry("/Preferences/test4/kP")
+        entry.setDouble(0.75)
+
+        assert changed.wait(2.0), "onChange was not called"
+        assert changes == [("kP", 0.75)]
+        assert binding.values.kP == 0.75
+
+        # values of keys that aren't bound are ignored
+        changed.clear()
+        inst.getEntry("/Preferences/test4/other").setDouble(1.0)
+        inst.getEntry("/Preferences/test4/count").setInteger(5)
+        assert changed.wait(2.0), "onChange was not called"
+        assert changes[1:] == [("count", 5)]
+        assert binding.values.count == 5
+    finally:
+        binding.close()
+
+
+def test_preferences_binding_flush_echo():
+    changes = []
+    binding = PreferencesBinding(
+        {"kP": 1.0}, prefix="test5/", onChange=lambda *a: changes.append(a)
+    )
+    try:
+        # the listener sees both flushed values after the second one is set
+        binding.set("kP", 2.0)
+        binding.flush()
+        binding.set("kP", 3.0)
+        binding.flush()
+        assert ntcore.NetworkTableInstance.getDefault().waitForListenerQueue(2.0)
+
+        assert binding.values.kP == 3.0
+        assert changes == []
+    finally:
+        binding.close()
+
+
+def test_preferences_binding_wrong_type():
+    binding = PreferencesBinding(Tuning, prefix="test6/")
+    try:
+        with pytest.raises(TypeError):
+            binding.set("enabled", "false")
+        with pytest.raises(TypeError):
+            binding.set("count", 2.5)
+        with pytest.raises(TypeError):
+            binding.set("count", True)
+
+        # ints are valid floats
+        binding.set("kP", 2)
+        assert binding.values.kP == 2.0
+        assert isinstance(binding.values.kP, float)
+    finally:
+        binding.close()
+
+
+def test_preferences_binding_bad_schema():
+    with pytest.raises(TypeError):
+        PreferencesBinding({"kP": None})
@@ -0,0 +1,53 @@
+import hal
+import pytest
+
+import wpilib
+from wpilib.simulation import DriverStationSim, RoboRioSim
+
+
+@pytest.fixture
+def sim():
+    yield
+    DriverStationSim.resetData()
+    RoboRioSim.resetData()
+
+
+def test_robot_state_snapshot(sim):
+    DriverStationSim.setEnabled(True)
+    DriverStationSim.setAutonomous(True)
+    DriverStationSim.setDsAttached(True)
+    DriverStationSim.setAllianceStationId(hal.AllianceStationID.kBlue2)
+    DriverStationSim.notifyNewData()
+    RoboRioSim.setVInVoltage(11.5)
+
+    state = wpilib.RobotStateSnapshot.read()
+    assert state.enabled
+    assert state.autonomous
+    assert not state.teleop
+    assert not state.test
+    assert state.alliance == wpilib.DriverStation.Alliance.kBlue
+    assert state.location == 2
+    assert state.inputVoltage == pytest.approx(11.5)
+    assert not state.brownedOut
+    assert state.timestamp > 0
+
+
+def test_robot_state_snapshot_current(sim):
+    DriverStationSim.setEnabled(False)
+    DriverStationSim.notifyNewData()
+    state = wpilib.RobotStateSnapshot.getCurrent()
+    assert not state.enabled
+
+    # not refreshed until the next driver station update
+    DriverStationSim.setEnabled(True)
+    DriverStationSim.setDsAttached(True)
+    assert not wpilib.RobotStateSnapshot.getCurrent().enabled
+
+    DriverStationSim.notifyNewData()
+    assert wpilib.RobotStateSnapshot.getCurrent().enabled
+
+
+def test_robot_state_snapshot_readonly(sim):
+    state = wpilib.RobotStateSnapshot.read()
+    with pytest.raises(AttributeError):
+        state.enabled = True
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+import wpilib
+from wpilib.simulation import (
+    AnalogGyroSim,
+    AnalogInputSim,
+    DIOSim,
+    DutyCycleEncoderSim,
+    EncoderSim,
+)
+
+
+@pytest.fixture
+def sensors():
+    encoder = wpilib.Encoder(0, 1)
+    encoder.setDistancePerPulse(0.5)
+    analog = wpilib.AnalogInput(0)
+    digital = wpilib.DigitalInput(2)
+    gyro = wpilib.AnalogGyro(1)
+    dutyCycle = wpilib.DutyCycleEncoder(3)
+    dutyCycle.setDistancePerRotation(2.0)
+
+    EncoderSim(encoder).setDistance(12.5)
+    EncoderSim(encoder).setRate(3.0)
+    AnalogInputSim(analog).setVoltage(1.25)
+    DIOSim(digital).setValue(False)
+    AnalogGyroSim(gyro).setAngle(90.0)
+    AnalogGyroSim(gyro).setRate(-4.0)
+    DutyCycleEncoderSim(dutyCycle).setDistance(1.5)
+
+    return encoder, analog, digital, gyro, dutyCycle
+
+
+def test_sensor_group(sensors):
+    encoder, analog, digital, gyro, dutyCycle = sensors
+
+    group = wpilib.SensorGroup()
+    assert group.addEncoder("left", encoder) == 0
+    assert group.addAnalogInput("pressure", analog) == 2
+    assert group.addDigitalInput("beam", digital) == 3
+    assert group.addGyro("gyro", gyro) == 4
+    assert group.addDutyCycleEncoder("steer", dutyCycle) == 6
+
+    assert len(group) == 8
+    assert group.getNames() == [
+        "left.distance",
+        "left.rate",
+        "pressure.voltage",
+        "beam",
+        "gyro.angle",
+        "gyro.rate",
+        "steer.distance",
+        "steer.absolute",
+    ]
+    assert group.getIndex("gyro.rate") == 5
+    assert group.getIndex("missing") == -1
+
+    before = wpilib.RobotController.getFPGATime() / 1e6
+    timestamp = group.sample()
+    assert timestamp >= before
+    assert group.getTimestamp() == timestamp
+
+    values = group.getValues()
+    assert values.dtype == np.float64
+    assert not values.flags.writeable
+    assert values[:6].tolist() == pytest.approx([12.5, 3.0, 1.25, 0.0, 90.0, -4.0])
+    assert group["steer.distance"] == pytest.approx(1.5)
+    assert group.asDict()["left.rate"] == pytest.approx(3.0)
+
+    with pytest.raises(KeyError):
+        group["missing"]
+
+    # the view is updated in place
+    EncoderSim(encoder).setRate(6.0)
+    group.sample()
+    assert values[1] == pytest.approx(6.0)
+
+    # no more sensors once sampled
+    with pytest.raises(RuntimeError):
+        group.addAnalogInput("late", analog)
+
+
+def test_sensor_group_sample_into(sensors):
+    encoder, analog, *_ = sensors
+
+    group = wpilib.SensorGroup()
+    group.addEncoder("left", encoder)
+    group.addAnalogInput("pressure", analog, averaged=False)
+
+    out = np.zeros(3)
+    group.sampleInto(out)
+    assert out.tolist() == pytest.approx([12.5, 3.0, 1.25])
+
+    with pytest.raises(RuntimeError):
+        group.sampleInto(np.zeros(2))
+    with pytest.raises(TypeError):
+        group.sampleInto(np.zeros(3, dtype=np.float32))
+
+    # sampling into a separate array doesn't prevent adding sensors
+    assert group.addAnalogInput("pressure2", analog) == 3
+
+    # column names must be unique
+    with pytest.raises(RuntimeError):
+        group.addEncoder("left", encoder)
@@ -0,0 +1,115 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+import wpilib
+import wpilib.interfaces
+from wpilib.simulation import EncoderSim, pauseTiming, resumeTiming, stepTiming
+
+
+@pytest.fixture
+def paused():
+    pauseTiming()
+    yield
+    resumeTiming()
+
+
+@pytest.fixture
+def encoder():
+    encoder = wpilib.Encoder(0, 1)
+    encoder.setDistancePerPulse(0.01)
+    return encoder
+
+
+def test_sensor_history_lookup(paused, encoder):
+    sim = EncoderSim(encoder)
+    group = wpilib.SensorGroup()
+    group.addEncoder("drive", encoder)
+
+    history = wpilib.SensorHistory(group, capacity=3)
+    assert history.getAt(0) is None
+    assert np.isnan(history.getAtMany([0.0, 1.0])).all()
+
+    times = []
+    for distance in (1.0, 2.0, 4.0, 8.0):
+        sim.setDistance(distance)
+        times.append(wpilib.Timer.getFPGATimestamp())
+        history.sampleNow()
+        stepTiming(0.1)
+
+    # the oldest sample was discarded
+    assert history.getSampleCount() == 3
+    assert history.getOldestTimestamp() == pytest.approx(times[1])
+    assert history.getNewestTimestamp() == pytest.approx(times[3])
+
+    assert history.getAt(times[2])[0] == pytest.approx(4.0)
+    assert history.getValueAt(times[1] + 0.05, "drive.distance") == pytest.approx(3.0)
+
+    # clamped outside of the samples
+    assert history.getValueAt(times[0], "drive.distance") == pytest.approx(2.0)
+    assert history.getValueAt(times[3] + 1, "drive.distance") == pytest.approx(8.0)
+
+    values = history.getAtMany([times[1], times[2] + 0.025, times[3]])
+    assert values.shape == (3, 2)
+    assert values[:, 0].tolist() == pytest.approx([2.0, 5.0, 8.0])
+
+    with pytest.raises(KeyError):
+        history.getValueAt(times[1], "missing")
+
+    # the group can't change under the history
+    with pytest.raises(RuntimeError):
+        group.addEncoder("other", encoder)
+
+    history.clear()
+    assert history.getSampleCount() == 0
+
+
+def test_sensor_history_background(encoder):
+    group = wpilib.SensorGroup()
+    group.addEncoder("drive", encoder)
+
+    history = wpilib.SensorHistory(group, capacity=16, period=0.005)
+    with history:
+        assert history.isRunning()
+        end = time.monotonic() + 2
+        while history.getSampleCount() < 4:
+            assert time.monotonic() < end, "timed out"
+            time.sleep(0.005)
+
+    assert not history.isRunning()
+    assert history.getNewestTimestamp() > history.getOldestTimestamp()
+
+
+class SlowGyro(wpilib.interfaces.Gyro):
+    def __init__(self):
+        super().__init__()
+        self.reads = threading.Event()
+
+    def calibrate(self):
+        pass
+
+    def reset(self):
+        pass
+
+    def getAngle(self):
+        self.reads.set()
+        return 0.0
+
+    def getRate(self):
+        return 0.0
+
+
+def test_sensor_history_python_sensor_destroyed_while_running():
+    gyro = SlowGyro()
+    group = wpilib.SensorGroup()
+    group.addGyro("gyro", gyro)
+
+    history = wpilib.SensorHistory(group, period=0.001)
+    history.start()
+    assert gyro.reads.wait(2)
+
+    # the sampler thread needs the GIL to read the gyro, so destroying the
+    # history must not hold the GIL while joining it
+    del history
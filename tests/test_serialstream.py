@@ -0,0 +1,187 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+import wpilib
+from wpilib.serialstream import (
+    SerialTransport,
+    createSerialConnection,
+    openSerialConnection,
+)
+
+
+class LoopbackPort:
+    """Stands in for a SerialPort whose TX is wired to its RX"""
+
+    def __init__(self):
+        self._cv = threading.Condition()
+        self._buffer = bytearray()
+        self._timeout = 5.0
+
+    def setTimeout(self, timeout):
+        self._timeout = timeout
+
+    def getBytesReceived(self):
+        with self._cv:
+            return len(self._buffer)
+
+    def readinto(self, buffer):
+        # like SerialPort, waits until the buffer is full or the timeout expires
+        with self._cv:
+            self._cv.wait_for(lambda: len(self._buffer) >= len(buffer), self._timeout)
+            n = min(len(buffer), len(self._buffer))
+            buffer[:n] = self._buffer[:n]
+            del self._buffer[:n]
+            return n
+
+    def write(self, data):
+        with self._cv:
+            self._buffer += data
+            self._cv.notify_all()
+        return len(data)
+
+
+def test_serial_port_readinto():
+    port = wpilib.SerialPort(9600, wpilib.SerialPort.Port.kOnboard)
+    port.setTimeout(0.01)
+
+    # the simulated HAL never receives anything
+    buf = bytearray(8)
+    assert port.readinto(buf) == 0
+    assert port.readinto(memoryview(buf)[2:4]) == 0
+
+    with pytest.raises(BufferError):
+        port.readinto(b"readonly")
+
+
+def test_open_serial_connection():
+    async def main():
+        reader, writer = await openSerialConnection(LoopbackPort())
+        writer.write(b"hello\nworld\n")
+        await writer.drain()
+        assert await reader.readline() == b"hello\n"
+        assert await reader.readexactly(6) == b"world\n"
+
+        writer.close()
+        await asyncio.wait_for(writer.wait_closed(), 2)
+
+    asyncio.run(main())
+
+
+def test_create_serial_connection():
+    class Protocol(asyncio.Protocol):
+        def __init__(self):
+            self.data = bytearray()
+            self.received = asyncio.Event()
+            self.lost = asyncio.Event()
+
+        def connection_made(self, transport):
+            self.transport = transport
+
+        def data_received(self, data):
+            self.data += data
+            self.received.set()
+
+        def connection_lost(self, exc):
+            assert exc is None
+            self.lost.set()
+
+    async def main():
+        port = LoopbackPort()
+        transport, protocol = await createSerialConnection(Protocol, port)
+        assert isinstance(transport, SerialTransport)
+        assert transport.get_extra_info("serial") is port
+
+        transport.write(b"abc")
+        await asyncio.wait_for(protocol.received.wait(), 2)
+        assert protocol.data == b"abc"
+
+        # nothing is delivered while reading is paused
+        transport.pause_reading()
+        await asyncio.sleep(0.1)
+        protocol.received.clear()
+        port.write(b"def")
+        await asyncio.sleep(0.1)
+        assert not protocol.received.is_set()
+
+        transport.resume_reading()
+        await asyncio.wait_for(protocol.received.wait(), 2)
+        assert protocol.data == b"abcdef"
+
+        transport.close()
+        assert transport.is_closing()
+        await asyncio.wait_for(protocol.lost.wait(), 2)
+
+    asyncio.run(main())
+
+
+class StalledPort(LoopbackPort):
+    """A LoopbackPort that accepts nothing until ``accepting`` is set"""
+
+    def __init__(self):
+        super().__init__()
+        self.accepting = threading.Event()
+
+    def write(self, data):
+        if not self.accepting.is_set():
+            return 0
+        return super().write(data)
+
+
+def test_serial_transport_write_backpressure():
+    class Protocol(asyncio.Protocol):
+        def __init__(self):
+            self.paused = asyncio.Event()
+            self.resumed = asyncio.Event()
+
+        def pause_writing(self):
+            self.paused.set()
+
+        def resume_writing(self):
+            self.resumed.set()
+
+    async def main():
+        port = StalledPort()
+        transport, protocol = await createSerialConnection(Protocol, port)
+        transport.set_write_buffer_limits(high=4, low=0)
+
+        # writing doesn't wait for the port
+        start = time.monotonic()
+        transport.write(b"abc")
+        assert time.monotonic() - start < 0.1
+        assert transport.get_write_buffer_size() == 3
+        assert not protocol.paused.is_set()
+
+        transport.write(b"def")
+        assert protocol.paused.is_set()
+
+        port.accepting.set()
+        await asyncio.wait_for(protocol.resumed.wait(), 2)
+        assert transport.get_write_buffer_size() == 0
+        assert port.getBytesReceived() == 6
+        transport.close()
+
+    asyncio.run(main())
+
+
+def test_serial_transport_write_stalled():
+    class Protocol(asyncio.Protocol):
+        def __init__(self):
+            self.lost = asyncio.get_running_loop().create_future()
+
+        def connection_lost(self, exc):
+            self.lost.set_result(exc)
+
+    async def main():
+        port = StalledPort()
+        transport, protocol = await createSerialConnection(
+            Protocol, port, writeTimeout=0.05
+        )
+        transport.write(b"abc")
+        exc = await asyncio.wait_for(protocol.lost, 2)
+        assert isinstance(exc, TimeoutError)
+        assert transport.is_closing()
+
+    asyncio.run(main())
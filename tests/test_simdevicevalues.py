@@ -0,0 +1,82 @@
+import hal
+import pytest
+
+from wpilib.simulation import SimDeviceSim
+
+
+@pytest.fixture
+def device():
+    device = hal.SimDevice("Test Motor[3]")
+    Direction = hal.SimDevice.Direction
+    values = (
+        device.createDouble("Position", Direction.kInput, 0.0),
+        device.createBoolean("Enabled", Direction.kOutput, False),
+        device.createInt("Count", Direction.kBidir, 2),
+        device.createLong("Ticks", Direction.kBidir, 1 << 40),
+        device.createEnum("Mode", Direction.kBidir, ["Coast", "Brake"], 0),
+    )
+    return device, values
+
+
+def test_get_values(device):
+    sim = SimDeviceSim("Test Motor[3]")
+
+    values = sim.getValues(["Position", "Enabled", "Count"])
+    assert values == {"Position": 0.0, "Enabled": False, "Count": 2}
+    assert isinstance(values["Position"], float)
+    assert isinstance(values["Enabled"], bool)
+
+    assert sim.getValues() == {
+        "Position": 0.0,
+        "Enabled": False,
+        "Count": 2,
+        "Ticks": 1 << 40,
+        "Mode": 0,
+    }
+
+    with pytest.raises(KeyError):
+        sim.getValues(["Position", "Missing"])
+
+
+def test_set_values(device):
+    device, (position, enabled, count, ticks, mode) = device
+    sim = SimDeviceSim("Test Motor[3]")
+
+    sim.setValues({"Position": 1.5, "Enabled": True, "Ticks": 5, "Mode": "Brake"})
+    assert position.get() == 1.5
+    assert enabled.get() is True
+    assert ticks.get() == 5
+    assert mode.get() == 1
+
+    sim.setValues({"Mode": 0, "Count": 7})
+    assert mode.get() == 0
+    assert count.get() == 7
+
+    # nothing is set if any value is invalid
+    with pytest.raises(KeyError):
+        sim.setValues({"Position": 3.0, "Missing": 1})
+    with pytest.raises(ValueError):
+        sim.setValues({"Position": 3.0, "Mode": "Reverse"})
+    assert position.get() == 1.5
+
+
+def test_cached_value_objects(device):
+    device, (position, *_) = device
+    sim = SimDeviceSim("Test Motor[3]")
+
+    # repeated lookups return working value objects
+    for i in range(3):
+        sim.getDouble("Position").set(i)
+        assert position.get() == i
+
+
+def test_cache_invalidated_when_freed():
+    first = hal.SimDevice("Test Cache")
+    first.createDouble("A", hal.SimDevice.Direction.kInput, 1.0)
+    assert SimDeviceSim("Test Cache").getValues(["A"]) == {"A": 1.0}
+    del first
+
+    second = hal.SimDevice("Test Cache")
+    second.createDouble("B", hal.SimDevice.Direction.kInput, 2.0)
+    second.createDouble("A", hal.SimDevice.Direction.kInput, 3.0)
+    assert SimDeviceSim("Test Cache").getValues(["A", "B"]) == {"A": 3.0, "B": 2.0}
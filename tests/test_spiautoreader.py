@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+import wpilib
+from wpilib.simulation import SPIAutoReceiveSim
+
+
+@pytest.fixture
+def spi():
+    spi = wpilib.SPI(wpilib.SPI.Port.kOnboardCS1)
+    spi.initAuto(1024)
+    spi.setAutoTransmitData([0x80], 2)
+    spi.startAutoRate(0.0005)
+    sim = SPIAutoReceiveSim(spi)
+    yield spi, sim
+    spi.stopAuto()
+    spi.freeAuto()
+
+
+def test_spi_auto_reader(spi, wait_for):
+    spi, sim = spi
+    now = wpilib.RobotController.getFPGATime()
+    sim.addTransfer(now - 1000, [1, 2, 3])
+    sim.addTransfer(now - 500, [4, 5, 6])
+
+    reader = wpilib.SPIAutoReader(spi, 3, capacity=16, pollPeriod=0.001)
+    with reader:
+        wait_for(lambda: reader.getAvailable() == 2)
+        frames = reader.readAvailable()
+
+        assert frames["timestamp"].tolist() == [now - 1000, now - 500]
+        assert frames["data"].tolist() == [[1, 2, 3], [4, 5, 6]]
+        assert sim.getPendingWords() == 0
+
+        # nothing left, and reading doesn't block
+        assert len(reader.readAvailable()) == 0
+
+        sim.addTransfer(now, [7, 8, 9])
+        wait_for(lambda: reader.getAvailable() == 1)
+        assert [bytes(frame["data"]) for frame in reader] == [b"\x07\x08\x09"]
+
+
+def test_spi_auto_reader_overflow(spi, wait_for):
+    spi, sim = spi
+    now = wpilib.RobotController.getFPGATime()
+    for i in range(6):
+        sim.addTransfer(now, [i])
+
+    reader = wpilib.SPIAutoReader(spi, 1, capacity=4, pollPeriod=0.001)
+    reader.start()
+    try:
+        wait_for(lambda: sim.getPendingWords() == 0)
+    finally:
+        reader.stop()
+
+    assert reader.getOverflowCount() == 2
+    frames = reader.readAvailable(maxFrames=3)
+    assert frames["data"].ravel().tolist() == [2, 3, 4]
+    assert reader.readAvailable()["data"].ravel().tolist() == [5]
+
+
+def test_spi_auto_reader_bad_args(spi):
+    spi, _ = spi
+    with pytest.raises(RuntimeError):
+        wpilib.SPIAutoReader(spi, 0)
+    with pytest.raises(RuntimeError):
+        wpilib.SPIAutoReader(spi, 3, capacity=0)
@@ -0,0 +1,99 @@
+import ntcore
+import pytest
+import wpiutil
+
+from wpilib import SmartDashboard, TelemetryGovernor
+from wpilib.simulation import pauseTiming, resumeTiming, stepTiming
+
+
+@pytest.fixture
+def governor():
+    pauseTiming()
+    TelemetryGovernor.clear()
+    yield TelemetryGovernor
+    TelemetryGovernor.clear()
+    resumeTiming()
+
+
+def test_governor_ungoverned_key(governor):
+    governor.configure("/SmartDashboard/gov0/", absDeadband=1)
+    SmartDashboard.putNumber("other", 1.0)
+    SmartDashboard.putNumber("other", 1.5)
+    assert SmartDashboard.getNumber("other", 0) == 1.5
+    assert governor.getTotalSuppressed() == 0
+
+
+def test_governor_deadband(governor):
+    governor.configure("/SmartDashboard/gov1/", absDeadband=0.1)
+
+    SmartDashboard.putNumber("gov1/x", 1.0)
+    SmartDashboard.putNumber("gov1/x", 1.05)
+    assert SmartDashboard.getNumber("gov1/x", 0) == 1.0
+
+    SmartDashboard.putNumber("gov1/x", 1.5)
+    assert SmartDashboard.getNumber("gov1/x", 0) == 1.5
+
+    assert governor.getCounts("/SmartDashboard/gov1/x") == (2, 1)
+    assert governor.getTotalSuppressed() == 1
+
+
+def test_governor_rate_and_heartbeat(governor):
+    governor.configure("/SmartDashboard/gov2/x", maxRate=10, heartbeat=1.0)
+
+    SmartDashboard.putNumber("gov2/x", 1.0)
+    stepTiming(0.02)
+    SmartDashboard.putNumber("gov2/x", 2.0)
+    assert SmartDashboard.getNumber("gov2/x", 0) == 1.0
+
+    stepTiming(0.1)
+    SmartDashboard.putNumber("gov2/x", 2.0)
+    assert SmartDashboard.getNumber("gov2/x", 0) == 2.0
+
+    # unchanged value is suppressed until the heartbeat
+    stepTiming(0.5)
+    assert not governor.shouldPublish("/SmartDashboard/gov2/x", 2.0)
+    stepTiming(0.5)
+    assert governor.shouldPublish("/SmartDashboard/gov2/x", 2.0)
+
+
+def test_governor_longest_prefix(governor):
+    governor.configure("/SmartDashboard/", absDeadband=100)
+    governor.configure("/SmartDashboard/gov3/", absDeadband=0)
+
+    SmartDashboard.putNumber("gov3/x", 1.0)
+    SmartDashboard.putNumber("gov3/x", 2.0)
+    assert SmartDashboard.getNumber("gov3/x", 0) == 2.0
+
+    assert governor.remove("/SmartDashboard/gov3/")
+    SmartDashboard.putNumber("gov3/x", 3.0)
+    assert SmartDashboard.getNumber("gov3/x", 0) == 2.0
+
+
+def test_governor_integer_property(governor):
+    class Counter(wpiutil.Sendable):
+        def __init__(self):
+            super().__init__()
+            self.count = 2**53 + 1
+
+        def initSendable(self, builder):
+            builder.addIntegerProperty("count", lambda: self.count, lambda v: None)
+
+    governor.configure("/SmartDashboard/gov4/", absDeadband=0.5)
+    counter = Counter()
+    SmartDashboard.putData("gov4", counter)
+    entry = ntcore.NetworkTableInstance.getDefault().getEntry(
+        "/SmartDashboard/gov4/count"
+    )
+
+    # integers that a double can't hold are published exactly
+    SmartDashboard.updateValues()
+    assert entry.getInteger(0) == 2**53 + 1
+
+    counter.count += 2
+    SmartDashboard.updateValues()
+    assert entry.getInteger(0) == 2**53 + 3
+
+    # the same double as the last published value, so it is suppressed
+    counter.count += 1
+    SmartDashboard.updateValues()
+    assert entry.getInteger(0) == 2**53 + 3
@@ -1,5 +1,129 @@
+import itertools
+
+import numpy as np
+import pytest
+import wpimath
+from wpimath.geometry import Rotation2d
+
 import wpilib.drive
+from wpilib.drive import DifferentialDrive, MecanumDrive
 
 
 def test_wpilib_drive():
     pass
+
+
+# includes values that exercise saturation, signed zero and the deadband
+_values = np.array(
+    [-1.5, -1.0, -0.7, -0.3, -0.01, -0.0, 0.0, 0.015, 0.02, 0.25, 0.5, 0.99, 1.0, 1.2]
+)
+
+
+@pytest.fixture
+def grid():
+    a, b = np.meshgrid(_values, _values)
+    return a.ravel(), b.ravel()
+
+
+def _bits(a):
+    return np.asarray(a, dtype=np.float64).view(np.uint64)
+
+
+def _check(actual, expected):
+    for a, e in zip(actual, expected):
+        np.testing.assert_array_equal(_bits(a), _bits(e))
+
+
+def _db(v, deadband):
+    return v if deadband is None else wpimath.applyDeadband(v, deadband)
+
+
+@pytest.mark.parametrize(
+    "squareInputs, deadband", itertools.product([True, False], [None, 0.02])
+)
+def test_arcade_drive_ik_array(grid, squareInputs, deadband):
+    x, z = grid
+    speeds = [
+        DifferentialDrive.arcadeDriveIK(
+            _db(a, deadband), _db(b, deadband), squareInputs
+        )
+        for a, b in zip(x, z)
+    ]
+    actual = DifferentialDrive.arcadeDriveIKArray(x, z, squareInputs, deadband)
+    _check(actual, ([s.left for s in speeds], [s.right for s in speeds]))
+
+
+@pytest.mark.parametrize(
+    "allowTurnInPlace, deadband", itertools.product([True, False], [None, 0.02])
+)
+def test_curvature_drive_ik_array(grid, allowTurnInPlace, deadband):
+    x, z = grid
+    speeds = [
+        DifferentialDrive.curvatureDriveIK(
+            _db(a, deadband), _db(b, deadband), allowTurnInPlace
+        )
+        for a, b in zip(x, z)
+    ]
+    actual = DifferentialDrive.curvatureDriveIKArray(x, z, allowTurnInPlace, deadband)
+    _check(actual, ([s.left for s in speeds], [s.right for s in speeds]))
+
+
+@pytest.mark.parametrize(
+    "squareInputs, deadband", itertools.product([True, False], [None, 0.02])
+)
+def test_tank_drive_ik_array(grid, squareInputs, deadband):
+    l, r = grid
+    speeds = [
+        DifferentialDrive.tankDriveIK(_db(a, deadband), _db(b, deadband), squareInputs)
+        for a, b in zip(l, r)
+    ]
+    actual = DifferentialDrive.tankDriveIKArray(l, r, squareInputs, deadband)
+    _check(actual, ([s.left for s in speeds], [s.right for s in speeds]))
+
+
+@pytest.mark.parametrize("deadband", [None, 0.02])
+def test_drive_cartesian_ik_array(deadband):
+    x, y, z, g = (
+        a.ravel()
+        for a in np.meshgrid(_values[::2], _values[1::2], _values[::3], [0, 0.5, -2])
+    )
+    speeds = [
+        MecanumDrive.driveCartesianIK(
+            _db(a, deadband), _db(b, deadband), c, Rotation2d(d)
+        )
+        for a, b, c, d in zip(x, y, z, g)
+    ]
+    actual = MecanumDrive.driveCartesianIKArray(x, y, z, g, deadband)
+    _check(
+        actual,
+        (
+            [s.frontLeft for s in speeds],
+            [s.frontRight for s in speeds],
+            [s.rearLeft for s in speeds],
+            [s.rearRight for s in speeds],
+        ),
+    )
+
+
+def test_drive_ik_array_broadcast():
+    left, right = DifferentialDrive.arcadeDriveIKArray(
+        np.array([[0.1, 0.2, 0.3]]), np.array([[0.5], [-0.5]])
+    )
+    assert left.shape == right.shape == (2, 3)
+
+    expected = DifferentialDrive.arcadeDriveIK(0.3, -0.5)
+    assert left[1, 2] == expected.left
+    assert right[1, 2] == expected.right
+
+    # scalars give 0-d arrays
+    left, right = DifferentialDrive.tankDriveIKArray(0.5, 0.25)
+    assert left.shape == ()
+    assert left == DifferentialDrive.tankDriveIK(0.5, 0.25).left
+
+    fl, fr, rl, rr = MecanumDrive.driveCartesianIKArray([0.5, 0.1], 0.2, 0.0)
+    assert fl.shape == (2,)
+
+
+def test_drive_ik_array_bad_shape():
+    with pytest.raises(ValueError):
+        DifferentialDrive.arcadeDriveIKArray(np.zeros(3), np.zeros(4))
@@ -12,6 +12,7 @@ from ._wpilib import (
     ADXL362,
     ADXRS450_Gyro,
     AddressableLED,
+    AddressableLEDAnimator,
     AnalogAccelerometer,
     AnalogEncoder,
     AnalogGyro,
@@ -21,6 +22,7 @@ from ._wpilib import (
     AnalogTrigger,
     AnalogTriggerOutput,
     AnalogTriggerType,
+    AsynchronousInterrupt,
     BuiltInAccelerometer,
     CAN,
     CANData,
@@ -30,9 +32,19 @@ from ._wpilib import (
     Compressor,
     CompressorConfigType,
     Counter,
+    DataLogBooleanEntry,
+    DataLogDoubleArrayEntry,
+    DataLogDoubleEntry,
+    DataLogIntegerEntry,
+    DataLogRawEntry,
     DataLogManager,
+    DMA,
+    DMAReader,
+    DMASample,
     DMC60,
     DSControlWord,
+    DSDataEvent,
+    DSDrivenRobot,
     DigitalGlitchFilter,
     DigitalInput,
     DigitalOutput,
@@ -45,19 +57,25 @@ from ._wpilib import (
     Field2d,
     FieldObject2d,
     I2C,
+    I2CScheduler,
+    InterruptDispatcher,
     IterativeRobotBase,
     Jaguar,
     Joystick,
+    JoystickState,
     LiveWindow,
     Mechanism2d,
+    MechanismBatch,
     MechanismLigament2d,
     MechanismObject2d,
     MechanismRoot2d,
     MotorControllerGroup,
+    MotorOutputFrame,
     MotorSafety,
     NidecBrushless,
     Notifier,
     PS4Controller,
+    PS4ControllerState,
     PWM,
     PWMMotorController,
     PWMSparkMax,
@@ -70,17 +88,22 @@ from ._wpilib import (
     PneumaticsControlModule,
     PneumaticsModuleType,
     PowerDistribution,
+    PowerDistributionSampler,
     Preferences,
     Relay,
     RobotBase,
     RobotController,
     RobotState,
+    RobotStateSnapshot,
     RuntimeType,
     SD540,
     SPI,
+    SPIAutoReader,
     SendableBuilderImpl,
     SendableChooser,
     SendableChooserBase,
+    SensorGroup,
+    SensorHistory,
     SensorUtil,
     SerialPort,
     Servo,
@@ -89,6 +112,7 @@ from ._wpilib import (
     Spark,
     SynchronousInterrupt,
     Talon,
+    TelemetryGovernor,
     TimedRobot,
     Timer,
     TimesliceRobot,
@@ -98,6 +122,7 @@ from ._wpilib import (
     VictorSP,
     Watchdog,
     XboxController,
+    XboxControllerState,
     getCurrentThreadPriority,
     getDeployDirectory,
     getErrorMessage,
@@ -115,6 +140,7 @@ __all__ = [
     "ADXL362",
     "ADXRS450_Gyro",
     "AddressableLED",
+    "AddressableLEDAnimator",
     "AnalogAccelerometer",
     "AnalogEncoder",
     "AnalogGyro",
@@ -124,6 +150,7 @@ __all__ = [
     "AnalogTrigger",
     "AnalogTriggerOutput",
     "AnalogTriggerType",
+    "AsynchronousInterrupt",
     "BuiltInAccelerometer",
     "CAN",
     "CANData",
@@ -133,9 +160,19 @@ __all__ = [
     "Compressor",
     "CompressorConfigType",
     "Counter",
+    "DataLogBooleanEntry",
+    "DataLogDoubleArrayEntry",
+    "DataLogDoubleEntry",
+    "DataLogIntegerEntry",
+    "DataLogRawEntry",
     "DataLogManager",
+    "DMA",
+    "DMAReader",
+    "DMASample",
     "DMC60",
     "DSControlWord",
+    "DSDataEvent",
+    "DSDrivenRobot",
     "DigitalGlitchFilter",
     "DigitalInput",
     "DigitalOutput",
@@ -148,19 +185,25 @@ __all__ = [
     "Field2d",
     "FieldObject2d",
     "I2C",
+    "I2CScheduler",
+    "InterruptDispatcher",
     "IterativeRobotBase",
     "Jaguar",
     "Joystick",
+    "JoystickState",
     "LiveWindow",
     "Mechanism2d",
+    "MechanismBatch",
     "MechanismLigament2d",
     "MechanismObject2d",
     "MechanismRoot2d",
     "MotorControllerGroup",
+    "MotorOutputFrame",
     "MotorSafety",
     "NidecBrushless",
     "Notifier",
     "PS4Controller",
+    "PS4ControllerState",
     "PWM",
     "PWMMotorController",
     "PWMSparkMax",
@@ -173,17 +216,22 @@ __all__ = [
     "PneumaticsControlModule",
     "PneumaticsModuleType",
     "PowerDistribution",
+    "PowerDistributionSampler",
     "Preferences",
     "Relay",
     "RobotBase",
     "RobotController",
     "RobotState",
+    "RobotStateSnapshot",
     "RuntimeType",
     "SD540",
     "SPI",
+    "SPIAutoReader",
     "SendableBuilderImpl",
     "SendableChooser",
     "SendableChooserBase",
+    "SensorGroup",
+    "SensorHistory",
     "SensorUtil",
     "SerialPort",
     "Servo",
@@ -192,6 +240,7 @@ __all__ = [
     "Spark",
     "SynchronousInterrupt",
     "Talon",
+    "TelemetryGovernor",
     "TimedRobot",
     "Timer",
     "TimesliceRobot",
@@ -201,6 +250,7 @@ __all__ = [
     "VictorSP",
     "Watchdog",
     "XboxController",
+    "XboxControllerState",
     "getCurrentThreadPriority",
     "getDeployDirectory",
     "getErrorMessage",
@@ -218,7 +268,15 @@ __all__ += ["reportError", "reportWarning"]
 del _init_wpilib
 
 from .cameraserver import CameraServer
+from .datalogrotation import RotatingDataLogManager
 from .deployinfo import getDeployData
+from .packedrecord import PackedRecord, PackedRecordPublisher
+from .preferencesbinding import PreferencesBinding
+from .serialstream import (
+    SerialTransport,
+    createSerialConnection,
+    openSerialConnection,
+)
 
 try:
     from .version import version as __version__
@@ -227,4 +285,14 @@ except ImportError:
 
 from ._impl.main import run
 
-__all__ += ["CameraServer", "run"]
+__all__ += [
+    "CameraServer",
+    "PackedRecord",
+    "PackedRecordPublisher",
+    "PreferencesBinding",
+    "RotatingDataLogManager",
+    "SerialTransport",
+    "createSerialConnection",
+    "openSerialConnection",
+    "run",
+]
@@ -0,0 +1,158 @@
+# novalidate
+#
+# Streaming reader for the .wpilog format written by wpi::log::DataLog.
+# Only a small read buffer is kept in memory, so files of any size can
+# be read.
+#
+
+import struct
+import typing
+
+_header = struct.Struct("<6sHI")
+
+_CONTROL_START = 0
+_CONTROL_FINISH = 1
+_CONTROL_SET_METADATA = 2
+
+
+class EntryInfo(typing.NamedTuple):
+    id: int
+    name: str
+    type: str
+    metadata: str
+
+
+class Record(typing.NamedTuple):
+    entry: EntryInfo
+    timestamp: int
+    payload: bytes
+
+
+def _read_str(payload: bytes, pos: int) -> typing.Tuple[str, int]:
+    (n,) = struct.unpack_from("<I", payload, pos)
+    pos += 4
+    return payload[pos : pos + n].decode("utf-8", "replace"), pos + n
+
+
+def iter_records(
+    fp: typing.BinaryIO, bufsize: int = 1 << 16
+) -> typing.Iterator[Record]:
+    """
+    Yields the data records of a wpilog file in file order. Control
+    records are processed internally to track which entries are started.
+
+    :param fp: File opened in binary mode
+    """
+    data = fp.read(_header.size)
+    if len(data) < _header.size:
+        raise ValueError("not a wpilog file")
+    magic, version, extra = _header.unpack(data)
+    if magic != b"WPILOG" or version < 0x0100:
+        raise ValueError("not a wpilog file")
+    fp.read(extra)
+
+    entries: typing.Dict[int, EntryInfo] = {}
+    buf = b""
+    pos = 0
+
+    while True:
+        # make sure the largest possible record header is buffered
+        if len(buf) - pos < 17:
+            buf = buf[pos:] + fp.read(bufsize)
+            pos = 0
+            if not buf:
+                return
+
+        hdr = buf[pos]
+        id_len = (hdr & 0x3) + 1
+        size_len = ((hdr >> 2) & 0x3) + 1
+        ts_len = ((hdr >> 4) & 0x7) + 1
+        header_len = 1 + id_len + size_len + ts_len
+        if len(buf) - pos < header_len:
+            # truncated at the end of the file
+            return
+
+        p = pos + 1
+        eid = int.from_bytes(buf[p : p + id_len], "little")
+        p += id_len
+        size = int.from_bytes(buf[p : p + size_len], "little")
+        p += size_len
+        timestamp = int.from_bytes(buf[p : p + ts_len], "little")
+        p += ts_len
+
+        if len(buf) - p < size:
+            buf = buf[p:] + fp.read(max(bufsize, size))
+            p = 0
+            if len(buf) < size:
+                return
+
+        payload = buf[p : p + size]
+        pos = p + size
+
+        if eid != 0:
+            entry = entries.get(eid)
+            if entry is not None:
+                yield Record(entry, timestamp, payload)
+            continue
+
+        # control record
+        if len(payload) < 5:
+            continue
+        control = payload[0]
+        (target,) = struct.unpack_from("<I", payload, 1)
+        try:
+            if control == _CONTROL_START:
+                name, i = _read_str(payload, 5)
+                typ, i = _read_str(payload, i)
+                metadata, i = _read_str(payload, i)
+                entries[target] = EntryInfo(target, name, typ, metadata)
+            elif control == _CONTROL_FINISH:
+                entries.pop(target, None)
+            elif control == _CONTROL_SET_METADATA:
+                entry = entries.get(target)
+                if entry is not None:
+                    metadata, _ = _read_str(payload, 5)
+                    entries[target] = entry._replace(metadata=metadata)
+        except struct.error:
+            pass
+
+
+def _array(code: str, size: int):
+    def decode(payload: bytes):
+        return list(struct.unpack(f"<{len(payload) // size}{code}", payload))
+
+    return decode
+
+
+def _string_array(payload: bytes) -> typing.List[str]:
+    (n,) = struct.unpack_from("<I", payload)
+    out = []
+    pos = 4
+    for _ in range(n):
+        s, pos = _read_str(payload, pos)
+        out.append(s)
+    return out
+
+
+decoders: typing.Dict[str, typing.Callable[[bytes], typing.Any]] = {
+    "boolean": lambda p: p[0] != 0,
+    "int64": lambda p: struct.unpack("<q", p)[0],
+    "float": lambda p: struct.unpack("<f", p)[0],
+    "double": lambda p: struct.unpack("<d", p)[0],
+    "string": lambda p: p.decode("utf-8", "replace"),
+    "json": lambda p: p.decode("utf-8", "replace"),
+    "boolean[]": lambda p: [b != 0 for b in p],
+    "int64[]": _array("q", 8),
+    "float[]": _array("f", 4),
+    "double[]": _array("d", 8),
+    "string[]": _string_array,
+}
+
+
+def decode(entry: EntryInfo, payload: bytes):
+    """Decodes a payload according to the entry type; unknown types are
+    returned as bytes"""
+    decoder = decoders.get(entry.type)
+    if decoder is None:
+        return payload
+    return decoder(payload)
@@ -0,0 +1,403 @@
+import json
+import logging
+import mmap
+import os
+import struct
+import typing
+
+import numpy as np
+
+from ._wpilib import _indexDataLog
+
+logger = logging.getLogger("wpilib.datalogfile")
+
+__all__ = ["DataLogFile", "DataLogFileEntry"]
+
+_INDEX_MAGIC = b"WPIIDX01"
+_INDEX_VERSION = 1
+
+# numpy dtype for types with a fixed size payload
+_scalar_dtypes = {
+    "boolean": np.dtype(np.bool_),
+    "int64": np.dtype("<i8"),
+    "float": np.dtype("<f4"),
+    "double": np.dtype("<f8"),
+}
+
+# numpy dtype for the elements of array types
+_array_dtypes = {
+    "boolean[]": np.dtype(np.bool_),
+    "int64[]": np.dtype("<i8"),
+    "float[]": np.dtype("<f4"),
+    "double[]": np.dtype("<f8"),
+}
+
+# gathering fixed size values is done in chunks to bound temporary memory
+_CHUNK = 1 << 20
+
+
+def _align8(n: int) -> int:
+    return (n + 7) & ~7
+
+
+class DataLogFileEntry:
+    """
+    Records for a single entry (by name and type) of a :class:`DataLogFile`.
+
+    Timestamps are integer microseconds, the same as the timestamps
+    written by :class:`.DataLogManager`. Records of an entry are assumed
+    to be in nondecreasing timestamp order, which is how DataLog writes
+    them.
+
+    Records of ``boolean``, ``int64``, ``float`` and ``double`` entries
+    whose payload is the wrong size are skipped, so they are left out of
+    the timestamps as well as the values.
+
+    Nothing is decoded until values are requested, and only the records in
+    the requested range are decoded.
+    """
+
+    def __init__(self, log: "DataLogFile", name: str, slots: typing.List[dict]):
+        self._log = log
+        self.name = name
+        self.type: str = slots[-1]["type"]
+        self.metadata: str = slots[-1]["metadata"]
+        self._slots = [(s["start"], s["count"]) for s in slots]
+        self._records: typing.Union[slice, np.ndarray, None] = None
+        self._timestamps: typing.Optional[np.ndarray] = None
+
+    def __repr__(self) -> str:
+        return f"<DataLogFileEntry {self.name!r} {self.type!r} ({len(self)} records)>"
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def _range(self, column: np.ndarray) -> np.ndarray:
+        if self._records is None:
+            self._records = self._findRecords()
+        return column[self._records]
+
+    def _findRecords(self) -> typing.Union[slice, np.ndarray]:
+        # a slice (so columns are views) if possible, otherwise the indices
+        # of the records in the index columns
+        if len(self._slots) == 1:
+            start, count = self._slots[0]
+            records = slice(start, start + count)
+        else:
+            records = np.concatenate(
+                [np.arange(s, s + c, dtype=np.int64) for s, c in self._slots]
+            )
+
+        dtype = _scalar_dtypes.get(self.type)
+        if dtype is not None:
+            valid = self._log._sizes[records] == dtype.itemsize
+            if not valid.all():
+                logger.warning(
+                    "Skipping %d malformed records of %s",
+                    np.count_nonzero(~valid),
+                    self.name,
+                )
+                if isinstance(records, slice):
+                    records = np.arange(records.start, records.stop, dtype=np.int64)
+                records = records[valid]
+
+        return records
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """All timestamps of this entry (int64 microseconds)"""
+        if self._timestamps is None:
+            self._timestamps = self._range(self._log._timestamps)
+        return self._timestamps
+
+    def _bounds(
+        self, start: typing.Optional[int], end: typing.Optional[int]
+    ) -> typing.Tuple[int, int]:
+        ts = self.timestamps
+        i = 0 if start is None else int(np.searchsorted(ts, start, "left"))
+        j = len(ts) if end is None else int(np.searchsorted(ts, end, "left"))
+        return i, max(i, j)
+
+    def getTimestamps(
+        self, start: typing.Optional[int] = None, end: typing.Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Returns the timestamps of records with ``start <= timestamp < end``
+
+        :param start: First timestamp to include, or None for the beginning
+        :param end:   Timestamp to stop at, or None for the end
+        """
+        i, j = self._bounds(start, end)
+        return self.timestamps[i:j]
+
+    def getValues(
+        self, start: typing.Optional[int] = None, end: typing.Optional[int] = None
+    ):
+        """
+        Returns the values of records with ``start <= timestamp < end``.
+
+        Values of ``boolean``, ``int64``, ``float`` and ``double`` entries
+        are returned as a 1D numpy array. Array entries are returned as a
+        list of numpy arrays (or a list of lists of str for ``string[]``),
+        ``string`` and ``json`` entries as a list of str, and any other type
+        as a list of bytes.
+
+        :param start: First timestamp to include, or None for the beginning
+        :param end:   Timestamp to stop at, or None for the end
+        """
+        i, j = self._bounds(start, end)
+        offsets = self._range(self._log._offsets)[i:j]
+        sizes = self._range(self._log._sizes)[i:j]
+        return self._log._decode(self.type, offsets, sizes)
+
+    def slice(
+        self, start: typing.Optional[int] = None, end: typing.Optional[int] = None
+    ):
+        """
+        Returns ``(timestamps, values)`` for records with
+        ``start <= timestamp < end``. See :meth:`getValues`.
+        """
+        return self.getTimestamps(start, end), self.getValues(start, end)
+
+
+class DataLogFile:
+    """
+    Memory-mapped reader for ``.wpilog`` files, such as those written by
+    :class:`.DataLogManager`.
+
+    When a log is opened, a native scan builds an index of the payload
+    offset and timestamp of every record, grouped by entry. The index is
+    saved next to the log (as ``<path>.idx``), so opening the same log again
+    only needs to map the index. The index is rebuilt if the log's size or
+    modification time changes.
+
+    Values are decoded directly from the mapped file when requested, so
+    memory use is proportional to the data actually requested::
+
+        with DataLogFile("FRC_20230401_120000.wpilog") as log:
+            voltage = log.getEntry("/SmartDashboard/voltage")
+            ts, values = voltage.slice(start=30_000_000, end=45_000_000)
+
+    :param path:         Path to the log file
+    :param persistIndex: If True, save the index next to the log
+    :param indexPath:    Where the index is saved, defaults to ``<path>.idx``
+
+    .. note:: This class only exists in RobotPy
+    """
+
+    def __init__(
+        self,
+        path: typing.Union[str, os.PathLike],
+        *,
+        persistIndex: bool = True,
+        indexPath: typing.Optional[typing.Union[str, os.PathLike]] = None,
+    ) -> None:
+        self.path = os.fspath(path)
+        self._indexPath = os.fspath(indexPath) if indexPath else self.path + ".idx"
+
+        with open(self.path, "rb") as fp:
+            st = os.fstat(fp.fileno())
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        self._data = np.frombuffer(self._mmap, dtype=np.uint8)
+
+        key = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        slots = self._loadIndex(key)
+        if slots is None:
+            slots = self._buildIndex(key, persistIndex)
+
+        # an entry that is started again with a different type is a
+        # different entry, as its records can't be decoded together
+        byType: typing.Dict[typing.Tuple[str, str], typing.List[dict]] = {}
+        for slot in slots:
+            byType.setdefault((slot["name"], slot["type"]), []).append(slot)
+
+        self._entries: typing.Dict[typing.Tuple[str, str], DataLogFileEntry] = {
+            key: DataLogFileEntry(self, key[0], s) for key, s in byType.items()
+        }
+
+        #: Entries in the log, by name. If an entry was started with more
+        #: than one type, this is the one started last.
+        self.entries: typing.Dict[str, DataLogFileEntry] = {
+            slot["name"]: self._entries[(slot["name"], slot["type"])] for slot in slots
+        }
+
+    def __enter__(self) -> "DataLogFile":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmaps the log and its index"""
+        self._data = None
+        self._offsets = self._timestamps = self._sizes = None
+        self._indexMap = None
+        for entry in self._entries.values():
+            entry._records = entry._timestamps = None
+        self._mmap.close()
+
+    def getEntry(
+        self, name: str, type: typing.Optional[str] = None
+    ) -> DataLogFileEntry:
+        """
+        Returns the entry with the specified name
+
+        :param name: Name of the entry
+        :param type: Type of the entry. Only needed if the entry was started
+                     with more than one type, defaults to the one started
+                     last.
+        """
+        if type is None:
+            return self.entries[name]
+        return self._entries[(name, type)]
+
+    #
+    # Index handling
+    #
+
+    def _buildIndex(self, key: dict, persist: bool) -> typing.List[dict]:
+        entries, starts, counts, offsets, timestamps, sizes = _indexDataLog(self._data)
+        self._offsets = offsets
+        self._timestamps = timestamps
+        self._sizes = sizes
+        self._indexMap = None
+
+        slots = [
+            {
+                "id": eid,
+                "name": name.decode("utf-8", "replace"),
+                "type": typ.decode("utf-8", "replace"),
+                "metadata": metadata.decode("utf-8", "replace"),
+                "timestamp": timestamp,
+                "start": int(start),
+                "count": int(count),
+            }
+            for (eid, name, typ, metadata, timestamp), start, count in zip(
+                entries, starts, counts
+            )
+        ]
+
+        if persist:
+            try:
+                self._saveIndex(key, slots)
+            except OSError as e:
+                logger.debug("Could not save index %s: %s", self._indexPath, e)
+
+        return slots
+
+    def _saveIndex(self, key: dict, slots: typing.List[dict]) -> None:
+        header = json.dumps(
+            {
+                "version": _INDEX_VERSION,
+                **key,
+                "records": len(self._offsets),
+                "slots": slots,
+            }
+        ).encode("utf-8")
+
+        tmp = self._indexPath + ".tmp"
+        with open(tmp, "wb") as fp:
+            fp.write(_INDEX_MAGIC)
+            fp.write(struct.pack("<Q", len(header)))
+            fp.write(header)
+            fp.write(b"\0" * (_align8(len(header)) - len(header)))
+            fp.write(self._offsets.astype("<u8", copy=False).tobytes())
+            fp.write(self._timestamps.astype("<i8", copy=False).tobytes())
+            fp.write(self._sizes.astype("<u4", copy=False).tobytes())
+        os.replace(tmp, self._indexPath)
+
+    def _loadIndex(self, key: dict) -> typing.Optional[typing.List[dict]]:
+        try:
+            raw = np.memmap(self._indexPath, dtype=np.uint8, mode="r")
+        except (OSError, ValueError):
+            return None
+
+        try:
+            if bytes(raw[:8]) != _INDEX_MAGIC:
+                return None
+            (hlen,) = struct.unpack("<Q", bytes(raw[8:16]))
+            header = json.loads(bytes(raw[16 : 16 + hlen]).decode("utf-8"))
+            if (
+                header.get("version") != _INDEX_VERSION
+                or header.get("size") != key["size"]
+                or header.get("mtime_ns") != key["mtime_ns"]
+            ):
+                return None
+
+            n = header["records"]
+            pos = 16 + _align8(hlen)
+            offsets = raw[pos : pos + n * 8].view("<u8")
+            pos += n * 8
+            timestamps = raw[pos : pos + n * 8].view("<i8")
+            pos += n * 8
+            sizes = raw[pos : pos + n * 4].view("<u4")
+            if len(sizes) != n:
+                return None
+        except (ValueError, KeyError, UnicodeDecodeError, struct.error):
+            logger.debug("Ignoring invalid index %s", self._indexPath)
+            return None
+
+        self._indexMap = raw
+        self._offsets = offsets
+        self._timestamps = timestamps
+        self._sizes = sizes
+        return header["slots"]
+
+    #
+    # Decoding
+    #
+
+    def _gather(self, offsets: np.ndarray, width: int) -> np.ndarray:
+        # copies `width` bytes starting at each offset into an Nxwidth array
+        out = np.empty((len(offsets), width), dtype=np.uint8)
+        cols = np.arange(width, dtype=np.uint64)
+        for i in range(0, len(offsets), _CHUNK):
+            chunk = offsets[i : i + _CHUNK].astype(np.uint64, copy=False)
+            out[i : i + _CHUNK] = self._data[chunk[:, None] + cols]
+        return out
+
+    def _bytes(self, offset, size) -> bytes:
+        return self._mmap[int(offset) : int(offset) + int(size)]
+
+    def _decode(self, typ: str, offsets: np.ndarray, sizes: np.ndarray):
+        dtype = _scalar_dtypes.get(typ)
+        if dtype is not None:
+            # malformed records were already skipped by DataLogFileEntry
+            return self._gather(offsets, dtype.itemsize).view(dtype).reshape(-1)
+
+        dtype = _array_dtypes.get(typ)
+        if dtype is not None:
+            return [
+                np.frombuffer(self._bytes(o, s - s % dtype.itemsize), dtype=dtype)
+                for o, s in zip(offsets, sizes)
+            ]
+
+        if typ in ("string", "json"):
+            return [
+                self._bytes(o, s).decode("utf-8", "replace")
+                for o, s in zip(offsets, sizes)
+            ]
+
+        if typ == "string[]":
+            return [
+                self._decodeStringArray(self._bytes(o, s))
+                for o, s in zip(offsets, sizes)
+            ]
+
+        return [self._bytes(o, s) for o, s in zip(offsets, sizes)]
+
+    @staticmethod
+    def _decodeStringArray(data: bytes) -> typing.List[str]:
+        if len(data) < 4:
+            return []
+        (count,) = struct.unpack_from("<I", data)
+        pos = 4
+        out = []
+        for _ in range(count):
+            if pos + 4 > len(data):
+                break
+            (n,) = struct.unpack_from("<I", data, pos)
+            pos += 4
+            out.append(data[pos : pos + n].decode("utf-8", "replace"))
+            pos += n
+        return out
@@ -0,0 +1,410 @@
+import gzip
+import io
+import logging
+import os
+import re
+import shutil
+import struct
+import threading
+import time
+import typing
+
+import ntcore
+from wpiutil.log import StringLogEntry
+
+from ._wpilib import RobotBase, _RotatingDataLog
+
+logger = logging.getLogger("wpilib.datalog")
+
+__all__ = ["RotatingDataLogManager"]
+
+_segment_re = re.compile(r"^(.+)_(\d{4,})\.wpilog(\.gz|\.zst)?$")
+
+# size of the fixed part of the wpilog header, which is followed by the
+# extra header string
+_header = struct.Struct("<6sHI")
+
+_COPY_CHUNK = 1 << 20
+
+
+def _default_dir() -> str:
+    if RobotBase.isSimulation():
+        return "logs"
+    # same as DataLogManager: prefer a USB stick if one is mounted
+    if os.path.isdir("/u") and os.access("/u", os.W_OK):
+        return "/u/logs"
+    return "/home/lvuser/logs"
+
+
+def _list_segments(
+    directory: str, prefix: str
+) -> typing.List[typing.Tuple[str, int, str]]:
+    """Returns (session, sequence, filename) of each segment in directory"""
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+
+    segments = []
+    for name in names:
+        m = _segment_re.match(name)
+        if m is not None and name.startswith(prefix):
+            segments.append((m.group(1), int(m.group(2)), name))
+    segments.sort()
+    return segments
+
+
+def _open_segment(path: str) -> typing.BinaryIO:
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    if path.endswith(".zst"):
+        import zstandard
+
+        return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"))
+    return open(path, "rb")
+
+
+def _lower_priority() -> None:
+    # On Linux, the "process" priority of a thread ID only applies to that
+    # thread, so this only affects the compression thread
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except (AttributeError, OSError):
+        pass
+
+
+class _SegmentStream(io.RawIOBase):
+    # Concatenates the segments of a session into a single log. Segments
+    # after the first have their file header removed. The Start records at
+    # the beginning of each segment restate entries that are already
+    # started, with the same entry ID, name and type; DataLogFile and
+    # wpilib._impl.wpilog continue the existing entry when they see one.
+
+    def __init__(self, paths: typing.List[str]) -> None:
+        super().__init__()
+        self._paths = list(paths)
+        self._fp: typing.Optional[typing.BinaryIO] = None
+        self._first = True
+
+    def readable(self) -> bool:
+        return True
+
+    def _next(self) -> bool:
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+        if not self._paths:
+            return False
+
+        self._fp = _open_segment(self._paths.pop(0))
+        if not self._first:
+            header = self._fp.read(_header.size)
+            if len(header) == _header.size:
+                _, _, extra = _header.unpack(header)
+                self._fp.read(extra)
+        self._first = False
+        return True
+
+    def readinto(self, b) -> int:
+        while True:
+            if self._fp is not None:
+                n = self._fp.readinto(b)
+                if n:
+                    return n
+            if not self._next():
+                return 0
+
+    def close(self) -> None:
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+        super().close()
+
+
+class RotatingDataLogManager:
+    """
+    An alternative to :class:`.DataLogManager` that splits the log into
+    segments, compresses closed segments, and deletes old segments so that
+    logs don't fill up the disk.
+
+    A new segment is started when the current one reaches ``maxSegmentSize``
+    bytes or is ``maxSegmentTime`` seconds old. Every segment starts with
+    the active entries, so each one is a valid ``.wpilog`` file on its own.
+    All file I/O is done on the DataLog writer thread, and compression and
+    deletion are done on a low priority background thread, so the robot
+    thread never waits on them::
+
+        logs = RotatingDataLogManager(maxSegmentSize=8 << 20, maxTotalSize=1 << 30)
+        DriverStation.startDataLog(logs.getLog())
+
+    Segments are named ``<session>_<NNNN>.wpilog``, where the session name
+    is ``<prefix><UTC date>_<UTC time>``. The segments of a session can be
+    read as a single log with :meth:`openSession`, or combined into one
+    file with :meth:`joinSession`.
+
+    Segments left uncompressed by a previous session (for example, if the
+    robot lost power) are compressed when the manager starts.
+
+    :param directory:       Directory to write logs to. Defaults to the same
+                            directory as DataLogManager
+    :param prefix:          Prefix of session names
+    :param maxSegmentSize:  Segment size in bytes that starts a new segment,
+                            or 0 for no limit
+    :param maxSegmentTime:  Segment age in seconds that starts a new segment,
+                            or 0 for no limit
+    :param maxTotalSize:    When the segments in the directory take more
+                            than this many bytes, the oldest segments are
+                            deleted. None for no limit
+    :param compression:     ``"gzip"``, ``"zstd"`` (requires the zstandard
+                            package), or None
+    :param period:          Time between writes to disk, in seconds
+    :param logNetworkTables: If True, log NetworkTables values and
+                            connections, like DataLogManager does by
+                            default
+
+    .. note:: This class only exists in RobotPy
+    """
+
+    def __init__(
+        self,
+        directory: typing.Optional[str] = None,
+        *,
+        prefix: str = "FRC_",
+        maxSegmentSize: int = 16 << 20,
+        maxSegmentTime: float = 0,
+        maxTotalSize: typing.Optional[int] = None,
+        compression: typing.Optional[str] = "gzip",
+        period: float = 0.25,
+        logNetworkTables: bool = True,
+    ) -> None:
+        if compression == "gzip":
+            self._suffix = ".gz"
+        elif compression == "zstd":
+            import zstandard  # noqa: F401
+
+            self._suffix = ".zst"
+        elif compression is None:
+            self._suffix = ""
+        else:
+            raise ValueError(f"unsupported compression {compression!r}")
+
+        self.directory = directory if directory is not None else _default_dir()
+        self.prefix = prefix
+        self.maxTotalSize = maxTotalSize
+
+        #: Name of the session being written
+        self.session = prefix + time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+
+        self._log = _RotatingDataLog(
+            self.directory, self.session, maxSegmentSize, maxSegmentTime, period
+        )
+        self._messages: typing.Optional[StringLogEntry] = StringLogEntry(
+            self._log.getLog(), "messages"
+        )
+
+        self._ntLoggers = None
+        if logNetworkTables:
+            inst = ntcore.NetworkTableInstance.getDefault()
+            self._ntLoggers = (
+                inst.startEntryDataLog(self._log.getLog(), "", "NT:"),
+                inst.startConnectionDataLog(self._log.getLog(), "NTConnection"),
+            )
+
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="DataLogRotation", daemon=True
+        )
+        self._thread.start()
+
+    def getLog(self):
+        """Returns the log being written. Pass this to other log users,
+        such as :meth:`.DriverStation.startDataLog`
+
+        :raises RuntimeError: if the manager is closed
+        """
+        return self._log.getLog()
+
+    def log(self, message: str) -> None:
+        """Logs a message to the "messages" entry, and prints it
+
+        :raises RuntimeError: if the manager is closed
+        """
+        if self._messages is None:
+            raise RuntimeError("RotatingDataLogManager is closed")
+        self._messages.append(message)
+        print(message)
+
+    def getCurrentSegment(self) -> str:
+        """Returns the path of the segment being written"""
+        return self._log.getCurrentSegment()
+
+    def rotate(self) -> None:
+        """Starts a new segment as soon as possible"""
+        self._log.rotate()
+
+    def close(self) -> None:
+        """
+        Stops logging. The remaining data is written out, and the last
+        segment is compressed before this returns.
+
+        Like the log of :class:`.DataLogManager`, the log is never
+        destroyed, so anything that was given the log with :meth:`getLog`
+        (such as :meth:`.DriverStation.startDataLog`) can keep using it, but
+        the data is discarded. :meth:`getLog` and :meth:`log` raise
+        RuntimeError afterwards.
+        """
+        if self._stopped.is_set():
+            return
+
+        if self._ntLoggers is not None:
+            entryLogger, connectionLogger = self._ntLoggers
+            ntcore.NetworkTableInstance.stopEntryDataLog(entryLogger)
+            ntcore.NetworkTableInstance.stopConnectionDataLog(connectionLogger)
+            self._ntLoggers = None
+
+        self._messages = None
+
+        self._log.stop()
+        self._stopped.set()
+        self._thread.join()
+
+    def __enter__(self) -> "RotatingDataLogManager":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    #
+    # Background thread
+    #
+
+    def _run(self) -> None:
+        _lower_priority()
+
+        # leftovers from previous sessions
+        if self._suffix:
+            for session, _, name in _list_segments(self.directory, self.prefix):
+                if session != self.session and name.endswith(".wpilog"):
+                    self._compress(os.path.join(self.directory, name))
+        self._enforceRetention()
+
+        while True:
+            path = self._log.waitForClosedSegment(0.5)
+            if path is None:
+                if self._stopped.is_set():
+                    break
+                continue
+            if self._suffix:
+                self._compress(path)
+            self._enforceRetention()
+
+    def _compress(self, path: str) -> None:
+        dst = path + self._suffix
+        tmp = dst + ".tmp"
+        try:
+            with open(path, "rb") as src:
+                if self._suffix == ".gz":
+                    # a low level is much faster, and logs compress well anyway
+                    with gzip.open(tmp, "wb", compresslevel=3) as out:
+                        shutil.copyfileobj(src, out, _COPY_CHUNK)
+                else:
+                    import zstandard
+
+                    with open(tmp, "wb") as out:
+                        zstandard.ZstdCompressor().copy_stream(src, out)
+            os.replace(tmp, dst)
+            os.remove(path)
+        except OSError:
+            logger.exception("Could not compress log segment %s", path)
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    def _enforceRetention(self) -> None:
+        if self.maxTotalSize is None:
+            return
+
+        current = os.path.abspath(self._log.getCurrentSegment() or "")
+        files = []
+        total = 0
+        for _, _, name in _list_segments(self.directory, self.prefix):
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            total += st.st_size
+            if os.path.abspath(path) != current:
+                files.append((st.st_mtime, path, st.st_size))
+
+        # oldest first
+        files.sort()
+        for _, path, size in files:
+            if total <= self.maxTotalSize:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                logger.info("Deleted old log segment %s", path)
+            except OSError:
+                logger.exception("Could not delete log segment %s", path)
+
+    #
+    # Reading
+    #
+
+    @staticmethod
+    def getSessions(
+        directory: typing.Optional[str] = None, prefix: str = "FRC_"
+    ) -> typing.List[str]:
+        """Returns the names of the sessions in a directory, sorted by name"""
+        if directory is None:
+            directory = _default_dir()
+        return sorted({s for s, _, _ in _list_segments(directory, prefix)})
+
+    @staticmethod
+    def openSession(
+        directory: typing.Optional[str] = None,
+        session: typing.Optional[str] = None,
+        prefix: str = "FRC_",
+    ) -> typing.BinaryIO:
+        """
+        Opens the segments of a session as a single log. The result is a
+        binary file object that can be passed to
+        :class:`wpilib.simulation.LogReplay`.
+
+        :param directory: Directory containing the segments
+        :param session:   Name of the session, defaults to the last one
+        :param prefix:    Prefix of session names
+        """
+        if directory is None:
+            directory = _default_dir()
+        segments = _list_segments(directory, prefix)
+        if session is None:
+            if not segments:
+                raise FileNotFoundError(f"no log sessions in {directory}")
+            session = max(s for s, _, _ in segments)
+
+        paths = [os.path.join(directory, n) for s, _, n in segments if s == session]
+        if not paths:
+            raise FileNotFoundError(f"no segments for log session {session!r}")
+        return io.BufferedReader(_SegmentStream(paths), _COPY_CHUNK)
+
+    @staticmethod
+    def joinSession(
+        path: str,
+        directory: typing.Optional[str] = None,
+        session: typing.Optional[str] = None,
+        prefix: str = "FRC_",
+    ) -> None:
+        """
+        Writes the segments of a session to a single uncompressed log file,
+        which can be opened with :class:`wpilib.datalogfile.DataLogFile`.
+        See :meth:`openSession` for the parameters.
+
+        :param path: Path of the file to write
+        """
+        src = RotatingDataLogManager.openSession(directory, session, prefix)
+        with src, open(path, "wb") as dst:
+            shutil.copyfileobj(src, dst, _COPY_CHUNK)
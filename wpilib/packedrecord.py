@@ -0,0 +1,257 @@
+import json
+import operator
+import struct
+import typing
+
+from ._wpilib import SmartDashboard
+
+__all__ = [
+    "PackedRecord",
+    "PackedRecordPublisher",
+    "Int8",
+    "UInt8",
+    "Int16",
+    "UInt16",
+    "Int32",
+    "UInt32",
+    "Int64",
+    "Float32",
+    "Float64",
+]
+
+Int8 = typing.Annotated[int, "b"]
+UInt8 = typing.Annotated[int, "B"]
+Int16 = typing.Annotated[int, "h"]
+UInt16 = typing.Annotated[int, "H"]
+Int32 = typing.Annotated[int, "i"]
+UInt32 = typing.Annotated[int, "I"]
+Int64 = typing.Annotated[int, "q"]
+Float32 = typing.Annotated[float, "f"]
+Float64 = typing.Annotated[float, "d"]
+
+# plain python types map to the widest equivalent
+_default_codes = {bool: "?", int: "q", float: "d"}
+
+_type_names = {
+    "?": "bool",
+    "b": "int8",
+    "B": "uint8",
+    "h": "int16",
+    "H": "uint16",
+    "i": "int32",
+    "I": "uint32",
+    "q": "int64",
+    "f": "float32",
+    "d": "float64",
+}
+
+_zero = {"?": False, "f": 0.0, "d": 0.0}
+
+
+def _field_code(cls_name: str, name: str, hint) -> str:
+    if typing.get_origin(hint) is typing.Annotated:
+        for meta in hint.__metadata__:
+            if meta in _type_names:
+                return meta
+    else:
+        code = _default_codes.get(hint)
+        if code is not None:
+            return code
+    raise TypeError(f"{cls_name}.{name}: unsupported field type {hint!r}")
+
+
+class PackedRecord:
+    """
+    Base class for records that are published as a single raw
+    NetworkTables value and DataLog entry, instead of one entry per field.
+
+    Subclasses declare their fields with annotations, much like a
+    dataclass. Each field is packed to a fixed little-endian
+    :mod:`struct` layout, which is computed once when the subclass is
+    defined::
+
+        from wpilib.packedrecord import PackedRecord, Float32, UInt8
+
+        class ArmState(PackedRecord):
+            position: float
+            velocity: float
+            current: Float32
+            mode: UInt8
+            enabled: bool
+
+        state = ArmState(position=1.0, enabled=True)
+        data = state.pack()
+
+    ``float`` fields are packed as float64, ``int`` fields as int64, and
+    ``bool`` fields as one byte. Use the aliases in this module to select
+    smaller types. Fields may have default values; fields without one
+    default to zero.
+
+    .. note:: This class only exists in RobotPy
+    """
+
+    __slots__ = ()
+
+    _fields: typing.ClassVar[typing.Tuple[str, ...]] = ()
+    _codes: typing.ClassVar[typing.Tuple[str, ...]] = ()
+    _defaults: typing.ClassVar[typing.Dict[str, typing.Any]] = {}
+    _struct: typing.ClassVar[struct.Struct] = struct.Struct("<")
+    _getter: typing.ClassVar[typing.Callable[[typing.Any], tuple]]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        hints = typing.get_type_hints(cls, include_extras=True)
+        fields = []
+        codes = []
+        defaults = {}
+        for name in cls.__dict__.get("__annotations__", {}):
+            hint = hints[name]
+            if typing.get_origin(hint) is typing.ClassVar:
+                continue
+            code = _field_code(cls.__name__, name, hint)
+            fields.append(name)
+            codes.append(code)
+            defaults[name] = cls.__dict__.get(name, _zero.get(code, 0))
+
+        # include fields declared on a parent record
+        cls._fields = cls._fields + tuple(fields)
+        cls._codes = cls._codes + tuple(codes)
+        cls._defaults = {**cls._defaults, **defaults}
+        cls._struct = struct.Struct("<" + "".join(cls._codes))
+
+        # the class attributes hold the defaults, which would shadow the
+        # instance values, so move them out of the way
+        for name in fields:
+            if name in cls.__dict__:
+                delattr(cls, name)
+
+        if len(cls._fields) == 1:
+            getter = operator.attrgetter(cls._fields[0])
+            cls._getter = staticmethod(lambda obj: (getter(obj),))
+        elif cls._fields:
+            cls._getter = staticmethod(operator.attrgetter(*cls._fields))
+        else:
+            cls._getter = staticmethod(lambda obj: ())
+
+    def __init__(self, **kwargs) -> None:
+        for name, default in self._defaults.items():
+            setattr(self, name, kwargs.pop(name, default))
+        if kwargs:
+            raise TypeError(
+                f"{type(self).__name__} has no fields {', '.join(sorted(kwargs))}"
+            )
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{n}={getattr(self, n)!r}" for n in self._fields)
+        return f"{type(self).__name__}({values})"
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._getter(self) == other._getter(other)
+
+    def pack(self) -> bytes:
+        """Returns the packed representation of this record"""
+        return self._struct.pack(*self._getter(self))
+
+    def packInto(self, buffer, offset: int = 0) -> None:
+        """Packs this record into a writable buffer"""
+        self._struct.pack_into(buffer, offset, *self._getter(self))
+
+    @classmethod
+    def unpack(cls, data) -> "PackedRecord":
+        """Creates a record from its packed representation"""
+        obj = cls.__new__(cls)
+        for name, value in zip(cls._fields, cls._struct.unpack(data)):
+            setattr(obj, name, value)
+        return obj
+
+    @classmethod
+    def getSize(cls) -> int:
+        """Returns the size of the packed representation in bytes"""
+        return cls._struct.size
+
+    @classmethod
+    def getSchema(cls) -> str:
+        """
+        Returns a JSON description of the packed layout that dashboards and
+        log tools can use to decode the record. The ``format`` key is a
+        Python :mod:`struct` format string.
+        """
+        return json.dumps(
+            {
+                "name": cls.__name__,
+                "format": cls._struct.format,
+                "size": cls._struct.size,
+                "fields": [
+                    {"name": name, "type": _type_names[code]}
+                    for name, code in zip(cls._fields, cls._codes)
+                ],
+            },
+            separators=(",", ":"),
+        )
+
+
+R = typing.TypeVar("R", bound=PackedRecord)
+
+
+class PackedRecordPublisher(typing.Generic[R]):
+    """
+    Publishes records of a single :class:`PackedRecord` type to a
+    SmartDashboard key with :meth:`.SmartDashboard.putRaw`, and optionally
+    to a DataLog raw entry.
+
+    The schema returned by :meth:`PackedRecord.getSchema` is published
+    once, to the SmartDashboard key ``<key>.schema`` and as the metadata of
+    the DataLog entry (whose type is ``packedrecord:<RecordName>``).
+
+    Each call to :meth:`publish` packs the record once and makes one
+    SmartDashboard put and one DataLog append::
+
+        publisher = PackedRecordPublisher(ArmState, "arm", log=DataLogManager.getLog())
+
+        # in your periodic code
+        publisher.publish(state)
+
+    :param recordType: PackedRecord subclass to publish
+    :param key:        SmartDashboard key
+    :param log:        If specified, records are also appended to this log
+                       (see :meth:`.DataLogManager.getLog`)
+    :param logName:    Name of the DataLog entry, defaults to ``key``
+
+    .. note:: This class only exists in RobotPy
+    """
+
+    def __init__(
+        self,
+        recordType: typing.Type[R],
+        key: str,
+        *,
+        log=None,
+        logName: typing.Optional[str] = None,
+    ) -> None:
+        self.recordType = recordType
+        self.key = key
+
+        schema = recordType.getSchema()
+        SmartDashboard.putString(f"{key}.schema", schema)
+
+        if log is not None:
+            from wpiutil.log import RawLogEntry
+
+            self._entry = RawLogEntry(
+                log,
+                logName or key,
+                schema,
+                f"packedrecord:{recordType.__name__}",
+            )
+        else:
+            self._entry = None
+
+    def publish(self, record: R) -> None:
+        """Packs and publishes a record"""
+        data = record.pack()
+        SmartDashboard.putRaw(self.key, data)
+        if self._entry is not None:
+            self._entry.append(data)
@@ -0,0 +1,233 @@
+import dataclasses
+import logging
+import threading
+import typing
+
+import ntcore
+
+from ._wpilib import Preferences
+
+logger = logging.getLogger("wpilib.preferences")
+
+__all__ = ["PreferencesBinding"]
+
+T = typing.TypeVar("T")
+
+# (type, getter, setter, initializer) for each supported type. bool must
+# be checked before int because bool is a subclass of int
+_accessors = (
+    (bool, Preferences.getBoolean, Preferences.setBoolean, Preferences.initBoolean),
+    (int, Preferences.getLong, Preferences.setLong, Preferences.initLong),
+    (float, Preferences.getDouble, Preferences.setDouble, Preferences.initDouble),
+    (str, Preferences.getString, Preferences.setString, Preferences.initString),
+)
+
+# NetworkTables value types accepted for each supported type
+_ntTypes = {
+    bool: (ntcore.NetworkTableType.kBoolean,),
+    int: (ntcore.NetworkTableType.kInteger,),
+    float: (ntcore.NetworkTableType.kDouble, ntcore.NetworkTableType.kFloat),
+    str: (ntcore.NetworkTableType.kString,),
+}
+
+
+def _get_accessors(name: str, typ: type):
+    for t, getter, setter, initializer in _accessors:
+        if isinstance(typ, type) and issubclass(typ, t):
+            return t, getter, setter, initializer
+    raise TypeError(f"Preference {name!r} has unsupported type {typ!r}")
+
+
+class _Key:
+    __slots__ = ("name", "key", "type", "ntTypes", "getter", "setter")
+
+    def __init__(self, name: str, key: str, typ: type, default) -> None:
+        self.name = name
+        self.key = key
+        self.type, self.getter, self.setter, initializer = _get_accessors(name, typ)
+        self.ntTypes = _ntTypes[self.type]
+        initializer(key, self.check(default))
+
+    def check(self, value):
+        """Returns value as the type of this key, without conversions that
+        could change its meaning (such as ``bool("false")``)"""
+        if isinstance(value, bool):
+            ok = self.type is bool
+        elif isinstance(value, int):
+            ok = self.type in (int, float)
+        else:
+            ok = isinstance(value, self.type)
+        if not ok:
+            raise TypeError(
+                f"Preference {self.name!r} must be {self.type.__name__}, "
+                f"not {type(value).__name__}"
+            )
+        return self.type(value)
+
+
+class PreferencesBinding(typing.Generic[T]):
+    """
+    Binds a set of typed keys to :class:`.Preferences` once, and keeps a
+    local copy of their values that is updated by a NetworkTables listener.
+    Reading a preference is then a plain attribute access instead of a
+    NetworkTables lookup::
+
+        @dataclasses.dataclass
+        class Tuning:
+            kP: float = 0.1
+            kI: float = 0.0
+            enabled: bool = True
+
+        tuning = PreferencesBinding(Tuning)
+
+        # in your periodic code
+        output = tuning.values.kP * error
+
+    The schema can be a dataclass type (each field must have a default) or
+    a dictionary mapping key names to default values. Supported types are
+    bool, int, float, and str.
+
+    Writes made with :meth:`set` update the local copy immediately, but are
+    only published to Preferences when :meth:`flush` is called. Multiple
+    writes to the same key between flushes are coalesced into one.
+
+    :param schema:   dataclass type or dictionary of ``{name: default}``
+    :param prefix:   Prepended to each name to form the preference key
+    :param onChange: Called as ``onChange(name, value)`` when a value is
+                     changed remotely. This is called from the
+                     NetworkTables listener thread, not the robot thread,
+                     so it must not block and must be thread-safe.
+
+    .. note:: This class only exists in RobotPy
+    """
+
+    def __init__(
+        self,
+        schema: typing.Union[typing.Type[T], typing.Dict[str, typing.Any]],
+        *,
+        prefix: str = "",
+        onChange: typing.Optional[typing.Callable[[str, typing.Any], None]] = None,
+    ) -> None:
+        self._onChange = onChange
+        self._lock = threading.Lock()
+        self._pending: typing.Dict[str, typing.Any] = {}
+        # values flushed by this binding that haven't been seen by the
+        # listener yet, in the order they were flushed
+        self._flushed: typing.Dict[str, typing.List[typing.Any]] = {}
+        self._keys: typing.Dict[str, _Key] = {}
+        self._names: typing.Dict[str, _Key] = {}
+
+        if isinstance(schema, dict):
+            defaults = dict(schema)
+            types = {name: type(default) for name, default in defaults.items()}
+            self.values = typing.cast(T, _Values())
+        elif dataclasses.is_dataclass(schema) and isinstance(schema, type):
+            hints = typing.get_type_hints(schema)
+            defaults = {}
+            types = {}
+            for field in dataclasses.fields(schema):
+                if field.default is not dataclasses.MISSING:
+                    defaults[field.name] = field.default
+                elif field.default_factory is not dataclasses.MISSING:
+                    defaults[field.name] = field.default_factory()
+                else:
+                    raise ValueError(f"Preference {field.name!r} must have a default")
+                types[field.name] = hints[field.name]
+            self.values = schema(**defaults)
+        else:
+            raise TypeError(
+                f"schema must be a dataclass type or a dict (got {schema!r})"
+            )
+
+        for name, default in defaults.items():
+            k = _Key(name, prefix + name, types[name], default)
+            self._keys[k.key] = k
+            self._names[name] = k
+            setattr(self.values, name, k.getter(k.key, k.check(default)))
+
+        inst = ntcore.NetworkTableInstance.getDefault()
+        self._listener = inst.addListener(
+            [f"/Preferences/{prefix}"], ntcore.EventFlags.kValueAll, self._onEvent
+        )
+
+    def _onEvent(self, event: ntcore.Event) -> None:
+        data = event.data
+        if not isinstance(data, ntcore.ValueEventData):
+            return
+
+        k = self._keys.get(data.topic.getName()[len("/Preferences/") :])
+        if k is None:
+            return
+
+        if data.value.type() not in k.ntTypes:
+            logger.warning("Ignoring preference %s with the wrong type", k.key)
+            return
+        value = k.type(data.value.value())
+
+        with self._lock:
+            # the values flushed by this binding come back to the listener,
+            # possibly after later values were set; they are not changes
+            flushed = self._flushed.get(k.key)
+            if flushed:
+                if value in flushed:
+                    del flushed[: flushed.index(value) + 1]
+                    return
+                flushed.clear()
+
+            # a local write that hasn't been flushed yet wins
+            if k.key in self._pending:
+                return
+            if getattr(self.values, k.name) == value:
+                return
+            setattr(self.values, k.name, value)
+
+        if self._onChange is not None:
+            try:
+                self._onChange(k.name, value)
+            except Exception:
+                logger.exception("Unhandled exception in onChange callback")
+
+    def set(self, name: str, value: typing.Any) -> None:
+        """
+        Sets the value of a preference. The local value is changed
+        immediately; the new value is published on the next :meth:`flush`.
+
+        :param name:  Name of the preference (without prefix)
+        :param value: New value
+
+        :raises TypeError: if the value doesn't have the type of the preference
+        """
+        k = self._names[name]
+
+        value = k.check(value)
+        with self._lock:
+            setattr(self.values, name, value)
+            self._pending[k.key] = value
+
+    def flush(self) -> None:
+        """Publishes all values changed by :meth:`set` since the last flush"""
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+            for key, value in pending.items():
+                flushed = self._flushed.setdefault(key, [])
+                if not flushed or flushed[-1] != value:
+                    flushed.append(value)
+
+        for key, value in pending.items():
+            self._keys[key].setter(key, value)
+
+    def close(self) -> None:
+        """Flushes pending writes and stops listening for changes"""
+        self.flush()
+        if self._listener:
+            ntcore.NetworkTableInstance.getDefault().removeListener(self._listener)
+            self._listener = 0
+
+
+class _Values:
+    """Holds preference values for a dictionary schema"""
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{k}={v!r}" for k, v in self.__dict__.items())
+        return f"Values({values})"
@@ -0,0 +1,318 @@
+import asyncio
+import threading
+import time
+import typing
+
+__all__ = ["SerialTransport", "createSerialConnection", "openSerialConnection"]
+
+
+class SerialTransport(asyncio.Transport):
+    """
+    An asyncio transport for a :class:`.SerialPort`, so that serial devices
+    can be used with asyncio protocols and streams without blocking the
+    event loop.
+
+    Data is read on a background thread, which spends its time waiting in
+    :meth:`.SerialPort.readinto` (with the GIL released) and hands each
+    chunk that arrives to the event loop. Writes are queued and written to
+    the port by a second background thread; the protocol's
+    ``pause_writing`` and ``resume_writing`` are called as the queue passes
+    the write buffer limits, so :meth:`asyncio.StreamWriter.drain` waits
+    for the port to catch up.
+
+    Usually created by :func:`openSerialConnection` or
+    :func:`createSerialConnection`.
+
+    :param loop:        The event loop that the protocol runs on
+    :param protocol:    The protocol to deliver data to
+    :param port:        The serial port. Anything with the ``readinto``,
+                        ``write``, ``getBytesReceived`` and ``setTimeout``
+                        methods of :class:`.SerialPort` can be used
+    :param chunkSize:   Maximum number of bytes delivered or written at once
+    :param readTimeout: The port's timeout is set to this, in seconds. It
+                        limits how long closing the transport takes
+    :param writeTimeout: If the port doesn't accept any data for this long,
+                         in seconds, the connection is lost with
+                         TimeoutError
+
+    .. note:: This class only exists in RobotPy
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        protocol: asyncio.BaseProtocol,
+        port,
+        *,
+        chunkSize: int = 4096,
+        readTimeout: float = 0.05,
+        writeTimeout: float = 1.0,
+    ) -> None:
+        super().__init__({"serial": port})
+        self._loop = loop
+        self._protocol = protocol
+        self._port = port
+        self._chunkSize = chunkSize
+        self._readTimeout = readTimeout
+        self._writeTimeout = writeTimeout
+        self._closing = False
+        self._aborted = False
+        self._reading = threading.Event()
+        self._reading.set()
+
+        self._writeCv = threading.Condition()
+        self._writeBuffer = bytearray()
+        self._writingPaused = False
+        self.set_write_buffer_limits()
+
+        # connection_lost is called once both threads have stopped
+        self._running = 2
+        self._exc: typing.Optional[BaseException] = None
+
+        port.setTimeout(readTimeout)
+
+        self._thread = threading.Thread(
+            target=self._run, name="SerialTransport", daemon=True
+        )
+        self._writeThread = threading.Thread(
+            target=self._runWriter, name="SerialTransportWriter", daemon=True
+        )
+        loop.call_soon(protocol.connection_made, self)
+        loop.call_soon(self._thread.start)
+        loop.call_soon(self._writeThread.start)
+
+    #
+    # Transport API
+    #
+
+    def get_protocol(self) -> asyncio.BaseProtocol:
+        return self._protocol
+
+    def set_protocol(self, protocol: asyncio.BaseProtocol) -> None:
+        self._protocol = protocol
+
+    def is_closing(self) -> bool:
+        return self._closing
+
+    def close(self) -> None:
+        """Stops reading. Queued data is still written, and connection_lost
+        is called once that is done and the reader thread has stopped."""
+        self._closing = True
+        self._reading.set()
+        with self._writeCv:
+            self._writeCv.notify_all()
+
+    def abort(self) -> None:
+        """Closes the transport without writing the queued data"""
+        with self._writeCv:
+            self._aborted = True
+            self._writeBuffer.clear()
+        self.close()
+
+    def is_reading(self) -> bool:
+        return not self._closing and self._reading.is_set()
+
+    def pause_reading(self) -> None:
+        self._reading.clear()
+
+    def resume_reading(self) -> None:
+        self._reading.set()
+
+    def write(self, data) -> None:
+        if self._closing or not data:
+            return
+        with self._writeCv:
+            self._writeBuffer += data
+            self._writeCv.notify()
+        self._maybePauseWriting()
+
+    def can_write_eof(self) -> bool:
+        return False
+
+    def get_write_buffer_size(self) -> int:
+        with self._writeCv:
+            return len(self._writeBuffer)
+
+    def get_write_buffer_limits(self) -> typing.Tuple[int, int]:
+        return self._writeLow, self._writeHigh
+
+    def set_write_buffer_limits(
+        self, high: typing.Optional[int] = None, low: typing.Optional[int] = None
+    ) -> None:
+        # same defaults as the asyncio socket transports
+        if high is None:
+            high = 64 * 1024 if low is None else 4 * low
+        if low is None:
+            low = high // 4
+        if not high >= low >= 0:
+            raise ValueError(f"high ({high}) must be >= low ({low}) must be >= 0")
+        self._writeHigh = high
+        self._writeLow = low
+        self._maybePauseWriting()
+
+    #
+    # Flow control, called on the event loop
+    #
+
+    def _maybePauseWriting(self) -> None:
+        if self._writingPaused or self.get_write_buffer_size() <= self._writeHigh:
+            return
+        self._writingPaused = True
+        try:
+            self._protocol.pause_writing()
+        except Exception as e:
+            self._loop.call_exception_handler(
+                {
+                    "message": "protocol.pause_writing() failed",
+                    "exception": e,
+                    "transport": self,
+                    "protocol": self._protocol,
+                }
+            )
+
+    def _maybeResumeWriting(self) -> None:
+        if not self._writingPaused or self.get_write_buffer_size() > self._writeLow:
+            return
+        self._writingPaused = False
+        try:
+            self._protocol.resume_writing()
+        except Exception as e:
+            self._loop.call_exception_handler(
+                {
+                    "message": "protocol.resume_writing() failed",
+                    "exception": e,
+                    "transport": self,
+                    "protocol": self._protocol,
+                }
+            )
+
+    #
+    # Background threads
+    #
+
+    def _run(self) -> None:
+        buf = bytearray(self._chunkSize)
+        view = memoryview(buf)
+        exc: typing.Optional[BaseException] = None
+        try:
+            while not self._closing:
+                if not self._reading.wait(self._readTimeout):
+                    continue
+                # wait for one byte, then take everything that has arrived
+                n = min(max(self._port.getBytesReceived(), 1), len(buf))
+                n = self._port.readinto(view[:n])
+                if n:
+                    # reading may have been paused while waiting
+                    while not self._reading.wait(self._readTimeout):
+                        pass
+                    if not self._closing:
+                        self._call(self._dataReceived, bytes(view[:n]))
+        except Exception as e:
+            exc = e
+        self._call(self._threadStopped, exc)
+
+    def _runWriter(self) -> None:
+        exc: typing.Optional[BaseException] = None
+        try:
+            while True:
+                with self._writeCv:
+                    self._writeCv.wait_for(lambda: self._writeBuffer or self._closing)
+                    if not self._writeBuffer:
+                        # closed, and everything has been written
+                        break
+                    data = bytes(self._writeBuffer[: self._chunkSize])
+
+                n = self._writeChunk(data)
+                with self._writeCv:
+                    if self._aborted:
+                        break
+                    del self._writeBuffer[:n]
+                self._call(self._maybeResumeWriting)
+        except Exception as e:
+            exc = e
+        self._call(self._threadStopped, exc)
+
+    def _writeChunk(self, data: bytes) -> int:
+        deadline = time.monotonic() + self._writeTimeout
+        while not self._aborted:
+            n = self._port.write(data)
+            if n:
+                return n
+
+            # the port's buffer is full; give it a moment to drain
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"serial port did not accept data within {self._writeTimeout}s"
+                )
+            time.sleep(0.001)
+        return 0
+
+    def _call(self, fn, *args) -> None:
+        try:
+            self._loop.call_soon_threadsafe(fn, *args)
+        except RuntimeError:
+            # the event loop is closed
+            pass
+
+    def _dataReceived(self, data: bytes) -> None:
+        if not self._closing:
+            self._protocol.data_received(data)
+
+    def _threadStopped(self, exc: typing.Optional[BaseException]) -> None:
+        if exc is not None and self._exc is None:
+            # the connection is unusable, so stop the other thread too
+            self._exc = exc
+            self.abort()
+        self._running -= 1
+        if self._running == 0:
+            self._protocol.connection_lost(self._exc)
+
+
+async def createSerialConnection(
+    protocolFactory: typing.Callable[[], asyncio.BaseProtocol], port, **kwargs
+) -> typing.Tuple[SerialTransport, asyncio.BaseProtocol]:
+    """
+    Connects a protocol to a serial port, like
+    :meth:`asyncio.loop.create_connection` does for a socket.
+
+    :param protocolFactory: Called with no arguments to create the protocol
+    :param port:            The serial port
+    :param kwargs:          Passed to :class:`SerialTransport`
+
+    :returns: (transport, protocol)
+
+    .. note:: This function only exists in RobotPy
+    """
+    loop = asyncio.get_running_loop()
+    protocol = protocolFactory()
+    transport = SerialTransport(loop, protocol, port, **kwargs)
+    return transport, protocol
+
+
+async def openSerialConnection(
+    port, *, limit: int = 2**16, **kwargs
+) -> typing.Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """
+    Opens a serial port as a pair of asyncio streams, like
+    :func:`asyncio.open_connection` does for a socket::
+
+        port = wpilib.SerialPort(230400, wpilib.SerialPort.Port.kMXP)
+        reader, writer = await wpilib.openSerialConnection(port)
+
+        writer.write(b"\\xa5\\x20")
+        header = await reader.readexactly(7)
+
+    :param port:   The serial port
+    :param limit:  Buffer size limit of the reader
+    :param kwargs: Passed to :class:`SerialTransport`
+
+    :returns: (reader, writer)
+
+    .. note:: This function only exists in RobotPy
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=limit, loop=loop)
+    protocol = asyncio.StreamReaderProtocol(reader, loop=loop)
+    transport = SerialTransport(loop, protocol, port, **kwargs)
+    writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+    return reader, writer
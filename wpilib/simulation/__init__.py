@@ -32,6 +32,7 @@ from ._simulation import (
     EncoderSim,
     FlywheelSim,
     GenericHIDSim,
+    I2CBusSim,
     JoystickSim,
     LinearSystemSim_1_1_1,
     LinearSystemSim_1_1_2,
@@ -47,6 +48,7 @@ from ._simulation import (
     RelaySim,
     RoboRioSim,
     SPIAccelerometerSim,
+    SPIAutoReceiveSim,
     SimDeviceSim,
     SingleJointedArmSim,
     SolenoidSim,
@@ -92,6 +94,7 @@ __all__ = [
     "EncoderSim",
     "FlywheelSim",
     "GenericHIDSim",
+    "I2CBusSim",
     "JoystickSim",
     "LinearSystemSim_1_1_1",
     "LinearSystemSim_1_1_2",
@@ -107,6 +110,7 @@ __all__ = [
     "RelaySim",
     "RoboRioSim",
     "SPIAccelerometerSim",
+    "SPIAutoReceiveSim",
     "SimDeviceSim",
     "SingleJointedArmSim",
     "SolenoidSim",
@@ -125,3 +129,7 @@ __all__ = [
 ]
 
 del _init_simulation
+
+from .logreplay import LogReplay
+
+__all__ += ["LogReplay"]
@@ -0,0 +1,252 @@
+import logging
+import re
+import threading
+import time
+import typing
+
+from .._impl import wpilog
+from .._wpilib import RobotController
+from ._simulation import (
+    DriverStationSim,
+    getProgramStarted,
+    isTimingPaused,
+    pauseTiming,
+    stepTiming,
+)
+
+logger = logging.getLogger("wpilib.replay")
+
+__all__ = ["LogReplay"]
+
+_joystick_re = re.compile(r"DS:joystick(\d+)/(axes|buttons|povs)$")
+
+
+class LogReplay:
+    """
+    Replays a ``.wpilog`` file written by :class:`.DataLogManager` into the
+    simulation HAL, so that a recorded match can be reproduced.
+
+    The log is read as a stream, so it is never loaded into memory all at
+    once. Simulation timing is paused and then stepped, so robot code runs
+    as fast as the CPU allows while still seeing the recorded values at the
+    recorded times.
+
+    The driver station state and joystick data recorded by
+    :meth:`.DriverStation.startDataLog` are replayed into
+    :class:`.DriverStationSim` automatically. Any other entry can be
+    replayed into a sim object by mapping it to a setter::
+
+        replay = LogReplay("FRC_20230401_120000.wpilog")
+        replay.map("NT:/SmartDashboard/leftDistance", EncoderSim(left).setDistance)
+        replay.map("/sensors/pressure", AnalogInputSim(0).setVoltage)
+
+        replay.runRobot(MyRobot)
+
+    Setters are called with the decoded value of each record: a bool, int,
+    float, or str for scalar entries, or a list for array entries.
+
+    :param path:      Path to the log file, or a binary file object such
+                      as returned by :meth:`.RotatingDataLogManager.openSession`
+    :param start:     Log timestamp (in microseconds) to start replaying
+                      from. Records before this are applied immediately
+                      when replay starts. Defaults to the first record.
+    :param end:       Log timestamp (in microseconds) to stop at
+    :param driverStation: If True, replay driver station and joystick data
+
+    .. note:: This class only exists in RobotPy
+    """
+
+    def __init__(
+        self,
+        path: typing.Union[str, typing.BinaryIO],
+        *,
+        start: typing.Optional[int] = None,
+        end: typing.Optional[int] = None,
+        driverStation: bool = True,
+    ) -> None:
+        self._fp = open(path, "rb") if isinstance(path, str) else path
+        self._records = wpilog.iter_records(self._fp)
+        self._next: typing.Optional[wpilog.Record] = None
+        self._start = start
+        self._end = end
+        self._simStart: typing.Optional[int] = None
+        self._logStart = 0
+
+        self._setters: typing.Dict[str, typing.List[typing.Callable]] = {}
+        self._ds = driverStation
+        self._dsDirty = False
+
+        #: Number of records that have been applied
+        self.recordsApplied = 0
+
+    def __enter__(self) -> "LogReplay":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the log file"""
+        self._fp.close()
+
+    def map(self, name: str, setter: typing.Callable[[typing.Any], None]) -> None:
+        """
+        Replay the records of a log entry by calling a setter with each
+        value. Multiple setters may be mapped to the same entry.
+
+        :param name:   Name of the log entry
+        :param setter: Called with each decoded value
+        """
+        self._setters.setdefault(name, []).append(setter)
+
+    def getLogTime(self) -> int:
+        """Returns the log timestamp (microseconds) that the simulation is at"""
+        if self._simStart is None:
+            return self._logStart
+        return self._logStart + RobotController.getFPGATime() - self._simStart
+
+    def _nextRecord(self) -> typing.Optional[wpilog.Record]:
+        if self._next is None:
+            self._next = next(self._records, None)
+        return self._next
+
+    def _begin(self) -> None:
+        if not isTimingPaused():
+            pauseTiming()
+
+        if self._ds:
+            DriverStationSim.setDsAttached(True)
+
+        first = self._nextRecord()
+        if self._start is None:
+            self._start = first.timestamp if first is not None else 0
+
+        # the simulation starts at the replay start time
+        self._logStart = self._start
+        self._simStart = RobotController.getFPGATime()
+        self._applyUntil(self._start)
+
+    def _applyUntil(self, timestamp: int) -> None:
+        setters = self._setters
+        while True:
+            record = self._nextRecord()
+            if record is None or record.timestamp > timestamp:
+                break
+            self._next = None
+
+            name = record.entry.name
+            fns = setters.get(name)
+            if fns is not None:
+                value = wpilog.decode(record.entry, record.payload)
+                for fn in fns:
+                    fn(value)
+                self.recordsApplied += 1
+            elif self._ds and name.startswith("DS:"):
+                self._applyDriverStation(record)
+                self.recordsApplied += 1
+
+        if self._dsDirty:
+            DriverStationSim.notifyNewData()
+            self._dsDirty = False
+
+    def _applyDriverStation(self, record: wpilog.Record) -> None:
+        name = record.entry.name
+        value = wpilog.decode(record.entry, record.payload)
+        if name == "DS:enabled":
+            DriverStationSim.setEnabled(value)
+        elif name == "DS:autonomous":
+            DriverStationSim.setAutonomous(value)
+        elif name == "DS:test":
+            DriverStationSim.setTest(value)
+        elif name == "DS:estop":
+            DriverStationSim.setEStop(value)
+        else:
+            m = _joystick_re.match(name)
+            if m is None:
+                return
+            stick = int(m.group(1))
+            kind = m.group(2)
+            if kind == "axes":
+                DriverStationSim.setJoystickAxisCount(stick, len(value))
+                for i, v in enumerate(value):
+                    DriverStationSim.setJoystickAxis(stick, i, v)
+            elif kind == "buttons":
+                DriverStationSim.setJoystickButtonCount(stick, len(value))
+                buttons = 0
+                for i, v in enumerate(value):
+                    if v:
+                        buttons |= 1 << i
+                DriverStationSim.setJoystickButtons(stick, buttons)
+            else:
+                DriverStationSim.setJoystickPOVCount(stick, len(value))
+                for i, v in enumerate(value):
+                    DriverStationSim.setJoystickPOV(stick, i, v)
+        self._dsDirty = True
+
+    def isFinished(self) -> bool:
+        """Returns True when all records (up to ``end``) have been replayed"""
+        record = self._nextRecord()
+        return record is None or (
+            self._end is not None and record.timestamp >= self._end
+        )
+
+    def step(self, dt: float = 0.02) -> bool:
+        """
+        Applies all records up to ``dt`` seconds from now, then advances
+        simulation time by ``dt`` (waiting for notifiers to run).
+
+        :returns: False once the replay is finished
+        """
+        if self._simStart is None:
+            self._begin()
+
+        target = self.getLogTime() + int(dt * 1e6)
+        if self._end is not None:
+            target = min(target, self._end)
+        self._applyUntil(target)
+        stepTiming(dt)
+        return not self.isFinished()
+
+    def run(self, dt: float = 0.02) -> None:
+        """Steps until the replay is finished"""
+        while self.step(dt):
+            pass
+
+    def runRobot(self, robotCls, dt: float = 0.02) -> None:
+        """
+        Creates a robot, runs it in a separate thread while the log is
+        replayed, and then stops it.
+
+        :param robotCls: Robot class to run
+        :param dt:       Simulation time step in seconds
+        """
+        # timing must be paused before the robot is created so that it
+        # doesn't run ahead of the replay
+        pauseTiming()
+
+        robot = robotCls()
+        errors = []
+
+        def _run():
+            try:
+                robot.startCompetition()
+            except Exception as e:
+                errors.append(e)
+                logger.exception("Robot code raised an exception during replay")
+
+        th = threading.Thread(target=_run, name="ReplayRobotThread", daemon=True)
+        th.start()
+        try:
+            while not getProgramStarted():
+                if not th.is_alive():
+                    raise errors[0] if errors else RuntimeError("robot exited")
+                time.sleep(0.001)
+            self.run(dt)
+        finally:
+            robot.endCompetition()
+            # let the robot thread wake up and exit
+            stepTiming(dt)
+            th.join(5)
+
+        if errors:
+            raise errors[0]
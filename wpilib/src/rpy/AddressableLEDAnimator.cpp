@@ -0,0 +1,217 @@
+
+#include "rpy/AddressableLEDAnimator.h"
+
+#include <algorithm>
+#include <cmath>
+
+#include <frc/Errors.h>
+
+using namespace frc;
+
+namespace {
+
+uint8_t Lerp(int a, int b, double t) {
+  return static_cast<uint8_t>(std::lround(a + (b - a) * t));
+}
+
+void SetColor(AddressableLED::LEDData &led, const Color8Bit &color) {
+  led.SetRGB(color.red, color.green, color.blue);
+}
+
+void SetLerp(AddressableLED::LEDData &led, const Color8Bit &a,
+             const Color8Bit &b, double t) {
+  led.SetRGB(Lerp(a.red, b.red, t), Lerp(a.green, b.green, t),
+             Lerp(a.blue, b.blue, t));
+}
+
+// x mod n, always in [0, n)
+double PositiveMod(double x, double n) {
+  double r = std::fmod(x, n);
+  return r < 0 ? r + n : r;
+}
+
+} // namespace
+
+AddressableLEDAnimator::AddressableLEDAnimator(
+    std::shared_ptr<AddressableLED> led, int length, units::second_t period)
+    : m_led(std::move(led)),
+      m_period(std::chrono::duration_cast<std::chrono::steady_clock::duration>(
+          std::chrono::duration<double>(period.value()))) {
+  if (!m_led) {
+    throw FRC_MakeError(err::NullParameter, "led");
+  }
+  if (length <= 0) {
+    throw FRC_MakeError(err::ParameterOutOfRange, "length {} must be positive",
+                        length);
+  }
+  if (period <= 0_s) {
+    throw FRC_MakeError(err::ParameterOutOfRange,
+                        "period {} must be positive", period.value());
+  }
+  m_front.resize(length);
+  m_back.resize(length);
+}
+
+AddressableLEDAnimator::~AddressableLEDAnimator() { Stop(); }
+
+void AddressableLEDAnimator::SetAnimation(const Animation &animation) {
+  std::scoped_lock lock{m_mutex};
+  m_animation = animation;
+}
+
+void AddressableLEDAnimator::SetSolid(const Color8Bit &color) {
+  Animation animation;
+  animation.effect = Effect::kSolid;
+  animation.color1 = color;
+  SetAnimation(animation);
+}
+
+void AddressableLEDAnimator::SetRainbow(int saturation, int value,
+                                        units::second_t cycleTime) {
+  Animation animation;
+  animation.effect = Effect::kRainbow;
+  animation.saturation = std::clamp(saturation, 0, 255);
+  animation.value = std::clamp(value, 0, 255);
+  animation.period = cycleTime.value();
+  SetAnimation(animation);
+}
+
+void AddressableLEDAnimator::SetChase(const Color8Bit &color,
+                                      const Color8Bit &background, int width,
+                                      double speed) {
+  Animation animation;
+  animation.effect = Effect::kChase;
+  animation.color1 = color;
+  animation.color2 = background;
+  animation.width = std::max(width, 0);
+  animation.speed = speed;
+  SetAnimation(animation);
+}
+
+void AddressableLEDAnimator::SetBlend(const Color8Bit &color1,
+                                      const Color8Bit &color2,
+                                      units::second_t period) {
+  Animation animation;
+  animation.effect = Effect::kBlend;
+  animation.color1 = color1;
+  animation.color2 = color2;
+  animation.period = period.value();
+  SetAnimation(animation);
+}
+
+void AddressableLEDAnimator::SetGradient(const Color8Bit &start,
+                                         const Color8Bit &end, double speed) {
+  Animation animation;
+  animation.effect = Effect::kGradient;
+  animation.color1 = start;
+  animation.color2 = end;
+  animation.speed = speed;
+  SetAnimation(animation);
+}
+
+void AddressableLEDAnimator::Start() {
+  m_worker.Start(
+      m_period, [this](auto &lock) { return Step(lock); },
+      [this] {
+        m_frameCount = 0;
+        m_start = std::chrono::steady_clock::now();
+      });
+}
+
+void AddressableLEDAnimator::Stop() { m_worker.Stop(); }
+
+bool AddressableLEDAnimator::IsRunning() { return m_worker.IsRunning(); }
+
+int64_t AddressableLEDAnimator::GetFrameCount() {
+  std::scoped_lock lock{m_mutex};
+  return m_frameCount;
+}
+
+std::vector<AddressableLED::LEDData> AddressableLEDAnimator::GetLastFrame() {
+  std::scoped_lock lock{m_mutex};
+  return m_front;
+}
+
+std::vector<AddressableLED::LEDData>
+AddressableLEDAnimator::RenderFrame(units::second_t time) {
+  Animation animation;
+  std::vector<AddressableLED::LEDData> frame;
+  {
+    std::scoped_lock lock{m_mutex};
+    animation = m_animation;
+    frame.resize(m_front.size());
+  }
+  Render(animation, time.value(), frame);
+  return frame;
+}
+
+void AddressableLEDAnimator::Render(const Animation &animation, double time,
+                                    std::span<AddressableLED::LEDData> out) {
+  size_t n = out.size();
+  switch (animation.effect) {
+    case Effect::kSolid:
+      for (auto &led : out) {
+        SetColor(led, animation.color1);
+      }
+      break;
+
+    case Effect::kRainbow: {
+      // hues are [0, 180), like LEDData::SetHSV
+      double firstHue = 0;
+      if (animation.period > 0) {
+        firstHue = PositiveMod(time / animation.period, 1.0) * 180;
+      }
+      for (size_t i = 0; i < n; i++) {
+        int hue = static_cast<int>(firstHue + i * 180.0 / n) % 180;
+        out[i].SetHSV(hue, animation.saturation, animation.value);
+      }
+      break;
+    }
+
+    case Effect::kChase: {
+      double head = PositiveMod(std::floor(time * animation.speed), n);
+      for (size_t i = 0; i < n; i++) {
+        bool lit = PositiveMod(i - head, n) < animation.width;
+        SetColor(out[i], lit ? animation.color1 : animation.color2);
+      }
+      break;
+    }
+
+    case Effect::kBlend: {
+      double t = 0;
+      if (animation.period > 0) {
+        double phase = PositiveMod(time / animation.period, 1.0);
+        t = phase < 0.5 ? phase * 2 : 2 - phase * 2;
+      }
+      for (auto &led : out) {
+        SetLerp(led, animation.color1, animation.color2, t);
+      }
+      break;
+    }
+
+    case Effect::kGradient: {
+      double offset = time * animation.speed;
+      double last = n > 1 ? n - 1 : 1;
+      for (size_t i = 0; i < n; i++) {
+        double t = std::min(PositiveMod(i - offset, n) / last, 1.0);
+        SetLerp(out[i], animation.color1, animation.color2, t);
+      }
+      break;
+    }
+  }
+}
+
+bool AddressableLEDAnimator::Step(std::unique_lock<std::mutex> &lock) {
+  Animation animation = m_animation;
+  lock.unlock();
+
+  std::chrono::duration<double> time =
+      std::chrono::steady_clock::now() - m_start;
+  Render(animation, time.count(), m_back);
+  m_led->SetData(m_back);
+
+  lock.lock();
+  std::swap(m_front, m_back);
+  m_frameCount++;
+  return false;
+}
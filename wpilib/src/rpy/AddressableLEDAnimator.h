@@ -0,0 +1,146 @@
+#pragma once
+
+#include <chrono>
+#include <memory>
+#include <mutex>
+#include <span>
+#include <vector>
+
+#include <frc/AddressableLED.h>
+#include <frc/util/Color8Bit.h>
+#include <units/time.h>
+
+#include "rpy/PeriodicWorker.h"
+
+namespace frc {
+
+/**
+ * Renders animations to an AddressableLED on a separate thread.
+ *
+ * Frames are rendered into a back buffer and then written to the LED
+ * strip, at a fixed rate, so animations don't use any time on the robot
+ * thread. Setting a new animation takes effect at the next frame.
+ *
+ * The LED strip must still be started with AddressableLED::Start. Don't
+ * call AddressableLED::SetData while the animator is running.
+ */
+class AddressableLEDAnimator {
+ public:
+  /**
+   * @param led    The LED strip to write to
+   * @param length Number of LEDs, as passed to AddressableLED::SetLength
+   * @param period Time between frames
+   */
+  AddressableLEDAnimator(std::shared_ptr<AddressableLED> led, int length,
+                         units::second_t period = 20_ms);
+  ~AddressableLEDAnimator();
+
+  AddressableLEDAnimator(const AddressableLEDAnimator &) = delete;
+  AddressableLEDAnimator &operator=(const AddressableLEDAnimator &) = delete;
+
+  /** Sets every LED to the same color */
+  void SetSolid(const Color8Bit &color);
+
+  /**
+   * Shows a rainbow across the strip.
+   *
+   * @param saturation Saturation of the colors [0-255]
+   * @param value      Brightness of the colors [0-255]
+   * @param cycleTime  Time for the rainbow to scroll one full cycle, or 0
+   *                   for a rainbow that doesn't move
+   */
+  void SetRainbow(int saturation = 255, int value = 128,
+                  units::second_t cycleTime = 1_s);
+
+  /**
+   * Moves a block of LEDs along the strip, wrapping around at the end.
+   *
+   * @param color      Color of the moving block
+   * @param background Color of the other LEDs
+   * @param width      Number of LEDs in the moving block
+   * @param speed      Speed of the block in LEDs per second. Negative
+   *                   values move towards the start of the strip
+   */
+  void SetChase(const Color8Bit &color, const Color8Bit &background,
+                int width, double speed);
+
+  /**
+   * Fades every LED from one color to another and back again.
+   *
+   * @param color1 The first color
+   * @param color2 The second color
+   * @param period Time for a fade from color1 to color2 and back
+   */
+  void SetBlend(const Color8Bit &color1, const Color8Bit &color2,
+                units::second_t period);
+
+  /**
+   * Shows a gradient from one color at the start of the strip to another
+   * at the end, optionally scrolling along the strip and wrapping around.
+   *
+   * @param start Color at the start of the strip
+   * @param end   Color at the end of the strip
+   * @param speed Scroll speed in LEDs per second
+   */
+  void SetGradient(const Color8Bit &start, const Color8Bit &end,
+                   double speed = 0);
+
+  /** Starts rendering frames. The animation time starts at zero. */
+  void Start();
+
+  /** Stops rendering frames. The LEDs keep showing the last frame. */
+  void Stop();
+
+  /** Returns true if frames are being rendered */
+  bool IsRunning();
+
+  /** Returns the number of frames written since the animator was started */
+  int64_t GetFrameCount();
+
+  /** Returns the last frame that was written to the LEDs */
+  std::vector<AddressableLED::LEDData> GetLastFrame();
+
+  /**
+   * Renders the current animation at a time, without writing it to the
+   * LEDs.
+   *
+   * @param time Animation time since Start
+   */
+  std::vector<AddressableLED::LEDData> RenderFrame(units::second_t time);
+
+ private:
+  enum class Effect { kSolid, kRainbow, kChase, kBlend, kGradient };
+
+  struct Animation {
+    Effect effect = Effect::kSolid;
+    Color8Bit color1;
+    Color8Bit color2;
+    int saturation = 0;
+    int value = 0;
+    int width = 0;
+    double speed = 0;
+    double period = 0;
+  };
+
+  static void Render(const Animation &animation, double time,
+                     std::span<AddressableLED::LEDData> out);
+  void SetAnimation(const Animation &animation);
+  bool Step(std::unique_lock<std::mutex> &lock);
+
+  std::shared_ptr<AddressableLED> m_led;
+  std::chrono::steady_clock::duration m_period;
+
+  std::mutex m_mutex;
+  Animation m_animation;
+  std::vector<AddressableLED::LEDData> m_front;
+  int64_t m_frameCount = 0;
+
+  // only used by the render thread
+  std::vector<AddressableLED::LEDData> m_back;
+  std::chrono::steady_clock::time_point m_start;
+
+  // last, so the thread is stopped before the rest is destroyed
+  rpy::PeriodicWorker m_worker{m_mutex};
+};
+
+} // namespace frc
@@ -0,0 +1,61 @@
+
+#include "rpy/AddressableLEDArrays.h"
+
+#include <vector>
+
+namespace rpy {
+
+static_assert(sizeof(frc::AddressableLED::LEDData) ==
+              sizeof(HAL_AddressableLEDData));
+
+void SetLEDDataFromArray(frc::AddressableLED *led, const LEDArray &data) {
+  if (data.ndim() != 2 || (data.shape(1) != 3 && data.shape(1) != 4)) {
+    throw py::value_error("LED data must be an Nx3 array of (r, g, b) or an "
+                          "Nx4 array of (r, g, b, padding)");
+  }
+
+  // reused so that setting data doesn't allocate
+  thread_local std::vector<frc::AddressableLED::LEDData> leds;
+  size_t n = data.shape(0);
+  size_t stride = data.shape(1);
+  leds.resize(n);
+  const uint8_t *p = data.data();
+  for (size_t i = 0; i < n; i++, p += stride) {
+    leds[i].r = p[0];
+    leds[i].g = p[1];
+    leds[i].b = p[2];
+    leds[i].padding = 0;
+  }
+
+  py::gil_scoped_release release;
+  led->SetData(leds);
+}
+
+void SetLEDDataRaw(frc::AddressableLED *led, const LEDArray &data) {
+  if (data.ndim() != 2 || data.shape(1) != 4) {
+    throw py::value_error(
+        "raw LED data must be an Nx4 array of (b, g, r, padding)");
+  }
+
+  // same layout as LEDData, so no copy is needed
+  std::span<const frc::AddressableLED::LEDData> leds{
+      reinterpret_cast<const frc::AddressableLED::LEDData *>(data.data()),
+      static_cast<size_t>(data.shape(0))};
+  py::gil_scoped_release release;
+  led->SetData(leds);
+}
+
+py::array_t<uint8_t>
+LEDDataToArray(std::span<const HAL_AddressableLEDData> data) {
+  py::array_t<uint8_t> out({static_cast<py::ssize_t>(data.size()),
+                            static_cast<py::ssize_t>(3)});
+  uint8_t *p = out.mutable_data();
+  for (auto &led : data) {
+    *p++ = led.r;
+    *p++ = led.g;
+    *p++ = led.b;
+  }
+  return out;
+}
+
+} // namespace rpy
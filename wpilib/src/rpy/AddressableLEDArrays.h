@@ -0,0 +1,31 @@
+#pragma once
+
+#include <span>
+
+#include <frc/AddressableLED.h>
+
+#include <robotpy_build.h>
+#include <pybind11/numpy.h>
+
+namespace rpy {
+
+// other dtypes and layouts are converted when the array is passed in
+using LEDArray =
+    py::array_t<uint8_t, py::array::c_style | py::array::forcecast>;
+
+//
+// These functions must be called with the GIL held
+//
+
+// data is an Nx3 array of (r, g, b), or an Nx4 array of (r, g, b, padding)
+void SetLEDDataFromArray(frc::AddressableLED *led, const LEDArray &data);
+
+// data is an Nx4 array in the HAL layout of (b, g, r, padding), which is
+// passed to the HAL without being copied first
+void SetLEDDataRaw(frc::AddressableLED *led, const LEDArray &data);
+
+// Returns an Nx3 array of (r, g, b)
+py::array_t<uint8_t>
+LEDDataToArray(std::span<const HAL_AddressableLEDData> data);
+
+} // namespace rpy
@@ -0,0 +1,323 @@
+
+#include "rpy/AsynchronousInterrupt.h"
+
+#include <algorithm>
+#include <chrono>
+#include <condition_variable>
+#include <utility>
+
+#include "frc/Errors.h"
+
+using namespace frc;
+using namespace pybind11::literals;
+
+struct InterruptDispatcher::State {
+  std::mutex mutex;
+  std::condition_variable cv;
+  bool stop = false;
+  std::thread::id threadId;
+  std::chrono::steady_clock::duration period;
+  std::vector<PyAsynchronousInterrupt *> pending;
+  int64_t dispatchCount = 0;
+};
+
+namespace {
+
+std::chrono::steady_clock::duration ToDuration(units::second_t t) {
+  return std::chrono::duration_cast<std::chrono::steady_clock::duration>(
+      std::chrono::duration<double>(t.value()));
+}
+
+} // namespace
+
+InterruptDispatcher::InterruptDispatcher(units::second_t coalescePeriod)
+    : m_state(std::make_shared<State>()) {
+  if (coalescePeriod < 0_s) {
+    throw FRC_MakeError(err::ParameterOutOfRange, "coalescePeriod {}",
+                        coalescePeriod.value());
+  }
+  m_state->period = ToDuration(coalescePeriod);
+
+  // the thread only holds the state, so that the dispatcher can be
+  // destroyed by one of its own callbacks
+  std::function<void()> target([state = m_state] {
+    py::gil_scoped_release release;
+
+    struct Batch {
+      std::shared_ptr<PyAsynchronousInterrupt::Callback> callback;
+      std::vector<PyAsynchronousInterrupt::Edge> edges;
+    };
+    std::vector<Batch> batches;
+    auto next = std::chrono::steady_clock::now();
+
+    for (;;) {
+      {
+        std::unique_lock lock{state->mutex};
+        state->threadId = std::this_thread::get_id();
+        state->cv.wait(lock,
+                       [&] { return state->stop || !state->pending.empty(); });
+        // wait out the rest of the coalesce period, so that edges that
+        // arrive in the meantime are delivered together
+        state->cv.wait_until(lock, next, [&] { return state->stop; });
+        if (state->stop) {
+          break;
+        }
+
+        for (auto interrupt : state->pending) {
+          interrupt->m_queued = false;
+          auto &batch = batches.emplace_back();
+          batch.callback = interrupt->m_callback;
+          interrupt->Drain(batch.edges);
+        }
+        state->pending.clear();
+        state->dispatchCount++;
+        next = std::chrono::steady_clock::now() + state->period;
+      }
+
+      py::gil_scoped_acquire gil;
+      for (auto &batch : batches) {
+        if (batch.edges.empty()) {
+          continue;
+        }
+        py::array_t<double> timestamps(batch.edges.size());
+        py::array_t<bool> rising(batch.edges.size());
+        auto t = timestamps.mutable_unchecked<1>();
+        auto r = rising.mutable_unchecked<1>();
+        for (size_t i = 0; i < batch.edges.size(); i++) {
+          t(i) = batch.edges[i].timestamp;
+          r(i) = batch.edges[i].rising;
+        }
+        try {
+          (*batch.callback)(std::move(timestamps), std::move(rising));
+        } catch (py::error_already_set &e) {
+          e.discard_as_unraisable("AsynchronousInterrupt callback");
+        }
+      }
+      // the callbacks must be released with the GIL held
+      batches.clear();
+    }
+
+    if (_Py_IsFinalizing()) {
+      release.disarm();
+    }
+  });
+
+  auto Thread = py::module::import("threading").attr("Thread");
+  m_thread = Thread("target"_a = target, "daemon"_a = true,
+                    "name"_a = "interrupt-dispatcher");
+  m_thread.attr("start")();
+}
+
+InterruptDispatcher::~InterruptDispatcher() {
+  std::thread::id threadId;
+  {
+    std::scoped_lock lock{m_state->mutex};
+    m_state->stop = true;
+    threadId = m_state->threadId;
+    m_state->cv.notify_all();
+  }
+  // a callback may have released the last reference
+  if (m_thread && threadId != std::this_thread::get_id()) {
+    m_thread.attr("join")();
+  }
+}
+
+std::shared_ptr<InterruptDispatcher> InterruptDispatcher::GetDefault() {
+  static std::mutex mutex;
+  static std::weak_ptr<InterruptDispatcher> instance;
+  std::scoped_lock lock{mutex};
+  auto dispatcher = instance.lock();
+  if (!dispatcher) {
+    dispatcher = std::make_shared<InterruptDispatcher>();
+    instance = dispatcher;
+  }
+  return dispatcher;
+}
+
+void InterruptDispatcher::SetCoalescePeriod(units::second_t coalescePeriod) {
+  if (coalescePeriod < 0_s) {
+    throw FRC_MakeError(err::ParameterOutOfRange, "coalescePeriod {}",
+                        coalescePeriod.value());
+  }
+  std::scoped_lock lock{m_state->mutex};
+  m_state->period = ToDuration(coalescePeriod);
+}
+
+units::second_t InterruptDispatcher::GetCoalescePeriod() {
+  std::scoped_lock lock{m_state->mutex};
+  return units::second_t{
+      std::chrono::duration<double>(m_state->period).count()};
+}
+
+int64_t InterruptDispatcher::GetDispatchCount() {
+  std::scoped_lock lock{m_state->mutex};
+  return m_state->dispatchCount;
+}
+
+void InterruptDispatcher::Notify(PyAsynchronousInterrupt *interrupt) {
+  std::scoped_lock lock{m_state->mutex};
+  if (!interrupt->m_queued) {
+    interrupt->m_queued = true;
+    m_state->pending.push_back(interrupt);
+  }
+  m_state->cv.notify_all();
+}
+
+void InterruptDispatcher::Remove(PyAsynchronousInterrupt *interrupt) {
+  std::scoped_lock lock{m_state->mutex};
+  auto &pending = m_state->pending;
+  pending.erase(std::remove(pending.begin(), pending.end(), interrupt),
+                pending.end());
+  interrupt->m_queued = false;
+}
+
+PyAsynchronousInterrupt::PyAsynchronousInterrupt(
+    DigitalSource &source,
+    std::function<void(py::array_t<double>, py::array_t<bool>)> callback,
+    std::shared_ptr<InterruptDispatcher> dispatcher, size_t capacity)
+    : PyAsynchronousInterrupt(std::make_unique<SynchronousInterrupt>(source),
+                              std::move(callback), std::move(dispatcher),
+                              capacity) {}
+
+PyAsynchronousInterrupt::PyAsynchronousInterrupt(
+    DigitalSource *source,
+    std::function<void(py::array_t<double>, py::array_t<bool>)> callback,
+    std::shared_ptr<InterruptDispatcher> dispatcher, size_t capacity)
+    : PyAsynchronousInterrupt(std::make_unique<SynchronousInterrupt>(source),
+                              std::move(callback), std::move(dispatcher),
+                              capacity) {}
+
+PyAsynchronousInterrupt::PyAsynchronousInterrupt(
+    std::shared_ptr<DigitalSource> source,
+    std::function<void(py::array_t<double>, py::array_t<bool>)> callback,
+    std::shared_ptr<InterruptDispatcher> dispatcher, size_t capacity)
+    : PyAsynchronousInterrupt(
+          std::make_unique<SynchronousInterrupt>(std::move(source)),
+          std::move(callback), std::move(dispatcher), capacity) {}
+
+PyAsynchronousInterrupt::PyAsynchronousInterrupt(
+    std::unique_ptr<SynchronousInterrupt> interrupt, Callback callback,
+    std::shared_ptr<InterruptDispatcher> dispatcher, size_t capacity)
+    : m_interrupt(std::move(interrupt)) {
+  if (!callback) {
+    throw FRC_MakeError(err::NullParameter, "callback");
+  }
+  if (capacity == 0) {
+    throw FRC_MakeError(err::ParameterOutOfRange, "capacity {}", capacity);
+  }
+  m_callback = std::make_shared<Callback>(std::move(callback));
+  m_dispatcher =
+      dispatcher ? std::move(dispatcher) : InterruptDispatcher::GetDefault();
+  m_edges.resize(capacity);
+}
+
+PyAsynchronousInterrupt::~PyAsynchronousInterrupt() {
+  Stop();
+  m_dispatcher->Remove(this);
+}
+
+void PyAsynchronousInterrupt::Start() {
+  if (m_keepRunning) {
+    return;
+  }
+  if (m_thread.joinable()) {
+    m_thread.join();
+  }
+  m_keepRunning = true;
+  m_thread = std::thread([this] { Run(); });
+}
+
+void PyAsynchronousInterrupt::Stop() {
+  m_keepRunning = false;
+  m_interrupt->WakeupWaitingInterrupt();
+  if (m_thread.joinable()) {
+    m_thread.join();
+  }
+}
+
+bool PyAsynchronousInterrupt::IsRunning() {
+  return m_keepRunning;
+}
+
+void PyAsynchronousInterrupt::SetInterruptEdges(bool risingEdge,
+                                                bool fallingEdge) {
+  m_interrupt->SetInterruptEdges(risingEdge, fallingEdge);
+}
+
+units::second_t PyAsynchronousInterrupt::GetRisingTimestamp() {
+  return m_interrupt->GetRisingTimestamp();
+}
+
+units::second_t PyAsynchronousInterrupt::GetFallingTimestamp() {
+  return m_interrupt->GetFallingTimestamp();
+}
+
+int64_t PyAsynchronousInterrupt::GetEdgeCount() {
+  std::scoped_lock lock{m_mutex};
+  return m_edgeCount;
+}
+
+int64_t PyAsynchronousInterrupt::GetDroppedCount() {
+  std::scoped_lock lock{m_mutex};
+  return m_droppedCount;
+}
+
+void PyAsynchronousInterrupt::Push(double timestamp, bool rising) {
+  size_t capacity = m_edges.size();
+  if (m_count == capacity) {
+    // discard the oldest edge
+    m_head = (m_head + 1) % capacity;
+    m_count--;
+    m_droppedCount++;
+  }
+  m_edges[(m_head + m_count) % capacity] = {timestamp, rising};
+  m_count++;
+  m_edgeCount++;
+}
+
+void PyAsynchronousInterrupt::Drain(std::vector<Edge> &edges) {
+  std::scoped_lock lock{m_mutex};
+  size_t capacity = m_edges.size();
+  for (size_t i = 0; i < m_count; i++) {
+    edges.push_back(m_edges[(m_head + i) % capacity]);
+  }
+  m_head = (m_head + m_count) % capacity;
+  m_count = 0;
+}
+
+void PyAsynchronousInterrupt::Run() {
+  while (m_keepRunning) {
+    auto result = m_interrupt->WaitForInterrupt(10_s, false);
+    if (!m_keepRunning) {
+      break;
+    }
+    bool rising = result & SynchronousInterrupt::kRisingEdge;
+    bool falling = result & SynchronousInterrupt::kFallingEdge;
+    if (!rising && !falling) {
+      continue;
+    }
+
+    {
+      std::scoped_lock lock{m_mutex};
+      double risingTime =
+          rising ? m_interrupt->GetRisingTimestamp().value() : 0;
+      double fallingTime =
+          falling ? m_interrupt->GetFallingTimestamp().value() : 0;
+      if (rising && falling && fallingTime < risingTime) {
+        Push(fallingTime, false);
+        Push(risingTime, true);
+      } else {
+        if (rising) {
+          Push(risingTime, true);
+        }
+        if (falling) {
+          Push(fallingTime, false);
+        }
+      }
+    }
+
+    // the dispatcher locks this interrupt while holding its own lock, so
+    // this must be done without holding m_mutex
+    m_dispatcher->Notify(this);
+  }
+}
@@ -0,0 +1,205 @@
+#pragma once
+
+#include <stdint.h>
+
+#include <atomic>
+#include <functional>
+#include <memory>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+#include <frc/DigitalSource.h>
+#include <frc/SynchronousInterrupt.h>
+#include <units/time.h>
+
+#include <robotpy_build.h>
+
+namespace frc {
+
+class PyAsynchronousInterrupt;
+
+/**
+ * Runs the callbacks of asynchronous interrupts.
+ *
+ * A single thread calls the callbacks of every interrupt that uses the
+ * dispatcher. Each callback receives all of the edges of its interrupt
+ * since the previous call, and callbacks are called at most once per
+ * coalesce period, so a rapidly changing input can't keep Python busy.
+ */
+class InterruptDispatcher {
+ public:
+  /**
+   * @param coalescePeriod Minimum time between rounds of callbacks. Edges
+   *                       that happen in the meantime are delivered
+   *                       together at the next round.
+   */
+  explicit InterruptDispatcher(units::second_t coalescePeriod = 0_s);
+  ~InterruptDispatcher();
+
+  InterruptDispatcher(const InterruptDispatcher &) = delete;
+  InterruptDispatcher &operator=(const InterruptDispatcher &) = delete;
+
+  /**
+   * Returns the dispatcher used by interrupts that aren't given one. It
+   * exists as long as an interrupt is using it.
+   */
+  static std::shared_ptr<InterruptDispatcher> GetDefault();
+
+  void SetCoalescePeriod(units::second_t coalescePeriod);
+
+  units::second_t GetCoalescePeriod();
+
+  /** Returns the number of rounds of callbacks that have been run */
+  int64_t GetDispatchCount();
+
+ private:
+  friend class PyAsynchronousInterrupt;
+
+  struct State;
+
+  void Notify(PyAsynchronousInterrupt *interrupt);
+  void Remove(PyAsynchronousInterrupt *interrupt);
+
+  std::shared_ptr<State> m_state;
+
+  // the thread calling the callbacks
+  py::object m_thread;
+};
+
+/**
+ * Calls a function when a digital input changes, without tying up a
+ * Python thread for each input.
+ *
+ * A native thread waits for the interrupt and records the timestamp of
+ * each edge in a ring buffer. The edges are delivered to the callback in
+ * batches by an InterruptDispatcher, as two arrays: the FPGA timestamps
+ * of the edges in seconds, and whether each edge was rising.
+ *
+ * If the ring buffer fills up before the edges are delivered, the oldest
+ * edges are discarded.
+ */
+class PyAsynchronousInterrupt {
+ public:
+  /**
+   * Construct an asynchronous interrupt from a digital source.
+   *
+   * At construction, the interrupt will trigger on the rising edge.
+   *
+   * @param source     The digital source to use
+   * @param callback   Called with the timestamps of the edges and whether
+   *                   each edge was rising
+   * @param dispatcher The dispatcher that calls the callback. If not
+   *                   specified, the default dispatcher is used
+   * @param capacity   Number of edges that can be waiting to be delivered
+   */
+  PyAsynchronousInterrupt(
+      DigitalSource &source,
+      std::function<void(py::array_t<double>, py::array_t<bool>)> callback,
+      std::shared_ptr<InterruptDispatcher> dispatcher = nullptr,
+      size_t capacity = 256);
+
+  PyAsynchronousInterrupt(
+      DigitalSource *source,
+      std::function<void(py::array_t<double>, py::array_t<bool>)> callback,
+      std::shared_ptr<InterruptDispatcher> dispatcher = nullptr,
+      size_t capacity = 256);
+
+  PyAsynchronousInterrupt(
+      std::shared_ptr<DigitalSource> source,
+      std::function<void(py::array_t<double>, py::array_t<bool>)> callback,
+      std::shared_ptr<InterruptDispatcher> dispatcher = nullptr,
+      size_t capacity = 256);
+
+  ~PyAsynchronousInterrupt();
+
+  PyAsynchronousInterrupt(const PyAsynchronousInterrupt &) = delete;
+  PyAsynchronousInterrupt &operator=(const PyAsynchronousInterrupt &) =
+      delete;
+
+  /** Starts waiting for edges */
+  void Start();
+
+  /**
+   * Stops waiting for edges. Edges that were already recorded are still
+   * delivered.
+   */
+  void Stop();
+
+  bool IsRunning();
+
+  /**
+   * Set which edges to trigger the interrupt on.
+   *
+   * @param risingEdge  Trigger on rising edge
+   * @param fallingEdge Trigger on falling edge
+   */
+  void SetInterruptEdges(bool risingEdge, bool fallingEdge);
+
+  /**
+   * Get the timestamp of the last rising edge.
+   *
+   * @return the timestamp in seconds relative to GetFPGATime
+   */
+  units::second_t GetRisingTimestamp();
+
+  /**
+   * Get the timestamp of the last falling edge.
+   *
+   * @return the timestamp in seconds relative to GetFPGATime
+   */
+  units::second_t GetFallingTimestamp();
+
+  std::shared_ptr<InterruptDispatcher> GetDispatcher() const {
+    return m_dispatcher;
+  }
+
+  /** Returns the number of edges that have been recorded */
+  int64_t GetEdgeCount();
+
+  /** Returns the number of edges discarded because the buffer was full */
+  int64_t GetDroppedCount();
+
+ private:
+  friend class InterruptDispatcher;
+
+  using Callback =
+      std::function<void(py::array_t<double>, py::array_t<bool>)>;
+
+  struct Edge {
+    double timestamp;
+    bool rising;
+  };
+
+  PyAsynchronousInterrupt(std::unique_ptr<SynchronousInterrupt> interrupt,
+                          Callback callback,
+                          std::shared_ptr<InterruptDispatcher> dispatcher,
+                          size_t capacity);
+
+  void Push(double timestamp, bool rising);
+  void Drain(std::vector<Edge> &edges);
+  void Run();
+
+  std::unique_ptr<SynchronousInterrupt> m_interrupt;
+
+  // shared with the dispatcher while a callback is running; the last
+  // reference must be released with the GIL held
+  std::shared_ptr<Callback> m_callback;
+
+  std::shared_ptr<InterruptDispatcher> m_dispatcher;
+
+  std::atomic_bool m_keepRunning{false};
+  std::thread m_thread;
+
+  std::mutex m_mutex;
+  std::vector<Edge> m_edges;
+  size_t m_head = 0;
+  size_t m_count = 0;
+  int64_t m_edgeCount = 0;
+  int64_t m_droppedCount = 0;
+
+  // guarded by the dispatcher
+  bool m_queued = false;
+};
+
+} // namespace frc
@@ -0,0 +1,44 @@
+#pragma once
+
+#include <stdint.h>
+
+#include <span>
+#include <string>
+
+#include <robotpy_build.h>
+
+namespace rpy {
+
+/**
+ * The memory of a writable, contiguous buffer of bytes (such as a
+ * bytearray or memoryview) passed to a function that reads into it.
+ *
+ * The buffer is locked until this is destroyed, so it can't be resized
+ * while the GIL is released. Must be created and destroyed with the GIL
+ * held.
+ */
+class WritableBytes {
+ public:
+  /**
+   * @param buffer The buffer
+   * @param name   Name of the parameter, used in the error message
+   */
+  explicit WritableBytes(const py::buffer &buffer,
+                         const char *name = "buffer")
+      : m_info(buffer.request(true)) {
+    if (m_info.ndim != 1 || m_info.itemsize != 1 || m_info.strides[0] != 1) {
+      throw py::value_error(std::string(name) +
+                            " must be a contiguous byte buffer");
+    }
+  }
+
+  std::span<uint8_t> Get() const {
+    return {static_cast<uint8_t *>(m_info.ptr),
+            static_cast<size_t>(m_info.size)};
+  }
+
+ private:
+  py::buffer_info m_info;
+};
+
+} // namespace rpy
@@ -0,0 +1,202 @@
+
+#include "rpy/DMAReader.h"
+
+#include <algorithm>
+#include <chrono>
+
+#include <frc/Errors.h>
+#include <frc/RobotBase.h>
+
+using namespace frc;
+
+DMAReader::DMAReader() : m_simulation(RobotBase::IsSimulation()) {}
+
+int DMAReader::AddChannel(Kind kind, const void *source) {
+  if (source == nullptr) {
+    throw FRC_MakeError(err::NullParameter, "source");
+  }
+  if (m_started) {
+    throw FRC_MakeError(err::IncompatibleState,
+                        "sensors cannot be added after the DMA is started");
+  }
+  m_channels.push_back(Channel{kind, source});
+  return m_channels.size() - 1;
+}
+
+int DMAReader::AddEncoder(const Encoder *encoder) {
+  int column = AddChannel(Kind::kEncoder, encoder);
+  m_dma.AddEncoder(encoder);
+  return column;
+}
+
+int DMAReader::AddEncoderPeriod(const Encoder *encoder) {
+  int column = AddChannel(Kind::kEncoderPeriod, encoder);
+  m_dma.AddEncoderPeriod(encoder);
+  return column;
+}
+
+int DMAReader::AddCounter(const Counter *counter) {
+  int column = AddChannel(Kind::kCounter, counter);
+  m_dma.AddCounter(counter);
+  return column;
+}
+
+int DMAReader::AddCounterPeriod(const Counter *counter) {
+  int column = AddChannel(Kind::kCounterPeriod, counter);
+  m_dma.AddCounterPeriod(counter);
+  return column;
+}
+
+int DMAReader::AddDigitalSource(const DigitalSource *digitalSource) {
+  int column = AddChannel(Kind::kDigitalSource, digitalSource);
+  m_dma.AddDigitalSource(digitalSource);
+  return column;
+}
+
+int DMAReader::AddDutyCycle(const DutyCycle *dutyCycle) {
+  int column = AddChannel(Kind::kDutyCycle, dutyCycle);
+  m_dma.AddDutyCycle(dutyCycle);
+  return column;
+}
+
+int DMAReader::AddAnalogInput(const AnalogInput *analogInput) {
+  int column = AddChannel(Kind::kAnalogInput, analogInput);
+  m_dma.AddAnalogInput(analogInput);
+  return column;
+}
+
+int DMAReader::AddAveragedAnalogInput(const AnalogInput *analogInput) {
+  int column = AddChannel(Kind::kAveragedAnalogInput, analogInput);
+  m_dma.AddAveragedAnalogInput(analogInput);
+  return column;
+}
+
+void DMAReader::SetTimedTrigger(units::second_t period) {
+  m_dma.SetTimedTrigger(period);
+}
+
+void DMAReader::SetExternalTrigger(DigitalSource *source, bool rising,
+                                   bool falling) {
+  m_dma.SetExternalTrigger(source, rising, falling);
+}
+
+void DMAReader::SetPause(bool pause) { m_dma.SetPause(pause); }
+
+void DMAReader::Start(int queueDepth) {
+  m_dma.Start(queueDepth);
+  m_started = true;
+}
+
+void DMAReader::Stop() { m_dma.Stop(); }
+
+void DMAReader::Decode(const DMASample &sample, double *out) const {
+  int32_t status = 0;
+  for (auto &channel : m_channels) {
+    switch (channel.kind) {
+      case Kind::kEncoder:
+        *out = sample.GetEncoderDistance(
+            static_cast<const Encoder *>(channel.source), &status);
+        break;
+      case Kind::kEncoderPeriod:
+        *out = sample.GetEncoderPeriodRaw(
+            static_cast<const Encoder *>(channel.source), &status);
+        break;
+      case Kind::kCounter:
+        *out = sample.GetCounter(static_cast<const Counter *>(channel.source),
+                                 &status);
+        break;
+      case Kind::kCounterPeriod:
+        *out = sample.GetCounterPeriod(
+            static_cast<const Counter *>(channel.source), &status);
+        break;
+      case Kind::kDigitalSource:
+        *out = sample.GetDigitalSource(
+            static_cast<const DigitalSource *>(channel.source), &status);
+        break;
+      case Kind::kDutyCycle:
+        *out = sample.GetDutyCycleOutput(
+            static_cast<const DutyCycle *>(channel.source), &status);
+        break;
+      case Kind::kAnalogInput:
+        *out = sample.GetAnalogInputVoltage(
+            static_cast<const AnalogInput *>(channel.source), &status);
+        break;
+      case Kind::kAveragedAnalogInput:
+        *out = sample.GetAveragedAnalogInputVoltage(
+            static_cast<const AnalogInput *>(channel.source), &status);
+        break;
+    }
+    FRC_CheckErrorStatus(status, "DMASample");
+    out++;
+  }
+}
+
+size_t DMAReader::ReadInto(std::span<uint64_t> timestamps,
+                           std::span<double> values, units::second_t timeout) {
+  size_t channels = m_channels.size();
+  size_t capacity = timestamps.size();
+  if (channels != 0) {
+    capacity = std::min(capacity, values.size() / channels);
+  }
+
+  if (m_simulation) {
+    return ReadSimInto(timestamps.first(capacity),
+                       values.first(capacity * channels), timeout);
+  }
+
+  size_t count = 0;
+  int32_t remaining = 0;
+  while (count < capacity) {
+    // only the first read waits
+    int32_t status = 0;
+    auto result =
+        m_sample.Update(&m_dma, count == 0 ? timeout : 0_s, &remaining,
+                        &status);
+    if (result == DMASample::DMAReadStatus::kTimeout) {
+      break;
+    }
+    FRC_CheckErrorStatus(status, "ReadDMA");
+    if (result != DMASample::DMAReadStatus::kOk) {
+      throw FRC_MakeError(err::IncompatibleState, "ReadDMA failed");
+    }
+
+    timestamps[count] = m_sample.GetTime();
+    Decode(m_sample, values.data() + count * channels);
+    count++;
+    if (remaining == 0) {
+      break;
+    }
+  }
+  return count;
+}
+
+size_t DMAReader::ReadSimInto(std::span<uint64_t> timestamps,
+                              std::span<double> values,
+                              units::second_t timeout) {
+  std::unique_lock lock{m_simMutex};
+  m_simCv.wait_for(lock, std::chrono::duration<double>(timeout.value()),
+                   [this] { return !m_simSamples.empty(); });
+
+  size_t channels = m_channels.size();
+  size_t count = std::min(timestamps.size(), m_simSamples.size());
+  for (size_t i = 0; i < count; i++) {
+    auto &[timestamp, sample] = m_simSamples.front();
+    timestamps[i] = timestamp;
+    std::copy(sample.begin(), sample.end(), values.begin() + i * channels);
+    m_simSamples.pop_front();
+  }
+  return count;
+}
+
+void DMAReader::AddSimSample(uint64_t timestamp,
+                             std::span<const double> values) {
+  if (values.size() != m_channels.size()) {
+    throw FRC_MakeError(err::ParameterOutOfRange,
+                        "expected {} values, got {}", m_channels.size(),
+                        values.size());
+  }
+  std::scoped_lock lock{m_simMutex};
+  m_simSamples.emplace_back(timestamp,
+                            std::vector<double>(values.begin(), values.end()));
+  m_simCv.notify_all();
+}
@@ -0,0 +1,168 @@
+#pragma once
+
+#include <stdint.h>
+
+#include <condition_variable>
+#include <deque>
+#include <mutex>
+#include <span>
+#include <vector>
+
+#include <frc/AnalogInput.h>
+#include <frc/Counter.h>
+#include <frc/DMA.h>
+#include <frc/DMASample.h>
+#include <frc/DigitalSource.h>
+#include <frc/DutyCycle.h>
+#include <frc/Encoder.h>
+#include <units/time.h>
+
+namespace frc {
+
+/**
+ * Reads DMA samples in bulk.
+ *
+ * Each sensor added to the reader is added to its DMA and becomes a column
+ * of values. ReadInto drains every pending sample at once into a buffer of
+ * timestamps and a row-major buffer of values, one row per sample.
+ *
+ * The simulated HAL doesn't implement DMA. In simulation, the samples
+ * returned by the reader are the ones added with AddSimSample.
+ */
+class DMAReader {
+ public:
+  DMAReader();
+
+  DMAReader(const DMAReader &) = delete;
+  DMAReader &operator=(const DMAReader &) = delete;
+
+  /**
+   * Adds the distance of an encoder.
+   *
+   * @return the column of the values
+   */
+  int AddEncoder(const Encoder *encoder);
+
+  /**
+   * Adds the raw period of an encoder.
+   *
+   * @return the column of the values
+   */
+  int AddEncoderPeriod(const Encoder *encoder);
+
+  /**
+   * Adds the count of a counter.
+   *
+   * @return the column of the values
+   */
+  int AddCounter(const Counter *counter);
+
+  /**
+   * Adds the raw period of a counter.
+   *
+   * @return the column of the values
+   */
+  int AddCounterPeriod(const Counter *counter);
+
+  /**
+   * Adds the value of a digital source, as 0 or 1.
+   *
+   * @return the column of the values
+   */
+  int AddDigitalSource(const DigitalSource *digitalSource);
+
+  /**
+   * Adds the output of a duty cycle input, as a fraction.
+   *
+   * @return the column of the values
+   */
+  int AddDutyCycle(const DutyCycle *dutyCycle);
+
+  /**
+   * Adds the voltage of an analog input.
+   *
+   * @return the column of the values
+   */
+  int AddAnalogInput(const AnalogInput *analogInput);
+
+  /**
+   * Adds the averaged voltage of an analog input.
+   *
+   * @return the column of the values
+   */
+  int AddAveragedAnalogInput(const AnalogInput *analogInput);
+
+  /** Returns the number of values in each sample */
+  int GetChannelCount() const { return m_channels.size(); }
+
+  /** Takes a sample periodically */
+  void SetTimedTrigger(units::second_t period);
+
+  /** Takes a sample on edges of a digital source */
+  void SetExternalTrigger(DigitalSource *source, bool rising, bool falling);
+
+  void SetPause(bool pause);
+
+  /**
+   * Starts taking samples. No more sensors can be added afterwards.
+   *
+   * @param queueDepth Number of samples that the DMA can hold
+   */
+  void Start(int queueDepth);
+
+  void Stop();
+
+  /**
+   * Reads pending samples into buffers, until the buffers are full or there
+   * are no more samples.
+   *
+   * @param timestamps FPGA timestamps of the samples, in microseconds
+   * @param values     Values of the samples, GetChannelCount() per sample
+   * @param timeout    How long to wait for the first sample
+   * @return the number of samples read
+   */
+  size_t ReadInto(std::span<uint64_t> timestamps, std::span<double> values,
+                  units::second_t timeout);
+
+  /**
+   * Adds a sample to be returned by the reader in simulation.
+   *
+   * @param timestamp FPGA timestamp of the sample, in microseconds
+   * @param values    One value per channel
+   */
+  void AddSimSample(uint64_t timestamp, std::span<const double> values);
+
+ private:
+  enum class Kind {
+    kEncoder,
+    kEncoderPeriod,
+    kCounter,
+    kCounterPeriod,
+    kDigitalSource,
+    kDutyCycle,
+    kAnalogInput,
+    kAveragedAnalogInput,
+  };
+
+  struct Channel {
+    Kind kind;
+    const void *source;
+  };
+
+  int AddChannel(Kind kind, const void *source);
+  void Decode(const DMASample &sample, double *out) const;
+  size_t ReadSimInto(std::span<uint64_t> timestamps, std::span<double> values,
+                     units::second_t timeout);
+
+  DMA m_dma;
+  DMASample m_sample;
+  std::vector<Channel> m_channels;
+  bool m_started = false;
+  bool m_simulation;
+
+  std::mutex m_simMutex;
+  std::condition_variable m_simCv;
+  std::deque<std::pair<uint64_t, std::vector<double>>> m_simSamples;
+};
+
+} // namespace frc
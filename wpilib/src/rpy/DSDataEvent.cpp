@@ -0,0 +1,42 @@
+
+#include "rpy/DSDataEvent.h"
+
+#include <frc/DriverStation.h>
+#include <frc/RobotController.h>
+#include <hal/DriverStation.h>
+
+using namespace frc;
+
+DSDataEvent::DSDataEvent(bool refreshed)
+    : m_event(wpi::CreateEvent(false, false)), m_refreshed(refreshed) {
+  if (m_refreshed) {
+    DriverStation::ProvideRefreshedDataEventHandle(m_event);
+  } else {
+    HAL_ProvideNewDataEventHandle(m_event);
+  }
+}
+
+DSDataEvent::~DSDataEvent() {
+  if (m_refreshed) {
+    DriverStation::RemoveRefreshedDataEventHandle(m_event);
+  } else {
+    HAL_RemoveNewDataEventHandle(m_event);
+  }
+  wpi::DestroyEvent(m_event);
+}
+
+bool DSDataEvent::Wait(std::optional<units::second_t> timeout) {
+  bool signaled;
+  if (timeout) {
+    bool timedOut = false;
+    signaled = wpi::WaitForObject(m_event, timeout->value(), &timedOut);
+  } else {
+    signaled = wpi::WaitForObject(m_event);
+  }
+  if (signaled) {
+    m_lastWake = RobotController::GetFPGATime();
+  }
+  return signaled;
+}
+
+void DSDataEvent::Set() { wpi::SetEvent(m_event); }
@@ -0,0 +1,59 @@
+#pragma once
+
+#include <stdint.h>
+
+#include <atomic>
+#include <optional>
+
+#include <units/time.h>
+#include <wpi/Synchronization.h>
+
+namespace frc {
+
+/**
+ * An event that is set when the driver station sends new data, which can
+ * be waited on instead of polling.
+ *
+ * By default the event is set when a new driver station packet arrives.
+ * If refreshed is true, it is set each time DriverStation::RefreshData
+ * is called instead (at the start of each robot loop).
+ */
+class DSDataEvent {
+ public:
+  explicit DSDataEvent(bool refreshed = false);
+  ~DSDataEvent();
+
+  DSDataEvent(const DSDataEvent &) = delete;
+  DSDataEvent &operator=(const DSDataEvent &) = delete;
+
+  /**
+   * Waits for the event to be set, and resets it.
+   *
+   * @param timeout maximum time to wait, or None to wait forever
+   * @return true if the event was set, false if the timeout expired
+   */
+  bool Wait(std::optional<units::second_t> timeout = std::nullopt);
+
+  /**
+   * Sets the event, which wakes up a waiting thread. This can be used to
+   * cancel a wait.
+   */
+  void Set();
+
+  /**
+   * Returns the FPGA time (in microseconds) at which the last successful
+   * Wait returned, or 0 if it never has. This is the time at which the
+   * data arrived, give or take the thread wakeup time.
+   */
+  int64_t GetLastWakeTime() const { return m_lastWake; }
+
+  /** Returns the underlying event handle */
+  WPI_EventHandle GetHandle() const { return m_event; }
+
+ private:
+  WPI_EventHandle m_event;
+  bool m_refreshed;
+  std::atomic<int64_t> m_lastWake{0};
+};
+
+} // namespace frc
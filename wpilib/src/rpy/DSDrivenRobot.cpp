@@ -0,0 +1,78 @@
+
+#include "rpy/DSDrivenRobot.h"
+
+#include <cstdio>
+
+#include <frc/RobotController.h>
+#include <hal/DriverStation.h>
+
+using namespace frc;
+
+DSDrivenRobot::DSDrivenRobot(units::second_t timeout)
+    : IterativeRobotBase(timeout) {}
+
+DSDrivenRobot::~DSDrivenRobot() {}
+
+void DSDrivenRobot::StartCompetition() {
+  RobotInit();
+
+  if constexpr (IsSimulation()) {
+    SimulationInit();
+  }
+
+  // Tell the DS that the robot is ready to be enabled
+  std::puts("\n********** Robot program startup complete **********");
+  HAL_ObserveUserProgramStarting();
+
+  while (!m_exit) {
+    bool packet = m_event.Wait(GetPeriod());
+    if (m_exit) {
+      break;
+    }
+
+    int64_t start =
+        packet ? m_event.GetLastWakeTime() : RobotController::GetFPGATime();
+    LoopFunc();
+    int64_t latency = RobotController::GetFPGATime() - start;
+
+    if (packet) {
+      m_packetLoops++;
+    } else {
+      m_timeoutLoops++;
+    }
+    m_lastLatency = latency;
+    m_totalLatency += latency;
+    int64_t max = m_maxLatency;
+    while (latency > max && !m_maxLatency.compare_exchange_weak(max, latency)) {
+    }
+  }
+}
+
+void DSDrivenRobot::EndCompetition() {
+  m_exit = true;
+  m_event.Set();
+}
+
+units::second_t DSDrivenRobot::GetLastLatency() const {
+  return units::microsecond_t{static_cast<double>(m_lastLatency)};
+}
+
+units::second_t DSDrivenRobot::GetAverageLatency() const {
+  int64_t loops = m_packetLoops + m_timeoutLoops;
+  if (loops == 0) {
+    return 0_s;
+  }
+  return units::microsecond_t{static_cast<double>(m_totalLatency) / loops};
+}
+
+units::second_t DSDrivenRobot::GetMaxLatency() const {
+  return units::microsecond_t{static_cast<double>(m_maxLatency)};
+}
+
+void DSDrivenRobot::ResetLatencyStats() {
+  m_packetLoops = 0;
+  m_timeoutLoops = 0;
+  m_lastLatency = 0;
+  m_maxLatency = 0;
+  m_totalLatency = 0;
+}
@@ -0,0 +1,82 @@
+#pragma once
+
+#include <stdint.h>
+
+#include <atomic>
+
+#include <frc/IterativeRobotBase.h>
+#include <units/time.h>
+
+#include "rpy/DSDataEvent.h"
+
+namespace frc {
+
+/**
+ * DSDrivenRobot implements the IterativeRobotBase robot program framework,
+ * but runs the loop each time a new driver station packet arrives instead
+ * of on a fixed timer.
+ *
+ * Running the loop right after the packet arrives means that joystick
+ * inputs are at most one loop old when outputs are set, instead of up to
+ * one extra period when a fixed timer drifts against the driver station
+ * packets. If no packet arrives within the timeout (for example, when no
+ * driver station is connected), the loop runs anyway.
+ *
+ * The time from each wakeup to the end of the loop (when outputs have
+ * been set) is measured, and is available from GetLastLatency,
+ * GetAverageLatency and GetMaxLatency.
+ */
+class DSDrivenRobot : public IterativeRobotBase {
+ public:
+  static constexpr auto kDefaultTimeout = 30_ms;
+
+  /**
+   * Constructor for DSDrivenRobot.
+   *
+   * @param timeout Time to wait for a driver station packet before running
+   *                the loop anyway. This is also the loop overrun period.
+   */
+  explicit DSDrivenRobot(units::second_t timeout = kDefaultTimeout);
+
+  ~DSDrivenRobot() override;
+
+  /**
+   * Provide an alternate "main loop" via StartCompetition().
+   */
+  void StartCompetition() override;
+
+  /**
+   * Ends the main loop in StartCompetition().
+   */
+  void EndCompetition() override;
+
+  /** Time from the last wakeup to the end of that loop */
+  units::second_t GetLastLatency() const;
+
+  /** Average time from wakeup to the end of the loop */
+  units::second_t GetAverageLatency() const;
+
+  /** Maximum time from wakeup to the end of the loop */
+  units::second_t GetMaxLatency() const;
+
+  /** Number of loops started by a driver station packet */
+  int64_t GetPacketLoopCount() const { return m_packetLoops; }
+
+  /** Number of loops started because the timeout expired */
+  int64_t GetTimeoutLoopCount() const { return m_timeoutLoops; }
+
+  /** Resets the latency measurements and loop counts */
+  void ResetLatencyStats();
+
+ private:
+  DSDataEvent m_event;
+  std::atomic_bool m_exit{false};
+
+  std::atomic<int64_t> m_packetLoops{0};
+  std::atomic<int64_t> m_timeoutLoops{0};
+  std::atomic<int64_t> m_lastLatency{0};
+  std::atomic<int64_t> m_maxLatency{0};
+  std::atomic<int64_t> m_totalLatency{0};
+};
+
+} // namespace frc
@@ -0,0 +1,211 @@
+
+#include "rpy/DataLogEntries.h"
+
+#include <span>
+
+#include <frc/DataLogManager.h>
+
+using namespace frc;
+
+namespace {
+
+// Validates the timestamps for a batch of n records, returns nullptr if
+// the current time should be used for every record
+const int64_t *
+CheckTimestamps(const std::optional<DataLogArray<int64_t>> &timestamps,
+                py::ssize_t n) {
+  if (!timestamps) {
+    return nullptr;
+  }
+  if (timestamps->ndim() != 1 || timestamps->shape(0) != n) {
+    throw py::value_error("timestamps must be a 1D array with one element "
+                          "per record");
+  }
+  return timestamps->data();
+}
+
+template <typename Entry, typename T>
+void AppendScalars(Entry &entry, const DataLogArray<T> &values,
+                   const std::optional<DataLogArray<int64_t>> &timestamps) {
+  if (values.ndim() != 1) {
+    throw py::value_error("values must be a 1D array");
+  }
+  py::ssize_t n = values.shape(0);
+  const T *v = values.data();
+  const int64_t *ts = CheckTimestamps(timestamps, n);
+
+  py::gil_scoped_release release;
+  for (py::ssize_t i = 0; i < n; i++) {
+    entry.Append(v[i], ts ? ts[i] : 0);
+  }
+}
+
+template <typename Entry, typename T>
+void AppendRows(Entry &entry, const DataLogArray<T> &values,
+                const std::optional<DataLogArray<int64_t>> &timestamps) {
+  if (values.ndim() != 2) {
+    throw py::value_error("values must be a 2D array with one row per record");
+  }
+  py::ssize_t n = values.shape(0);
+  size_t width = values.shape(1);
+  const T *v = values.data();
+  const int64_t *ts = CheckTimestamps(timestamps, n);
+
+  py::gil_scoped_release release;
+  for (py::ssize_t i = 0; i < n; i++) {
+    entry.Append(std::span<const T>{v + i * width, width}, ts ? ts[i] : 0);
+  }
+}
+
+} // namespace
+
+//
+// DataLogBooleanEntry
+//
+
+DataLogBooleanEntry::DataLogBooleanEntry(std::string_view name,
+                                         std::string_view metadata)
+    : m_entry(DataLogManager::GetLog(), name, metadata) {}
+
+DataLogBooleanEntry::DataLogBooleanEntry(wpi::log::DataLog &log,
+                                         std::string_view name,
+                                         std::string_view metadata)
+    : m_entry(log, name, metadata) {}
+
+void DataLogBooleanEntry::Append(bool value, std::optional<int64_t> timestamp) {
+  m_entry.Append(value, timestamp.value_or(0));
+}
+
+void DataLogBooleanEntry::AppendMany(
+    const DataLogArray<bool> &values,
+    const std::optional<DataLogArray<int64_t>> &timestamps) {
+  AppendScalars(m_entry, values, timestamps);
+}
+
+void DataLogBooleanEntry::Finish(std::optional<int64_t> timestamp) {
+  m_entry.Finish(timestamp.value_or(0));
+}
+
+//
+// DataLogIntegerEntry
+//
+
+DataLogIntegerEntry::DataLogIntegerEntry(std::string_view name,
+                                         std::string_view metadata)
+    : m_entry(DataLogManager::GetLog(), name, metadata) {}
+
+DataLogIntegerEntry::DataLogIntegerEntry(wpi::log::DataLog &log,
+                                         std::string_view name,
+                                         std::string_view metadata)
+    : m_entry(log, name, metadata) {}
+
+void DataLogIntegerEntry::Append(int64_t value,
+                                 std::optional<int64_t> timestamp) {
+  m_entry.Append(value, timestamp.value_or(0));
+}
+
+void DataLogIntegerEntry::AppendMany(
+    const DataLogArray<int64_t> &values,
+    const std::optional<DataLogArray<int64_t>> &timestamps) {
+  AppendScalars(m_entry, values, timestamps);
+}
+
+void DataLogIntegerEntry::Finish(std::optional<int64_t> timestamp) {
+  m_entry.Finish(timestamp.value_or(0));
+}
+
+//
+// DataLogDoubleEntry
+//
+
+DataLogDoubleEntry::DataLogDoubleEntry(std::string_view name,
+                                       std::string_view metadata)
+    : m_entry(DataLogManager::GetLog(), name, metadata) {}
+
+DataLogDoubleEntry::DataLogDoubleEntry(wpi::log::DataLog &log,
+                                       std::string_view name,
+                                       std::string_view metadata)
+    : m_entry(log, name, metadata) {}
+
+void DataLogDoubleEntry::Append(double value, std::optional<int64_t> timestamp) {
+  m_entry.Append(value, timestamp.value_or(0));
+}
+
+void DataLogDoubleEntry::AppendMany(
+    const DataLogArray<double> &values,
+    const std::optional<DataLogArray<int64_t>> &timestamps) {
+  AppendScalars(m_entry, values, timestamps);
+}
+
+void DataLogDoubleEntry::Finish(std::optional<int64_t> timestamp) {
+  m_entry.Finish(timestamp.value_or(0));
+}
+
+//
+// DataLogDoubleArrayEntry
+//
+
+DataLogDoubleArrayEntry::DataLogDoubleArrayEntry(std::string_view name,
+                                                 std::string_view metadata)
+    : m_entry(DataLogManager::GetLog(), name, metadata) {}
+
+DataLogDoubleArrayEntry::DataLogDoubleArrayEntry(wpi::log::DataLog &log,
+                                                 std::string_view name,
+                                                 std::string_view metadata)
+    : m_entry(log, name, metadata) {}
+
+void DataLogDoubleArrayEntry::Append(const DataLogArray<double> &value,
+                                     std::optional<int64_t> timestamp) {
+  if (value.ndim() != 1) {
+    throw py::value_error("value must be a 1D array");
+  }
+  m_entry.Append(std::span<const double>{value.data(),
+                                         static_cast<size_t>(value.size())},
+                 timestamp.value_or(0));
+}
+
+void DataLogDoubleArrayEntry::AppendMany(
+    const DataLogArray<double> &values,
+    const std::optional<DataLogArray<int64_t>> &timestamps) {
+  AppendRows(m_entry, values, timestamps);
+}
+
+void DataLogDoubleArrayEntry::Finish(std::optional<int64_t> timestamp) {
+  m_entry.Finish(timestamp.value_or(0));
+}
+
+//
+// DataLogRawEntry
+//
+
+DataLogRawEntry::DataLogRawEntry(std::string_view name,
+                                 std::string_view metadata,
+                                 std::string_view type)
+    : m_entry(DataLogManager::GetLog(), name, metadata, type) {}
+
+DataLogRawEntry::DataLogRawEntry(wpi::log::DataLog &log, std::string_view name,
+                                 std::string_view metadata,
+                                 std::string_view type)
+    : m_entry(log, name, metadata, type) {}
+
+void DataLogRawEntry::Append(py::buffer value,
+                             std::optional<int64_t> timestamp) {
+  auto info = value.request();
+  if (info.ndim != 1 || info.itemsize != 1 || info.strides[0] != 1) {
+    throw py::value_error("value must be a contiguous buffer of bytes");
+  }
+  m_entry.Append(std::span<const uint8_t>{
+                     static_cast<const uint8_t *>(info.ptr),
+                     static_cast<size_t>(info.size)},
+                 timestamp.value_or(0));
+}
+
+void DataLogRawEntry::AppendMany(
+    const DataLogArray<uint8_t> &values,
+    const std::optional<DataLogArray<int64_t>> &timestamps) {
+  AppendRows(m_entry, values, timestamps);
+}
+
+void DataLogRawEntry::Finish(std::optional<int64_t> timestamp) {
+  m_entry.Finish(timestamp.value_or(0));
+}
@@ -0,0 +1,234 @@
+
+#pragma once
+
+#include <stdint.h>
+
+#include <optional>
+#include <string_view>
+
+#include <wpi/DataLog.h>
+
+#include <robotpy_build.h>
+#include <pybind11/numpy.h>
+#include <pybind11/stl.h>
+
+namespace frc {
+
+template <typename T>
+using DataLogArray = py::array_t<T, py::array::c_style | py::array::forcecast>;
+
+/**
+ * Log entry for boolean values.
+ *
+ * Timestamps are in microseconds; a timestamp of None or 0 indicates that
+ * the current time should be used.
+ */
+class DataLogBooleanEntry {
+ public:
+  /**
+   * Creates an entry in the log started by DataLogManager.
+   */
+  explicit DataLogBooleanEntry(std::string_view name,
+                               std::string_view metadata = {});
+  DataLogBooleanEntry(wpi::log::DataLog &log, std::string_view name,
+                      std::string_view metadata = {});
+
+  /**
+   * Appends a record to the log.
+   */
+  void Append(bool value, std::optional<int64_t> timestamp = std::nullopt);
+
+  /**
+   * Appends one record for each element of values. The GIL is released
+   * while the records are written.
+   *
+   * @param values     1D array of values
+   * @param timestamps 1D array of int64 timestamps, same length as values,
+   *                   or None to use the current time for every record
+   */
+  void AppendMany(const DataLogArray<bool> &values,
+                  const std::optional<DataLogArray<int64_t>> &timestamps =
+                      std::nullopt);
+
+  /**
+   * Finishes the entry.
+   */
+  void Finish(std::optional<int64_t> timestamp = std::nullopt);
+
+ private:
+  wpi::log::BooleanLogEntry m_entry;
+};
+
+/**
+ * Log entry for integer values.
+ *
+ * Timestamps are in microseconds; a timestamp of None or 0 indicates that
+ * the current time should be used.
+ */
+class DataLogIntegerEntry {
+ public:
+  /**
+   * Creates an entry in the log started by DataLogManager.
+   */
+  explicit DataLogIntegerEntry(std::string_view name,
+                               std::string_view metadata = {});
+  DataLogIntegerEntry(wpi::log::DataLog &log, std::string_view name,
+                      std::string_view metadata = {});
+
+  /**
+   * Appends a record to the log.
+   */
+  void Append(int64_t value, std::optional<int64_t> timestamp = std::nullopt);
+
+  /**
+   * Appends one record for each element of values. The GIL is released
+   * while the records are written.
+   *
+   * @param values     1D array of values
+   * @param timestamps 1D array of int64 timestamps, same length as values,
+   *                   or None to use the current time for every record
+   */
+  void AppendMany(const DataLogArray<int64_t> &values,
+                  const std::optional<DataLogArray<int64_t>> &timestamps =
+                      std::nullopt);
+
+  /**
+   * Finishes the entry.
+   */
+  void Finish(std::optional<int64_t> timestamp = std::nullopt);
+
+ private:
+  wpi::log::IntegerLogEntry m_entry;
+};
+
+/**
+ * Log entry for double values.
+ *
+ * Timestamps are in microseconds; a timestamp of None or 0 indicates that
+ * the current time should be used.
+ */
+class DataLogDoubleEntry {
+ public:
+  /**
+   * Creates an entry in the log started by DataLogManager.
+   */
+  explicit DataLogDoubleEntry(std::string_view name,
+                              std::string_view metadata = {});
+  DataLogDoubleEntry(wpi::log::DataLog &log, std::string_view name,
+                     std::string_view metadata = {});
+
+  /**
+   * Appends a record to the log.
+   */
+  void Append(double value, std::optional<int64_t> timestamp = std::nullopt);
+
+  /**
+   * Appends one record for each element of values. The GIL is released
+   * while the records are written.
+   *
+   * @param values     1D array of values
+   * @param timestamps 1D array of int64 timestamps, same length as values,
+   *                   or None to use the current time for every record
+   */
+  void AppendMany(const DataLogArray<double> &values,
+                  const std::optional<DataLogArray<int64_t>> &timestamps =
+                      std::nullopt);
+
+  /**
+   * Finishes the entry.
+   */
+  void Finish(std::optional<int64_t> timestamp = std::nullopt);
+
+ private:
+  wpi::log::DoubleLogEntry m_entry;
+};
+
+/**
+ * Log entry for arrays of double values.
+ *
+ * Timestamps are in microseconds; a timestamp of None or 0 indicates that
+ * the current time should be used.
+ */
+class DataLogDoubleArrayEntry {
+ public:
+  /**
+   * Creates an entry in the log started by DataLogManager.
+   */
+  explicit DataLogDoubleArrayEntry(std::string_view name,
+                                   std::string_view metadata = {});
+  DataLogDoubleArrayEntry(wpi::log::DataLog &log, std::string_view name,
+                          std::string_view metadata = {});
+
+  /**
+   * Appends a record to the log.
+   */
+  void Append(const DataLogArray<double> &value,
+              std::optional<int64_t> timestamp = std::nullopt);
+
+  /**
+   * Appends one record for each row of values. The GIL is released while
+   * the records are written.
+   *
+   * @param values     2D array, each row is one record
+   * @param timestamps 1D array of int64 timestamps, one per row, or None to
+   *                   use the current time for every record
+   */
+  void AppendMany(const DataLogArray<double> &values,
+                  const std::optional<DataLogArray<int64_t>> &timestamps =
+                      std::nullopt);
+
+  /**
+   * Finishes the entry.
+   */
+  void Finish(std::optional<int64_t> timestamp = std::nullopt);
+
+ private:
+  wpi::log::DoubleArrayLogEntry m_entry;
+};
+
+/**
+ * Log entry for raw bytes.
+ *
+ * Timestamps are in microseconds; a timestamp of None or 0 indicates that
+ * the current time should be used.
+ */
+class DataLogRawEntry {
+ public:
+  /**
+   * Creates an entry in the log started by DataLogManager.
+   */
+  explicit DataLogRawEntry(std::string_view name,
+                           std::string_view metadata = {},
+                           std::string_view type = "raw");
+  DataLogRawEntry(wpi::log::DataLog &log, std::string_view name,
+                  std::string_view metadata = {},
+                  std::string_view type = "raw");
+
+  /**
+   * Appends a record to the log.
+   */
+  void Append(py::buffer value,
+              std::optional<int64_t> timestamp = std::nullopt);
+
+  /**
+   * Appends one record for each row of values. The GIL is released while
+   * the records are written.
+   *
+   * @param values     2D uint8 array, each row is one record
+   * @param timestamps 1D array of int64 timestamps, one per row, or None to
+   *                   use the current time for every record
+   */
+  void AppendMany(const DataLogArray<uint8_t> &values,
+                  const std::optional<DataLogArray<int64_t>> &timestamps =
+                      std::nullopt);
+
+  /**
+   * Finishes the entry.
+   */
+  void Finish(std::optional<int64_t> timestamp = std::nullopt);
+
+ private:
+  wpi::log::RawLogEntry m_entry;
+};
+
+} // namespace frc
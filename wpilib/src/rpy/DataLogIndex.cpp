@@ -0,0 +1,222 @@
+
+#include "rpy/DataLogIndex.h"
+
+#include <stdint.h>
+#include <string.h>
+
+#include <string>
+#include <string_view>
+#include <vector>
+
+namespace rpy {
+
+namespace {
+
+// entry IDs are allocated sequentially by DataLog, anything larger than
+// this is ignored to bound the size of the lookup table
+constexpr uint32_t kMaxEntryId = 1 << 24;
+
+struct Slot {
+  uint32_t id;
+  std::string name;
+  std::string type;
+  std::string metadata;
+  int64_t timestamp;
+  uint64_t count = 0;
+};
+
+uint64_t ReadInt(const uint8_t *p, size_t len) {
+  uint64_t v = 0;
+  for (size_t i = 0; i < len; i++) {
+    v |= static_cast<uint64_t>(p[i]) << (i * 8);
+  }
+  return v;
+}
+
+bool ReadString(const uint8_t *&p, const uint8_t *end, std::string &out) {
+  if (end - p < 4) {
+    return false;
+  }
+  uint64_t len = ReadInt(p, 4);
+  p += 4;
+  if (static_cast<uint64_t>(end - p) < len) {
+    return false;
+  }
+  out.assign(reinterpret_cast<const char *>(p), len);
+  p += len;
+  return true;
+}
+
+// Calls fn(slot, offset, size, timestamp) for each data record that belongs
+// to a started entry. Slots are created/updated from control records.
+template <typename F>
+void ScanRecords(const uint8_t *data, size_t size, size_t pos,
+                 std::vector<Slot> &slots, F &&fn) {
+  // entry id -> slot, or -1 if not started
+  std::vector<int64_t> active;
+
+  while (pos < size) {
+    uint8_t hdr = data[pos];
+    size_t idLen = (hdr & 0x3) + 1;
+    size_t sizeLen = ((hdr >> 2) & 0x3) + 1;
+    size_t tsLen = ((hdr >> 4) & 0x7) + 1;
+    size_t headerLen = 1 + idLen + sizeLen + tsLen;
+    if (size - pos < headerLen) {
+      break;
+    }
+
+    const uint8_t *p = data + pos + 1;
+    uint32_t id = ReadInt(p, idLen);
+    p += idLen;
+    uint64_t payloadSize = ReadInt(p, sizeLen);
+    p += sizeLen;
+    int64_t timestamp = ReadInt(p, tsLen);
+    p += tsLen;
+
+    uint64_t payloadOffset = pos + headerLen;
+    if (size - payloadOffset < payloadSize) {
+      // truncated record at the end of the file
+      break;
+    }
+    pos = payloadOffset + payloadSize;
+
+    if (id != 0) {
+      if (id < active.size() && active[id] >= 0) {
+        fn(static_cast<size_t>(active[id]), payloadOffset,
+           static_cast<uint32_t>(payloadSize), timestamp);
+      }
+      continue;
+    }
+
+    // control record
+    const uint8_t *end = p + payloadSize;
+    if (payloadSize < 5) {
+      continue;
+    }
+    uint8_t control = p[0];
+    uint32_t entry = ReadInt(p + 1, 4);
+    p += 5;
+
+    if (control == 0) {
+      if (entry > kMaxEntryId) {
+        continue;
+      }
+      Slot slot{entry};
+      slot.timestamp = timestamp;
+      if (!ReadString(p, end, slot.name) || !ReadString(p, end, slot.type) ||
+          !ReadString(p, end, slot.metadata)) {
+        continue;
+      }
+      if (entry >= active.size()) {
+        active.resize(entry + 1, -1);
+      }
+      if (active[entry] >= 0) {
+        // a Start for an entry that is already started with the same name
+        // and type restates it (as the segments of a rotated log do), so
+        // it continues the existing slot
+        auto &existing = slots[active[entry]];
+        if (existing.name == slot.name && existing.type == slot.type) {
+          existing.metadata = std::move(slot.metadata);
+          continue;
+        }
+      }
+      active[entry] = static_cast<int64_t>(slots.size());
+      slots.emplace_back(std::move(slot));
+    } else if (control == 1) {
+      if (entry < active.size()) {
+        active[entry] = -1;
+      }
+    } else if (control == 2) {
+      if (entry < active.size() && active[entry] >= 0) {
+        ReadString(p, end, slots[active[entry]].metadata);
+      }
+    }
+  }
+}
+
+} // namespace
+
+py::tuple IndexDataLog(py::buffer buffer) {
+  auto info = buffer.request();
+  if (info.itemsize != 1 || info.ndim != 1) {
+    throw py::value_error("data must be a buffer of bytes");
+  }
+  const uint8_t *data = static_cast<const uint8_t *>(info.ptr);
+  size_t size = info.size;
+
+  // header: "WPILOG", uint16 version, uint32 extra header length, header
+  if (size < 12 || memcmp(data, "WPILOG", 6) != 0) {
+    throw py::value_error("not a wpilog file");
+  }
+  uint16_t version = ReadInt(data + 6, 2);
+  if (version < 0x0100) {
+    throw py::value_error("unsupported wpilog version");
+  }
+  size_t start = 12 + ReadInt(data + 8, 4);
+  if (start > size) {
+    throw py::value_error("truncated wpilog header");
+  }
+
+  std::vector<Slot> slots;
+  uint64_t total = 0;
+
+  // first pass: count records per slot
+  {
+    py::gil_scoped_release release;
+    ScanRecords(data, size, start, slots,
+                [&](size_t slot, uint64_t, uint32_t, int64_t) {
+                  slots[slot].count++;
+                  total++;
+                });
+  }
+
+  py::array_t<uint64_t> slotStarts(slots.size());
+  py::array_t<uint64_t> slotCounts(slots.size());
+  py::array_t<uint64_t> offsets(total);
+  py::array_t<int64_t> timestamps(total);
+  py::array_t<uint32_t> sizes(total);
+
+  {
+    uint64_t *pStarts = slotStarts.mutable_data();
+    uint64_t *pCounts = slotCounts.mutable_data();
+    uint64_t *pOffsets = offsets.mutable_data();
+    int64_t *pTimestamps = timestamps.mutable_data();
+    uint32_t *pSizes = sizes.mutable_data();
+
+    py::gil_scoped_release release;
+
+    std::vector<uint64_t> next(slots.size());
+    uint64_t index = 0;
+    for (size_t i = 0; i < slots.size(); i++) {
+      pStarts[i] = index;
+      pCounts[i] = slots[i].count;
+      next[i] = index;
+      index += slots[i].count;
+    }
+
+    // second pass: fill in the records grouped by slot. The control records
+    // are replayed in the same order, so slots get the same indices.
+    std::vector<Slot> replay;
+    ScanRecords(data, size, start, replay,
+                [&](size_t slot, uint64_t offset, uint32_t payloadSize,
+                    int64_t timestamp) {
+                  uint64_t i = next[slot]++;
+                  pOffsets[i] = offset;
+                  pTimestamps[i] = timestamp;
+                  pSizes[i] = payloadSize;
+                });
+  }
+
+  py::list entries;
+  for (auto &slot : slots) {
+    // strings are returned as bytes, they are not guaranteed to be UTF-8
+    entries.append(py::make_tuple(slot.id, py::bytes(slot.name),
+                                  py::bytes(slot.type), py::bytes(slot.metadata),
+                                  slot.timestamp));
+  }
+
+  return py::make_tuple(entries, slotStarts, slotCounts, offsets, timestamps,
+                        sizes);
+}
+
+} // namespace rpy
@@ -0,0 +1,32 @@
+
+#pragma once
+
+#include <robotpy_build.h>
+#include <pybind11/numpy.h>
+
+namespace rpy {
+
+/**
+ * Scans the records of a .wpilog file and groups the data records by entry.
+ *
+ * Each Start control record creates a new entry slot, so an entry ID that is
+ * reused after being finished gets a separate slot. A Start record for an
+ * entry that is already started with the same name and type (such as those
+ * at the beginning of each segment of a rotated log) continues the existing
+ * slot instead.
+ *
+ * Returns a tuple of:
+ *
+ * - list of (id, name, type, metadata, start timestamp) for each slot; the
+ *   strings are returned as bytes
+ * - uint64 array: index of the first record of each slot
+ * - uint64 array: number of records in each slot
+ * - uint64 array: payload offset of each record, grouped by slot
+ * - int64 array: timestamp of each record, grouped by slot
+ * - uint32 array: payload size of each record, grouped by slot
+ *
+ * Must be called with the GIL held; it is released while scanning.
+ */
+py::tuple IndexDataLog(py::buffer data);
+
+} // namespace rpy
@@ -0,0 +1,150 @@
+
+#include "rpy/DriveIKArrays.h"
+
+#include <array>
+#include <vector>
+
+#include <frc/MathUtil.h>
+#include <frc/drive/DifferentialDrive.h>
+#include <frc/drive/MecanumDrive.h>
+
+namespace rpy {
+
+namespace {
+
+using IKArray =
+    py::array_t<double, py::array::c_style | py::array::forcecast>;
+
+template <size_t N>
+std::array<IKArray, N> Broadcast(std::array<py::object, N> args) {
+  py::tuple t(N);
+  for (size_t i = 0; i < N; i++) {
+    t[i] = std::move(args[i]);
+  }
+  py::sequence arrays =
+      py::module_::import("numpy").attr("broadcast_arrays")(*t);
+
+  std::array<IKArray, N> out;
+  for (size_t i = 0; i < N; i++) {
+    out[i] = arrays[i].cast<IKArray>();
+  }
+  return out;
+}
+
+py::array_t<double> Like(const IKArray &a) {
+  return py::array_t<double>(
+      std::vector<py::ssize_t>(a.shape(), a.shape() + a.ndim()));
+}
+
+// Calls fn(a, b, &out1, &out2) for each element, with the GIL released
+template <typename F>
+py::tuple Map2(py::object a, py::object b, F fn) {
+  auto [ia, ib] = Broadcast<2>({std::move(a), std::move(b)});
+  auto o1 = Like(ia);
+  auto o2 = Like(ia);
+
+  const double *pa = ia.data();
+  const double *pb = ib.data();
+  double *p1 = o1.mutable_data();
+  double *p2 = o2.mutable_data();
+  py::ssize_t n = ia.size();
+  {
+    py::gil_scoped_release release;
+    for (py::ssize_t i = 0; i < n; i++) {
+      fn(pa[i], pb[i], p1 + i, p2 + i);
+    }
+  }
+  return py::make_tuple(o1, o2);
+}
+
+} // namespace
+
+py::tuple ArcadeDriveIKArray(py::object xSpeed, py::object zRotation,
+                             bool squareInputs,
+                             std::optional<double> deadband) {
+  return Map2(std::move(xSpeed), std::move(zRotation),
+              [&](double x, double z, double *left, double *right) {
+                if (deadband) {
+                  x = frc::ApplyDeadband(x, *deadband);
+                  z = frc::ApplyDeadband(z, *deadband);
+                }
+                auto speeds =
+                    frc::DifferentialDrive::ArcadeDriveIK(x, z, squareInputs);
+                *left = speeds.left;
+                *right = speeds.right;
+              });
+}
+
+py::tuple CurvatureDriveIKArray(py::object xSpeed, py::object zRotation,
+                                bool allowTurnInPlace,
+                                std::optional<double> deadband) {
+  return Map2(std::move(xSpeed), std::move(zRotation),
+              [&](double x, double z, double *left, double *right) {
+                if (deadband) {
+                  x = frc::ApplyDeadband(x, *deadband);
+                  z = frc::ApplyDeadband(z, *deadband);
+                }
+                auto speeds = frc::DifferentialDrive::CurvatureDriveIK(
+                    x, z, allowTurnInPlace);
+                *left = speeds.left;
+                *right = speeds.right;
+              });
+}
+
+py::tuple TankDriveIKArray(py::object leftSpeed, py::object rightSpeed,
+                           bool squareInputs, std::optional<double> deadband) {
+  return Map2(std::move(leftSpeed), std::move(rightSpeed),
+              [&](double l, double r, double *left, double *right) {
+                if (deadband) {
+                  l = frc::ApplyDeadband(l, *deadband);
+                  r = frc::ApplyDeadband(r, *deadband);
+                }
+                auto speeds =
+                    frc::DifferentialDrive::TankDriveIK(l, r, squareInputs);
+                *left = speeds.left;
+                *right = speeds.right;
+              });
+}
+
+py::tuple DriveCartesianIKArray(py::object xSpeed, py::object ySpeed,
+                                py::object zRotation, py::object gyroAngle,
+                                std::optional<double> deadband) {
+  auto [ix, iy, iz, ig] =
+      Broadcast<4>({std::move(xSpeed), std::move(ySpeed),
+                    std::move(zRotation), std::move(gyroAngle)});
+  auto frontLeft = Like(ix);
+  auto frontRight = Like(ix);
+  auto rearLeft = Like(ix);
+  auto rearRight = Like(ix);
+
+  const double *xs = ix.data();
+  const double *ys = iy.data();
+  const double *zs = iz.data();
+  const double *gs = ig.data();
+  double *pfl = frontLeft.mutable_data();
+  double *pfr = frontRight.mutable_data();
+  double *prl = rearLeft.mutable_data();
+  double *prr = rearRight.mutable_data();
+  py::ssize_t n = ix.size();
+  {
+    py::gil_scoped_release release;
+    for (py::ssize_t i = 0; i < n; i++) {
+      double x = xs[i];
+      double y = ys[i];
+      if (deadband) {
+        // like DriveCartesian, the rotation isn't deadbanded
+        x = frc::ApplyDeadband(x, *deadband);
+        y = frc::ApplyDeadband(y, *deadband);
+      }
+      auto speeds = frc::MecanumDrive::DriveCartesianIK(
+          x, y, zs[i], frc::Rotation2d{units::radian_t{gs[i]}});
+      pfl[i] = speeds.frontLeft;
+      pfr[i] = speeds.frontRight;
+      prl[i] = speeds.rearLeft;
+      prr[i] = speeds.rearRight;
+    }
+  }
+  return py::make_tuple(frontLeft, frontRight, rearLeft, rearRight);
+}
+
+} // namespace rpy
@@ -0,0 +1,37 @@
+#pragma once
+
+#include <optional>
+
+#include <robotpy_build.h>
+#include <pybind11/numpy.h>
+
+namespace rpy {
+
+//
+// Array versions of the DifferentialDrive and MecanumDrive inverse
+// kinematics functions. The inputs are broadcast against each other, and
+// each element is computed with the scalar function, so the results are
+// identical to calling it in a loop.
+//
+// If deadband is given, it is applied to the inputs in the same way as the
+// corresponding drive method (ArcadeDrive, DriveCartesian, etc) does.
+//
+// These functions must be called with the GIL held
+//
+
+py::tuple ArcadeDriveIKArray(py::object xSpeed, py::object zRotation,
+                             bool squareInputs,
+                             std::optional<double> deadband);
+
+py::tuple CurvatureDriveIKArray(py::object xSpeed, py::object zRotation,
+                                bool allowTurnInPlace,
+                                std::optional<double> deadband);
+
+py::tuple TankDriveIKArray(py::object leftSpeed, py::object rightSpeed,
+                           bool squareInputs, std::optional<double> deadband);
+
+py::tuple DriveCartesianIKArray(py::object xSpeed, py::object ySpeed,
+                                py::object zRotation, py::object gyroAngle,
+                                std::optional<double> deadband);
+
+} // namespace rpy
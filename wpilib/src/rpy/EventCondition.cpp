@@ -0,0 +1,66 @@
+
+#include "rpy/EventCondition.h"
+
+#include <atomic>
+#include <memory>
+
+namespace rpy {
+
+namespace {
+
+std::atomic<uint64_t> gPollCounter{0};
+
+// 0 when not in a poll
+thread_local uint64_t tPollGeneration = 0;
+
+struct MemoizedCondition {
+  struct State {
+    std::function<bool()> condition;
+    uint64_t generation = 0;
+    bool value = false;
+  };
+
+  std::shared_ptr<State> state;
+
+  bool operator()() const {
+    uint64_t generation = tPollGeneration;
+    if (generation == 0) {
+      return state->condition();
+    }
+    if (state->generation != generation) {
+      state->value = state->condition();
+      state->generation = generation;
+    }
+    return state->value;
+  }
+};
+
+} // namespace
+
+EventPollScope::EventPollScope() : m_previous(tPollGeneration) {
+  tPollGeneration = ++gPollCounter;
+}
+
+EventPollScope::~EventPollScope() { tPollGeneration = m_previous; }
+
+std::function<bool()> MemoizeCondition(std::function<bool()> condition) {
+  if (condition.target<MemoizedCondition>() != nullptr) {
+    return condition;
+  }
+  auto state = std::make_shared<MemoizedCondition::State>();
+  state->condition = std::move(condition);
+  return MemoizedCondition{std::move(state)};
+}
+
+frc::BooleanEvent
+DeriveEvent(frc::BooleanEvent &event,
+            std::function<std::function<bool()>(std::function<bool()>)>
+                transform) {
+  return event.CastTo<frc::BooleanEvent>(
+      [&](frc::EventLoop *loop, std::function<bool()> condition) {
+        return frc::BooleanEvent(
+            loop, MemoizeCondition(transform(std::move(condition))));
+      });
+}
+
+} // namespace rpy
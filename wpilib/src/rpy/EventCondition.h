@@ -0,0 +1,48 @@
+#pragma once
+
+#include <stdint.h>
+
+#include <functional>
+
+#include <frc/event/BooleanEvent.h>
+#include <frc/event/EventLoop.h>
+
+namespace rpy {
+
+/**
+ * While an instance exists, conditions returned by MemoizeCondition are
+ * evaluated at most once on the current thread; later calls return the
+ * cached value. An instance is created for each EventLoop poll, so that
+ * conditions shared by several events are only evaluated once per poll.
+ */
+class EventPollScope {
+ public:
+  EventPollScope();
+  ~EventPollScope();
+
+  EventPollScope(const EventPollScope &) = delete;
+  EventPollScope &operator=(const EventPollScope &) = delete;
+
+ private:
+  uint64_t m_previous;
+};
+
+/**
+ * Wraps a condition so that it is evaluated at most once per EventLoop
+ * poll. Copies of the result share the cached value. Outside of a poll
+ * the condition is evaluated on every call.
+ *
+ * If the condition is already memoized it is returned as is.
+ */
+std::function<bool()> MemoizeCondition(std::function<bool()> condition);
+
+/**
+ * Returns an event on the same loop as event whose condition is
+ * transform(condition of event), memoized.
+ */
+frc::BooleanEvent
+DeriveEvent(frc::BooleanEvent &event,
+            std::function<std::function<bool()>(std::function<bool()>)>
+                transform);
+
+} // namespace rpy
@@ -0,0 +1,89 @@
+
+#include "FieldObject2dArrays.h"
+
+#include <vector>
+
+namespace rpy {
+
+void SetPosesFromArray(frc::FieldObject2d *obj, const PoseArray &poses) {
+  if (poses.size() != 0 && (poses.ndim() != 2 || poses.shape(1) != 3)) {
+    throw py::value_error("poses must be an Nx3 array of (x, y, radians)");
+  }
+
+  std::vector<frc::Pose2d> v;
+  if (poses.size() != 0) {
+    auto r = poses.unchecked<2>();
+    v.reserve(r.shape(0));
+    for (py::ssize_t i = 0; i < r.shape(0); i++) {
+      v.emplace_back(units::meter_t{r(i, 0)}, units::meter_t{r(i, 1)},
+                     frc::Rotation2d{units::radian_t{r(i, 2)}});
+    }
+  }
+
+  py::gil_scoped_release release;
+  obj->SetPoses(v);
+}
+
+py::array_t<double> GetPosesAsArray(frc::FieldObject2d *obj) {
+  std::vector<frc::Pose2d> v;
+  {
+    py::gil_scoped_release release;
+    v = obj->GetPoses();
+  }
+
+  py::array_t<double> out({static_cast<py::ssize_t>(v.size()),
+                           static_cast<py::ssize_t>(3)});
+  auto w = out.mutable_unchecked<2>();
+  for (size_t i = 0; i < v.size(); i++) {
+    w(i, 0) = v[i].X().value();
+    w(i, 1) = v[i].Y().value();
+    w(i, 2) = v[i].Rotation().Radians().value();
+  }
+  return out;
+}
+
+void SetTrajectoryDecimated(frc::FieldObject2d *obj,
+                            const frc::Trajectory &trajectory,
+                            size_t decimation, size_t maxPoints) {
+  if (decimation == 0) {
+    throw py::value_error("decimation must be at least 1");
+  }
+
+  py::gil_scoped_release release;
+
+  auto &states = trajectory.States();
+  size_t n = states.size();
+
+  // every Nth state, always ending on the final state
+  std::vector<size_t> idx;
+  for (size_t i = 0; i < n; i += decimation) {
+    idx.push_back(i);
+  }
+  if (n > 0 && idx.back() != n - 1) {
+    idx.push_back(n - 1);
+  }
+
+  // evenly resample if that's still too many, keeping both endpoints
+  if (maxPoints > 0 && idx.size() > maxPoints) {
+    std::vector<size_t> resampled;
+    resampled.reserve(maxPoints);
+    if (maxPoints == 1) {
+      resampled.push_back(idx.front());
+    } else {
+      for (size_t k = 0; k < maxPoints; k++) {
+        resampled.push_back(idx[k * (idx.size() - 1) / (maxPoints - 1)]);
+      }
+    }
+    idx = std::move(resampled);
+  }
+
+  std::vector<frc::Pose2d> poses;
+  poses.reserve(idx.size());
+  for (auto i : idx) {
+    poses.push_back(states[i].pose);
+  }
+
+  obj->SetPoses(poses);
+}
+
+} // namespace rpy
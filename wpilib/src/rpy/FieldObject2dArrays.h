@@ -0,0 +1,26 @@
+#pragma once
+
+#include <frc/smartdashboard/FieldObject2d.h>
+#include <frc/trajectory/Trajectory.h>
+
+#include <robotpy_build.h>
+#include <pybind11/numpy.h>
+
+namespace rpy {
+
+// Nx3 array of (x meters, y meters, heading radians)
+using PoseArray =
+    py::array_t<double, py::array::c_style | py::array::forcecast>;
+
+//
+// These functions must be called with the GIL held
+//
+
+void SetPosesFromArray(frc::FieldObject2d *obj, const PoseArray &poses);
+py::array_t<double> GetPosesAsArray(frc::FieldObject2d *obj);
+
+void SetTrajectoryDecimated(frc::FieldObject2d *obj,
+                            const frc::Trajectory &trajectory,
+                            size_t decimation, size_t maxPoints);
+
+} // namespace rpy
@@ -0,0 +1,57 @@
+
+#include "rpy/I2CBusSim.h"
+
+#include <algorithm>
+
+#include <hal/simulation/I2CData.h>
+
+using namespace frc::sim;
+
+I2CBusSim::I2CBusSim(I2C::Port port) : m_port(static_cast<int>(port)) {
+  m_readUid = HALSIM_RegisterI2CReadCallback(m_port, ReadCallback, this);
+  m_writeUid = HALSIM_RegisterI2CWriteCallback(m_port, WriteCallback, this);
+}
+
+I2CBusSim::~I2CBusSim() {
+  HALSIM_CancelI2CReadCallback(m_port, m_readUid);
+  HALSIM_CancelI2CWriteCallback(m_port, m_writeUid);
+}
+
+void I2CBusSim::SetReadData(std::span<const uint8_t> data) {
+  std::scoped_lock lock{m_mutex};
+  m_readData.assign(data.begin(), data.end());
+}
+
+std::vector<uint8_t> I2CBusSim::GetLastWrite() {
+  std::scoped_lock lock{m_mutex};
+  return m_lastWrite;
+}
+
+int I2CBusSim::GetReadCount() {
+  std::scoped_lock lock{m_mutex};
+  return m_readCount;
+}
+
+int I2CBusSim::GetWriteCount() {
+  std::scoped_lock lock{m_mutex};
+  return m_writeCount;
+}
+
+void I2CBusSim::ReadCallback(const char *name, void *param,
+                             unsigned char *buffer, unsigned int count) {
+  auto self = static_cast<I2CBusSim *>(param);
+  std::scoped_lock lock{self->m_mutex};
+  size_t n = std::min<size_t>(count, self->m_readData.size());
+  std::copy_n(self->m_readData.begin(), n, buffer);
+  std::fill(buffer + n, buffer + count, 0);
+  self->m_readCount++;
+}
+
+void I2CBusSim::WriteCallback(const char *name, void *param,
+                              const unsigned char *buffer,
+                              unsigned int count) {
+  auto self = static_cast<I2CBusSim *>(param);
+  std::scoped_lock lock{self->m_mutex};
+  self->m_lastWrite.assign(buffer, buffer + count);
+  self->m_writeCount++;
+}
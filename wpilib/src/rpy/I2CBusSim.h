@@ -0,0 +1,61 @@
+#pragma once
+
+#include <stdint.h>
+
+#include <mutex>
+#include <span>
+#include <vector>
+
+#include <frc/I2C.h>
+
+namespace frc::sim {
+
+/**
+ * Simulates the devices on an I2C port: every read from the port returns
+ * the data set with SetReadData, and the data written to the port is
+ * recorded.
+ */
+class I2CBusSim {
+ public:
+  /**
+   * @param port The I2C port to simulate
+   */
+  explicit I2CBusSim(I2C::Port port);
+  ~I2CBusSim();
+
+  I2CBusSim(const I2CBusSim &) = delete;
+  I2CBusSim &operator=(const I2CBusSim &) = delete;
+
+  /**
+   * Sets the data returned by reads. Reads longer than the data are padded
+   * with zeros.
+   */
+  void SetReadData(std::span<const uint8_t> data);
+
+  /** Returns the data of the last write */
+  std::vector<uint8_t> GetLastWrite();
+
+  /** Returns the number of reads */
+  int GetReadCount();
+
+  /** Returns the number of writes */
+  int GetWriteCount();
+
+ private:
+  static void ReadCallback(const char *name, void *param,
+                           unsigned char *buffer, unsigned int count);
+  static void WriteCallback(const char *name, void *param,
+                            const unsigned char *buffer, unsigned int count);
+
+  int m_port;
+  int32_t m_readUid;
+  int32_t m_writeUid;
+
+  std::mutex m_mutex;
+  std::vector<uint8_t> m_readData;
+  std::vector<uint8_t> m_lastWrite;
+  int m_readCount = 0;
+  int m_writeCount = 0;
+};
+
+} // namespace frc::sim
@@ -0,0 +1,140 @@
+
+#include "rpy/I2CScheduler.h"
+
+#include <algorithm>
+
+#include <frc/Errors.h>
+#include <frc/RobotController.h>
+
+using namespace frc;
+
+I2CScheduler::I2CScheduler(units::second_t period)
+    : m_period(std::chrono::duration_cast<std::chrono::steady_clock::duration>(
+          std::chrono::duration<double>(period.value()))) {
+  if (period <= 0_s) {
+    throw FRC_MakeError(err::ParameterOutOfRange,
+                        "period {} must be positive", period.value());
+  }
+}
+
+I2CScheduler::~I2CScheduler() { Stop(); }
+
+int I2CScheduler::AddTransaction(std::shared_ptr<I2C> device,
+                                 std::span<const uint8_t> dataToSend,
+                                 int receiveSize) {
+  if (!device) {
+    throw FRC_MakeError(err::NullParameter, "device");
+  }
+  if (receiveSize < 0) {
+    throw FRC_MakeError(err::ParameterOutOfRange,
+                        "receiveSize {} must not be negative", receiveSize);
+  }
+  std::scoped_lock lock{m_mutex};
+  if (m_worker.IsRunningLocked()) {
+    throw FRC_MakeError(err::IncompatibleState,
+                        "transactions cannot be added while running");
+  }
+
+  m_transactions.push_back(Transaction{
+      std::move(device),
+      std::vector<uint8_t>(dataToSend.begin(), dataToSend.end()), receiveSize,
+      static_cast<size_t>(m_totalReceiveSize)});
+  m_totalReceiveSize += receiveSize;
+
+  for (auto results : {&m_published, &m_pending}) {
+    results->data.resize(m_totalReceiveSize);
+    results->timestamps.resize(m_transactions.size());
+    results->aborted.resize(m_transactions.size());
+  }
+  return m_transactions.size() - 1;
+}
+
+int I2CScheduler::AddRead(std::shared_ptr<I2C> device, int registerAddress,
+                          int count) {
+  uint8_t regAddr = registerAddress;
+  return AddTransaction(std::move(device), {&regAddr, 1}, count);
+}
+
+void I2CScheduler::CheckIndex(int index) const {
+  if (index < 0 || static_cast<size_t>(index) >= m_transactions.size()) {
+    throw FRC_MakeError(err::ParameterOutOfRange,
+                        "transaction index {} out of range", index);
+  }
+}
+
+int I2CScheduler::GetReceiveSize(int index) const {
+  CheckIndex(index);
+  return m_transactions[index].receiveSize;
+}
+
+void I2CScheduler::Start() {
+  m_worker.Start(m_period, [this](auto &lock) { return Step(lock); });
+}
+
+void I2CScheduler::Stop() { m_worker.Stop(); }
+
+bool I2CScheduler::IsRunning() { return m_worker.IsRunning(); }
+
+int64_t I2CScheduler::GetCycleCount() {
+  std::scoped_lock lock{m_mutex};
+  return m_cycleCount;
+}
+
+uint64_t I2CScheduler::ReadInto(int index, std::span<uint8_t> data) {
+  CheckIndex(index);
+  auto &transaction = m_transactions[index];
+  if (data.size() < static_cast<size_t>(transaction.receiveSize)) {
+    throw FRC_MakeError(err::ParameterOutOfRange,
+                        "buffer holds {} bytes, transaction receives {}",
+                        data.size(), transaction.receiveSize);
+  }
+
+  std::scoped_lock lock{m_mutex};
+  std::copy_n(m_published.data.begin() + transaction.offset,
+              transaction.receiveSize, data.begin());
+  return m_published.timestamps[index];
+}
+
+int64_t I2CScheduler::ReadAllInto(std::span<uint8_t> data,
+                                  std::span<uint64_t> timestamps,
+                                  std::span<uint8_t> aborted) {
+  if (data.size() < static_cast<size_t>(m_totalReceiveSize) ||
+      timestamps.size() < m_transactions.size() ||
+      aborted.size() < m_transactions.size()) {
+    throw FRC_MakeError(err::ParameterOutOfRange,
+                        "buffers must hold {} bytes and {} transactions",
+                        m_totalReceiveSize, m_transactions.size());
+  }
+
+  std::scoped_lock lock{m_mutex};
+  std::copy(m_published.data.begin(), m_published.data.end(), data.begin());
+  std::copy(m_published.timestamps.begin(), m_published.timestamps.end(),
+            timestamps.begin());
+  std::copy(m_published.aborted.begin(), m_published.aborted.end(),
+            aborted.begin());
+  return m_cycleCount;
+}
+
+bool I2CScheduler::GetAborted(int index) {
+  CheckIndex(index);
+  std::scoped_lock lock{m_mutex};
+  return m_published.aborted[index] != 0;
+}
+
+bool I2CScheduler::Step(std::unique_lock<std::mutex> &lock) {
+  lock.unlock();
+
+  for (size_t i = 0; i < m_transactions.size(); i++) {
+    auto &transaction = m_transactions[i];
+    bool aborted = transaction.device->Transaction(
+        transaction.dataToSend.data(), transaction.dataToSend.size(),
+        m_pending.data.data() + transaction.offset, transaction.receiveSize);
+    m_pending.timestamps[i] = RobotController::GetFPGATime();
+    m_pending.aborted[i] = aborted;
+  }
+
+  lock.lock();
+  std::swap(m_published, m_pending);
+  m_cycleCount++;
+  return false;
+}
@@ -0,0 +1,139 @@
+#pragma once
+
+#include <stdint.h>
+
+#include <chrono>
+#include <memory>
+#include <mutex>
+#include <span>
+#include <vector>
+
+#include <frc/I2C.h>
+#include <units/time.h>
+
+#include "rpy/PeriodicWorker.h"
+
+namespace frc {
+
+/**
+ * Runs a fixed list of I2C transactions back-to-back on a background
+ * thread, at a fixed rate.
+ *
+ * After each cycle the results of every transaction are published
+ * together, so the latest results can be read at any time without waiting
+ * for the bus.
+ */
+class I2CScheduler {
+ public:
+  /**
+   * @param period Time between the start of each cycle
+   */
+  explicit I2CScheduler(units::second_t period = 20_ms);
+  ~I2CScheduler();
+
+  I2CScheduler(const I2CScheduler &) = delete;
+  I2CScheduler &operator=(const I2CScheduler &) = delete;
+
+  /**
+   * Adds a transaction, see I2C::Transaction.
+   *
+   * @param device      The device to talk to
+   * @param dataToSend  Bytes to send, or empty to only receive
+   * @param receiveSize Number of bytes to receive, or 0 to only send
+   * @return the index of the transaction
+   */
+  int AddTransaction(std::shared_ptr<I2C> device,
+                     std::span<const uint8_t> dataToSend, int receiveSize);
+
+  /**
+   * Adds a register read, see I2C::Read.
+   *
+   * @param device          The device to read from
+   * @param registerAddress The register to read first
+   * @param count           Number of bytes to read
+   * @return the index of the transaction
+   */
+  int AddRead(std::shared_ptr<I2C> device, int registerAddress, int count);
+
+  /** Returns the number of transactions */
+  int GetTransactionCount() const { return m_transactions.size(); }
+
+  /** Returns the number of bytes received by a transaction */
+  int GetReceiveSize(int index) const;
+
+  /** Returns the total number of bytes received by all transactions */
+  int GetTotalReceiveSize() const { return m_totalReceiveSize; }
+
+  /** Starts running cycles. No transactions can be added afterwards. */
+  void Start();
+
+  /** Stops running cycles. The latest results can still be read. */
+  void Stop();
+
+  bool IsRunning();
+
+  /** Returns the number of cycles that have completed */
+  int64_t GetCycleCount();
+
+  /**
+   * Copies the latest received bytes of a transaction.
+   *
+   * @param index The transaction
+   * @param data  Receives GetReceiveSize(index) bytes
+   * @return the FPGA time when the transaction finished, in microseconds,
+   *         or 0 if it hasn't run yet
+   */
+  uint64_t ReadInto(int index, std::span<uint8_t> data);
+
+  /**
+   * Copies the latest results of every transaction, all from the same
+   * cycle.
+   *
+   * @param data       Receives the bytes of each transaction in order,
+   *                   GetTotalReceiveSize() bytes
+   * @param timestamps Receives the FPGA time each transaction finished,
+   *                   one per transaction
+   * @param aborted    Receives 1 for each transaction that was aborted,
+   *                   otherwise 0
+   * @return the cycle count of the results
+   */
+  int64_t ReadAllInto(std::span<uint8_t> data, std::span<uint64_t> timestamps,
+                      std::span<uint8_t> aborted);
+
+  /** Returns true if the latest run of a transaction was aborted */
+  bool GetAborted(int index);
+
+ private:
+  struct Transaction {
+    std::shared_ptr<I2C> device;
+    std::vector<uint8_t> dataToSend;
+    int receiveSize;
+    size_t offset;
+  };
+
+  // the results of one cycle
+  struct Results {
+    std::vector<uint8_t> data;
+    std::vector<uint64_t> timestamps;
+    std::vector<uint8_t> aborted;
+  };
+
+  void CheckIndex(int index) const;
+  bool Step(std::unique_lock<std::mutex> &lock);
+
+  std::chrono::steady_clock::duration m_period;
+  std::vector<Transaction> m_transactions;
+  int m_totalReceiveSize = 0;
+
+  std::mutex m_mutex;
+  int64_t m_cycleCount = 0;
+  Results m_published;
+
+  // only used by the scheduler thread
+  Results m_pending;
+
+  // last, so the thread is stopped before the rest is destroyed
+  rpy::PeriodicWorker m_worker{m_mutex};
+};
+
+} // namespace frc
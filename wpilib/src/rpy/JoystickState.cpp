@@ -0,0 +1,151 @@
+
+#include "rpy/JoystickState.h"
+
+#include <algorithm>
+#include <mutex>
+
+#include <frc/DriverStation.h>
+#include <frc/Errors.h>
+#include <hal/DriverStation.h>
+
+#include "rpy/RefreshedData.h"
+
+using namespace frc;
+
+static_assert(JoystickState::kMaxAxes == HAL_kMaxJoystickAxes);
+static_assert(JoystickState::kMaxPOVs == HAL_kMaxJoystickPOVs);
+
+namespace {
+
+// states returned by JoystickState::GetCurrent and GetCurrentInputs
+struct CurrentStates {
+  std::mutex mutex;
+  rpy::RefreshedDataTracker refreshed;
+  std::array<JoystickState, DriverStation::kJoystickPorts> states;
+  std::array<bool, DriverStation::kJoystickPorts> valid{};
+  std::array<JoystickState, DriverStation::kJoystickPorts> inputs;
+  std::array<bool, DriverStation::kJoystickPorts> inputsValid{};
+};
+
+CurrentStates &GetCurrentStates() {
+  static CurrentStates states;
+  return states;
+}
+
+void CheckPort(int port) {
+  if (port < 0 || port >= DriverStation::kJoystickPorts) {
+    throw FRC_MakeError(err::ParameterOutOfRange,
+                        "joystick port {} out of range", port);
+  }
+}
+
+// buttons of each port at the last read with edges, which the edges of
+// the next read are found from
+struct PreviousButtons {
+  std::mutex mutex;
+  std::array<uint32_t, DriverStation::kJoystickPorts> buttons{};
+};
+
+PreviousButtons &GetPreviousButtons() {
+  static PreviousButtons previous;
+  return previous;
+}
+
+// must be called with the mutex held
+void CheckRefreshed(CurrentStates &current) {
+  if (current.refreshed.Check()) {
+    current.valid.fill(false);
+    current.inputsValid.fill(false);
+  }
+}
+
+} // namespace
+
+JoystickState JoystickState::Read(int port) {
+  CheckPort(port);
+  return ReadPort(port, true);
+}
+
+JoystickState JoystickState::ReadPort(int port, bool edges) {
+  JoystickState state;
+  state.m_port = port;
+
+  HAL_JoystickAxes axes;
+  HAL_GetJoystickAxes(port, &axes);
+  state.m_axisCount = std::clamp<int>(axes.count, 0, kMaxAxes);
+  std::copy_n(axes.axes, state.m_axisCount, state.m_axes.begin());
+
+  HAL_JoystickPOVs povs;
+  HAL_GetJoystickPOVs(port, &povs);
+  state.m_povCount = std::clamp<int>(povs.count, 0, kMaxPOVs);
+  std::copy_n(povs.povs, state.m_povCount, state.m_povs.begin());
+
+  HAL_JoystickButtons buttons;
+  HAL_GetJoystickButtons(port, &buttons);
+  state.m_buttonCount = buttons.count;
+  state.m_buttons = buttons.buttons;
+
+  if (!edges) {
+    return state;
+  }
+
+  // DriverStation's own edge masks can't be read without taking its lock
+  // for each button, so the edges are found from the previous read
+  auto &previous = GetPreviousButtons();
+  std::scoped_lock lock{previous.mutex};
+  uint32_t &last = previous.buttons[port];
+  state.m_pressed = state.m_buttons & ~last;
+  state.m_released = ~state.m_buttons & last;
+  last = state.m_buttons;
+
+  return state;
+}
+
+std::vector<JoystickState> JoystickState::Read(const std::vector<int> &ports) {
+  for (int port : ports) {
+    CheckPort(port);
+  }
+
+  std::vector<JoystickState> states;
+  states.reserve(ports.size());
+  for (int port : ports) {
+    states.emplace_back(ReadPort(port, true));
+  }
+  return states;
+}
+
+JoystickState JoystickState::GetCurrent(int port) {
+  CheckPort(port);
+
+  auto &current = GetCurrentStates();
+  std::scoped_lock lock{current.mutex};
+  CheckRefreshed(current);
+
+  if (!current.valid[port]) {
+    current.states[port] = ReadPort(port, true);
+    current.valid[port] = true;
+  }
+  return current.states[port];
+}
+
+JoystickState JoystickState::GetCurrentInputs(int port) {
+  CheckPort(port);
+
+  auto &current = GetCurrentStates();
+  std::scoped_lock lock{current.mutex};
+  CheckRefreshed(current);
+
+  if (!current.inputsValid[port]) {
+    current.inputs[port] = ReadPort(port, false);
+    current.inputsValid[port] = true;
+  }
+  return current.inputs[port];
+}
+
+BooleanEvent JoystickState::ButtonEvent(EventLoop *loop, int port,
+                                        int button) {
+  CheckPort(port);
+  return BooleanEvent(loop, [port, button] {
+    return GetCurrentInputs(port).GetButton(button);
+  });
+}
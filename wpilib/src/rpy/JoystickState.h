@@ -0,0 +1,378 @@
+#pragma once
+
+#include <stdint.h>
+
+#include <array>
+#include <span>
+#include <vector>
+
+#include <frc/PS4Controller.h>
+#include <frc/XboxController.h>
+#include <frc/event/BooleanEvent.h>
+#include <frc/event/EventLoop.h>
+
+namespace frc {
+
+/**
+ * State of the joystick on one driver station port at the time it was
+ * read: axes, buttons, POVs, and the button press/release edges.
+ *
+ * Reading a state takes the driver station data once, so reading many
+ * values from it is much cheaper than calling the DriverStation
+ * functions for each value.
+ *
+ * Buttons and POVs are numbered the same way as DriverStation: buttons
+ * start at 1, axes and POVs at 0. Values that the joystick doesn't have
+ * read as 0 (axes), false (buttons) or -1 (POVs).
+ */
+class JoystickState {
+ public:
+  static constexpr int kMaxAxes = 12;
+  static constexpr int kMaxPOVs = 12;
+
+  JoystickState() = default;
+
+  /**
+   * Reads the state of a port. The press/release edges are the buttons
+   * that changed since the last time the port was read with edges (by Read
+   * or GetCurrent); they are tracked separately from the edges of
+   * DriverStation::GetStickButtonPressed and GetStickButtonReleased.
+   */
+  static JoystickState Read(int port);
+
+  /**
+   * Reads the state of several ports.
+   */
+  static std::vector<JoystickState> Read(const std::vector<int> &ports);
+
+  /**
+   * Returns the state of a port for the current robot loop.
+   *
+   * The state is read at most once each time the driver station data is
+   * refreshed (once per robot loop), and the same state is returned for
+   * the rest of the loop. Because the press/release edges are relative
+   * to the previous read, don't mix this with Read for the same port.
+   */
+  static JoystickState GetCurrent(int port);
+
+  /**
+   * Same as GetCurrent, but the press/release edges are not read (they
+   * are always false), so they are left for other users. This is used by
+   * the events returned by XboxController and PS4Controller.
+   */
+  static JoystickState GetCurrentInputs(int port);
+
+  /**
+   * Returns an event that is high while a button is pressed. The button is
+   * read with GetCurrentInputs, so all of the button events of a port read
+   * the same driver station data.
+   */
+  static BooleanEvent ButtonEvent(EventLoop *loop, int port, int button);
+
+  int GetPort() const { return m_port; }
+
+  /** Returns true if the joystick has any axes, buttons or POVs */
+  bool IsConnected() const {
+    return m_axisCount > 0 || m_buttonCount > 0 || m_povCount > 0;
+  }
+
+  double GetAxis(int axis) const {
+    if (axis < 0 || axis >= m_axisCount) {
+      return 0.0;
+    }
+    return m_axes[axis];
+  }
+
+  bool GetButton(int button) const { return TestBit(m_buttons, button); }
+  bool GetButtonPressed(int button) const {
+    return TestBit(m_pressed, button);
+  }
+  bool GetButtonReleased(int button) const {
+    return TestBit(m_released, button);
+  }
+
+  int GetPOV(int pov = 0) const {
+    if (pov < 0 || pov >= m_povCount) {
+      return -1;
+    }
+    return m_povs[pov];
+  }
+
+  /** Bitmask of pressed buttons, button 1 is bit 0 */
+  uint32_t GetButtons() const { return m_buttons; }
+
+  /** Bitmask of buttons that were pressed since the last read */
+  uint32_t GetPressed() const { return m_pressed; }
+
+  /** Bitmask of buttons that were released since the last read */
+  uint32_t GetReleased() const { return m_released; }
+
+  int GetAxisCount() const { return m_axisCount; }
+  int GetButtonCount() const { return m_buttonCount; }
+  int GetPOVCount() const { return m_povCount; }
+
+  /** Returns the axis values */
+  std::span<const float> GetAxes() const {
+    return {m_axes.data(), static_cast<size_t>(m_axisCount)};
+  }
+
+  /** Returns the POV values */
+  std::span<const int16_t> GetPOVs() const {
+    return {m_povs.data(), static_cast<size_t>(m_povCount)};
+  }
+
+ private:
+  static JoystickState ReadPort(int port, bool edges);
+
+  static bool TestBit(uint32_t mask, int button) {
+    return button > 0 && button <= 32 && (mask >> (button - 1)) & 1;
+  }
+
+  int m_port = -1;
+  int m_axisCount = 0;
+  int m_buttonCount = 0;
+  int m_povCount = 0;
+  uint32_t m_buttons = 0;
+  uint32_t m_pressed = 0;
+  uint32_t m_released = 0;
+  std::array<float, kMaxAxes> m_axes{};
+  std::array<int16_t, kMaxPOVs> m_povs{};
+};
+
+/**
+ * State of an Xbox controller at the time it was read. The accessors have the
+ * same names as the ones of XboxController, but read from the state instead
+ * of the driver station.
+ */
+class XboxControllerState : public JoystickState {
+ public:
+  XboxControllerState() = default;
+  explicit XboxControllerState(const JoystickState &state)
+      : JoystickState(state) {}
+
+  double GetLeftX() const { return GetAxis(XboxController::Axis::kLeftX); }
+  double GetRightX() const { return GetAxis(XboxController::Axis::kRightX); }
+  double GetLeftY() const { return GetAxis(XboxController::Axis::kLeftY); }
+  double GetRightY() const { return GetAxis(XboxController::Axis::kRightY); }
+  double GetLeftTriggerAxis() const {
+    return GetAxis(XboxController::Axis::kLeftTrigger);
+  }
+  double GetRightTriggerAxis() const {
+    return GetAxis(XboxController::Axis::kRightTrigger);
+  }
+  bool GetLeftBumper() const {
+    return GetButton(XboxController::Button::kLeftBumper);
+  }
+  bool GetLeftBumperPressed() const {
+    return GetButtonPressed(XboxController::Button::kLeftBumper);
+  }
+  bool GetLeftBumperReleased() const {
+    return GetButtonReleased(XboxController::Button::kLeftBumper);
+  }
+  bool GetRightBumper() const {
+    return GetButton(XboxController::Button::kRightBumper);
+  }
+  bool GetRightBumperPressed() const {
+    return GetButtonPressed(XboxController::Button::kRightBumper);
+  }
+  bool GetRightBumperReleased() const {
+    return GetButtonReleased(XboxController::Button::kRightBumper);
+  }
+  bool GetLeftStickButton() const {
+    return GetButton(XboxController::Button::kLeftStick);
+  }
+  bool GetLeftStickButtonPressed() const {
+    return GetButtonPressed(XboxController::Button::kLeftStick);
+  }
+  bool GetLeftStickButtonReleased() const {
+    return GetButtonReleased(XboxController::Button::kLeftStick);
+  }
+  bool GetRightStickButton() const {
+    return GetButton(XboxController::Button::kRightStick);
+  }
+  bool GetRightStickButtonPressed() const {
+    return GetButtonPressed(XboxController::Button::kRightStick);
+  }
+  bool GetRightStickButtonReleased() const {
+    return GetButtonReleased(XboxController::Button::kRightStick);
+  }
+  bool GetAButton() const { return GetButton(XboxController::Button::kA); }
+  bool GetAButtonPressed() const {
+    return GetButtonPressed(XboxController::Button::kA);
+  }
+  bool GetAButtonReleased() const {
+    return GetButtonReleased(XboxController::Button::kA);
+  }
+  bool GetBButton() const { return GetButton(XboxController::Button::kB); }
+  bool GetBButtonPressed() const {
+    return GetButtonPressed(XboxController::Button::kB);
+  }
+  bool GetBButtonReleased() const {
+    return GetButtonReleased(XboxController::Button::kB);
+  }
+  bool GetXButton() const { return GetButton(XboxController::Button::kX); }
+  bool GetXButtonPressed() const {
+    return GetButtonPressed(XboxController::Button::kX);
+  }
+  bool GetXButtonReleased() const {
+    return GetButtonReleased(XboxController::Button::kX);
+  }
+  bool GetYButton() const { return GetButton(XboxController::Button::kY); }
+  bool GetYButtonPressed() const {
+    return GetButtonPressed(XboxController::Button::kY);
+  }
+  bool GetYButtonReleased() const {
+    return GetButtonReleased(XboxController::Button::kY);
+  }
+  bool GetBackButton() const {
+    return GetButton(XboxController::Button::kBack);
+  }
+  bool GetBackButtonPressed() const {
+    return GetButtonPressed(XboxController::Button::kBack);
+  }
+  bool GetBackButtonReleased() const {
+    return GetButtonReleased(XboxController::Button::kBack);
+  }
+  bool GetStartButton() const {
+    return GetButton(XboxController::Button::kStart);
+  }
+  bool GetStartButtonPressed() const {
+    return GetButtonPressed(XboxController::Button::kStart);
+  }
+  bool GetStartButtonReleased() const {
+    return GetButtonReleased(XboxController::Button::kStart);
+  }
+};
+
+/**
+ * State of a PS4 controller at the time it was read. The accessors have the
+ * same names as the ones of PS4Controller, but read from the state instead
+ * of the driver station.
+ */
+class PS4ControllerState : public JoystickState {
+ public:
+  PS4ControllerState() = default;
+  explicit PS4ControllerState(const JoystickState &state)
+      : JoystickState(state) {}
+
+  double GetLeftX() const { return GetAxis(PS4Controller::Axis::kLeftX); }
+  double GetRightX() const { return GetAxis(PS4Controller::Axis::kRightX); }
+  double GetLeftY() const { return GetAxis(PS4Controller::Axis::kLeftY); }
+  double GetRightY() const { return GetAxis(PS4Controller::Axis::kRightY); }
+  double GetL2Axis() const { return GetAxis(PS4Controller::Axis::kL2); }
+  double GetR2Axis() const { return GetAxis(PS4Controller::Axis::kR2); }
+  bool GetSquareButton() const {
+    return GetButton(PS4Controller::Button::kSquare);
+  }
+  bool GetSquareButtonPressed() const {
+    return GetButtonPressed(PS4Controller::Button::kSquare);
+  }
+  bool GetSquareButtonReleased() const {
+    return GetButtonReleased(PS4Controller::Button::kSquare);
+  }
+  bool GetCrossButton() const {
+    return GetButton(PS4Controller::Button::kCross);
+  }
+  bool GetCrossButtonPressed() const {
+    return GetButtonPressed(PS4Controller::Button::kCross);
+  }
+  bool GetCrossButtonReleased() const {
+    return GetButtonReleased(PS4Controller::Button::kCross);
+  }
+  bool GetCircleButton() const {
+    return GetButton(PS4Controller::Button::kCircle);
+  }
+  bool GetCircleButtonPressed() const {
+    return GetButtonPressed(PS4Controller::Button::kCircle);
+  }
+  bool GetCircleButtonReleased() const {
+    return GetButtonReleased(PS4Controller::Button::kCircle);
+  }
+  bool GetTriangleButton() const {
+    return GetButton(PS4Controller::Button::kTriangle);
+  }
+  bool GetTriangleButtonPressed() const {
+    return GetButtonPressed(PS4Controller::Button::kTriangle);
+  }
+  bool GetTriangleButtonReleased() const {
+    return GetButtonReleased(PS4Controller::Button::kTriangle);
+  }
+  bool GetL1Button() const { return GetButton(PS4Controller::Button::kL1); }
+  bool GetL1ButtonPressed() const {
+    return GetButtonPressed(PS4Controller::Button::kL1);
+  }
+  bool GetL1ButtonReleased() const {
+    return GetButtonReleased(PS4Controller::Button::kL1);
+  }
+  bool GetR1Button() const { return GetButton(PS4Controller::Button::kR1); }
+  bool GetR1ButtonPressed() const {
+    return GetButtonPressed(PS4Controller::Button::kR1);
+  }
+  bool GetR1ButtonReleased() const {
+    return GetButtonReleased(PS4Controller::Button::kR1);
+  }
+  bool GetL2Button() const { return GetButton(PS4Controller::Button::kL2); }
+  bool GetL2ButtonPressed() const {
+    return GetButtonPressed(PS4Controller::Button::kL2);
+  }
+  bool GetL2ButtonReleased() const {
+    return GetButtonReleased(PS4Controller::Button::kL2);
+  }
+  bool GetR2Button() const { return GetButton(PS4Controller::Button::kR2); }
+  bool GetR2ButtonPressed() const {
+    return GetButtonPressed(PS4Controller::Button::kR2);
+  }
+  bool GetR2ButtonReleased() const {
+    return GetButtonReleased(PS4Controller::Button::kR2);
+  }
+  bool GetShareButton() const {
+    return GetButton(PS4Controller::Button::kShare);
+  }
+  bool GetShareButtonPressed() const {
+    return GetButtonPressed(PS4Controller::Button::kShare);
+  }
+  bool GetShareButtonReleased() const {
+    return GetButtonReleased(PS4Controller::Button::kShare);
+  }
+  bool GetOptionsButton() const {
+    return GetButton(PS4Controller::Button::kOptions);
+  }
+  bool GetOptionsButtonPressed() const {
+    return GetButtonPressed(PS4Controller::Button::kOptions);
+  }
+  bool GetOptionsButtonReleased() const {
+    return GetButtonReleased(PS4Controller::Button::kOptions);
+  }
+  bool GetL3Button() const { return GetButton(PS4Controller::Button::kL3); }
+  bool GetL3ButtonPressed() const {
+    return GetButtonPressed(PS4Controller::Button::kL3);
+  }
+  bool GetL3ButtonReleased() const {
+    return GetButtonReleased(PS4Controller::Button::kL3);
+  }
+  bool GetR3Button() const { return GetButton(PS4Controller::Button::kR3); }
+  bool GetR3ButtonPressed() const {
+    return GetButtonPressed(PS4Controller::Button::kR3);
+  }
+  bool GetR3ButtonReleased() const {
+    return GetButtonReleased(PS4Controller::Button::kR3);
+  }
+  bool GetPSButton() const { return GetButton(PS4Controller::Button::kPS); }
+  bool GetPSButtonPressed() const {
+    return GetButtonPressed(PS4Controller::Button::kPS);
+  }
+  bool GetPSButtonReleased() const {
+    return GetButtonReleased(PS4Controller::Button::kPS);
+  }
+  bool GetTouchpad() const {
+    return GetButton(PS4Controller::Button::kTouchpad);
+  }
+  bool GetTouchpadPressed() const {
+    return GetButtonPressed(PS4Controller::Button::kTouchpad);
+  }
+  bool GetTouchpadReleased() const {
+    return GetButtonReleased(PS4Controller::Button::kTouchpad);
+  }
+};
+
+} // namespace frc
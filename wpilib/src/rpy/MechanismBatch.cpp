@@ -0,0 +1,242 @@
+
+#include "rpy/MechanismBatch.h"
+
+#include <mutex>
+#include <unordered_map>
+
+#include <frc/Errors.h>
+
+using namespace frc;
+
+// the innermost active batch; the others are linked through m_previous
+static thread_local MechanismBatch *t_activeBatch = nullptr;
+
+namespace {
+
+// maps each root and ligament to the mechanism that owns it. Entries are
+// removed when the mechanism is destroyed (which destroys its objects), so
+// addresses are never stale.
+struct Owners {
+  std::mutex mutex;
+  std::unordered_map<const MechanismObject2d *, const Mechanism2d *> owners;
+
+  static Owners &Get() {
+    static Owners instance;
+    return instance;
+  }
+};
+
+} // namespace
+
+MechanismBatch::MechanismBatch(Mechanism2d &mechanism)
+    : m_mechanism(&mechanism) {}
+
+MechanismBatch::~MechanismBatch() {
+  // never leave a dangling pointer behind if the batch wasn't exited
+  Deactivate();
+}
+
+bool MechanismBatch::SetOwner(MechanismRoot2d *root,
+                              const Mechanism2d *mechanism) {
+  auto &o = Owners::Get();
+  std::scoped_lock lock{o.mutex};
+  bool known = false;
+  for (auto &&[object, owner] : o.owners) {
+    if (owner == mechanism) {
+      known = true;
+      break;
+    }
+  }
+  o.owners[root] = mechanism;
+  return !known;
+}
+
+void MechanismBatch::SetOwner(MechanismObject2d *object,
+                              MechanismObject2d *parent) {
+  auto &o = Owners::Get();
+  std::scoped_lock lock{o.mutex};
+  auto it = o.owners.find(parent);
+  if (it != o.owners.end()) {
+    o.owners[object] = it->second;
+  }
+}
+
+void MechanismBatch::ForgetOwner(const Mechanism2d *mechanism) {
+  auto &o = Owners::Get();
+  std::scoped_lock lock{o.mutex};
+  std::erase_if(o.owners,
+                [&](const auto &item) { return item.second == mechanism; });
+}
+
+void MechanismBatch::Deactivate() {
+  for (auto batch = &t_activeBatch; *batch; batch = &(*batch)->m_previous) {
+    if (*batch == this) {
+      *batch = m_previous;
+      break;
+    }
+  }
+  m_previous = nullptr;
+}
+
+void MechanismBatch::Enter() {
+  if (m_saved.empty()) {
+    m_previous = t_activeBatch;
+    t_activeBatch = this;
+  }
+  m_saved.push_back(m_pending);
+}
+
+void MechanismBatch::Exit(bool discard) {
+  if (m_saved.empty()) {
+    throw FRC_MakeError(err::IncompatibleState,
+                        "MechanismBatch exited without being entered");
+  }
+  if (discard) {
+    m_pending = std::move(m_saved.back());
+  }
+  m_saved.pop_back();
+  if (m_saved.empty()) {
+    Deactivate();
+    Flush();
+  }
+}
+
+void MechanismBatch::Flush() {
+  m_skipped = 0;
+  for (auto &p : m_pending) {
+    auto lig = p.ligament;
+    if (p.angle) {
+      if (*p.angle != lig->GetAngle()) {
+        lig->SetAngle(units::degree_t{*p.angle});
+      } else {
+        m_skipped++;
+      }
+    }
+    if (p.length) {
+      if (*p.length != lig->GetLength()) {
+        lig->SetLength(*p.length);
+      } else {
+        m_skipped++;
+      }
+    }
+    if (p.weight) {
+      if (*p.weight != lig->GetLineWeight()) {
+        lig->SetLineWeight(*p.weight);
+      } else {
+        m_skipped++;
+      }
+    }
+    if (p.color) {
+      auto current = lig->GetColor();
+      if (p.color->red != current.red || p.color->green != current.green ||
+          p.color->blue != current.blue) {
+        lig->SetColor(*p.color);
+      } else {
+        m_skipped++;
+      }
+    }
+  }
+  m_pending.clear();
+  // published changes can't be discarded anymore
+  for (auto &saved : m_saved) {
+    saved.clear();
+  }
+}
+
+void MechanismBatch::Discard() {
+  m_pending.clear();
+  for (auto &saved : m_saved) {
+    saved.clear();
+  }
+}
+
+size_t MechanismBatch::GetPendingCount() const { return m_pending.size(); }
+
+size_t MechanismBatch::GetSkippedCount() const { return m_skipped; }
+
+MechanismBatch *MechanismBatch::GetActive(MechanismLigament2d *ligament) {
+  if (!t_activeBatch) {
+    return nullptr;
+  }
+
+  const Mechanism2d *mechanism;
+  {
+    auto &o = Owners::Get();
+    std::scoped_lock lock{o.mutex};
+    auto it = o.owners.find(ligament);
+    if (it == o.owners.end()) {
+      return nullptr;
+    }
+    mechanism = it->second;
+  }
+
+  for (auto batch = t_activeBatch; batch; batch = batch->m_previous) {
+    if (batch->m_mechanism == mechanism) {
+      return batch;
+    }
+  }
+  return nullptr;
+}
+
+MechanismBatch::Pending &
+MechanismBatch::GetPending(MechanismLigament2d *ligament) {
+  for (auto &p : m_pending) {
+    if (p.ligament == ligament) {
+      return p;
+    }
+  }
+  return m_pending.emplace_back(Pending{ligament});
+}
+
+const MechanismBatch::Pending *
+MechanismBatch::FindPending(MechanismLigament2d *ligament) const {
+  for (auto &p : m_pending) {
+    if (p.ligament == ligament) {
+      return &p;
+    }
+  }
+  return nullptr;
+}
+
+void MechanismBatch::SetAngle(MechanismLigament2d *ligament,
+                              units::degree_t angle) {
+  GetPending(ligament).angle = angle.value();
+}
+
+void MechanismBatch::SetLength(MechanismLigament2d *ligament, double length) {
+  GetPending(ligament).length = length;
+}
+
+void MechanismBatch::SetLineWeight(MechanismLigament2d *ligament,
+                                   double weight) {
+  GetPending(ligament).weight = weight;
+}
+
+void MechanismBatch::SetColor(MechanismLigament2d *ligament,
+                              const Color8Bit &color) {
+  GetPending(ligament).color = color;
+}
+
+std::optional<double>
+MechanismBatch::GetAngle(MechanismLigament2d *ligament) const {
+  auto p = FindPending(ligament);
+  return p ? p->angle : std::nullopt;
+}
+
+std::optional<double>
+MechanismBatch::GetLength(MechanismLigament2d *ligament) const {
+  auto p = FindPending(ligament);
+  return p ? p->length : std::nullopt;
+}
+
+std::optional<double>
+MechanismBatch::GetLineWeight(MechanismLigament2d *ligament) const {
+  auto p = FindPending(ligament);
+  return p ? p->weight : std::nullopt;
+}
+
+std::optional<Color8Bit>
+MechanismBatch::GetColor(MechanismLigament2d *ligament) const {
+  auto p = FindPending(ligament);
+  return p ? p->color : std::nullopt;
+}
@@ -0,0 +1,126 @@
+
+#pragma once
+
+#include <optional>
+#include <vector>
+
+#include <frc/smartdashboard/Mechanism2d.h>
+#include <frc/smartdashboard/MechanismLigament2d.h>
+#include <frc/smartdashboard/MechanismObject2d.h>
+#include <frc/smartdashboard/MechanismRoot2d.h>
+#include <frc/util/Color8Bit.h>
+#include <units/angle.h>
+
+namespace frc {
+
+/**
+ * Buffers changes to the MechanismLigament2d objects of a Mechanism2d so
+ * that they are published to NetworkTables together.
+ *
+ * While a batch is active on a thread, calls made on that thread to the
+ * setters of the mechanism's ligaments are recorded instead of being
+ * published immediately; ligaments of other mechanisms are not affected.
+ * When the batch exits (or Flush is called), all recorded changes are
+ * applied in a single pass. Values that are equal to the currently
+ * published value are not published again.
+ *
+ * Ligament getters return the pending value while a batch is active.
+ */
+class MechanismBatch {
+ public:
+  /**
+   * Create a batch for the ligaments attached to a mechanism.
+   *
+   * @param mechanism The mechanism that owns the ligaments
+   */
+  explicit MechanismBatch(Mechanism2d &mechanism);
+  ~MechanismBatch();
+
+  MechanismBatch(const MechanismBatch &) = delete;
+  MechanismBatch &operator=(const MechanismBatch &) = delete;
+
+  /**
+   * Start buffering ligament changes made on the current thread. Batches
+   * may be nested; changes are published when the outermost Exit is called.
+   */
+  void Enter();
+
+  /**
+   * Stop buffering ligament changes and publish all pending changes.
+   *
+   * @param discard If true, the changes made since the matching Enter are
+   *                discarded; changes made before it are kept
+   */
+  void Exit(bool discard = false);
+
+  /**
+   * Publish all pending changes without ending the batch.
+   */
+  void Flush();
+
+  /**
+   * Discard all pending changes without publishing them.
+   */
+  void Discard();
+
+  /**
+   * Returns the number of ligaments with pending changes.
+   */
+  size_t GetPendingCount() const;
+
+  /**
+   * Returns the number of values skipped because they were unchanged
+   * during the last flush.
+   */
+  size_t GetSkippedCount() const;
+
+  // intended to be used by the mechanism bindings, which record the
+  // mechanism that owns each object they create so that a ligament's
+  // mechanism can be found. SetOwner returns true if the mechanism didn't
+  // own any objects yet, and ForgetOwner must be called when the mechanism
+  // is destroyed.
+  static bool SetOwner(MechanismRoot2d *root, const Mechanism2d *mechanism);
+  static void SetOwner(MechanismObject2d *object, MechanismObject2d *parent);
+  static void ForgetOwner(const Mechanism2d *mechanism);
+
+  // returns the innermost batch active on this thread for the mechanism
+  // that owns the ligament, if any
+  static MechanismBatch *GetActive(MechanismLigament2d *ligament);
+
+  void SetAngle(MechanismLigament2d *ligament, units::degree_t angle);
+  void SetLength(MechanismLigament2d *ligament, double length);
+  void SetLineWeight(MechanismLigament2d *ligament, double weight);
+  void SetColor(MechanismLigament2d *ligament, const Color8Bit &color);
+
+  std::optional<double> GetAngle(MechanismLigament2d *ligament) const;
+  std::optional<double> GetLength(MechanismLigament2d *ligament) const;
+  std::optional<double> GetLineWeight(MechanismLigament2d *ligament) const;
+  std::optional<Color8Bit> GetColor(MechanismLigament2d *ligament) const;
+
+ private:
+  struct Pending {
+    MechanismLigament2d *ligament;
+    std::optional<double> angle;
+    std::optional<double> length;
+    std::optional<double> weight;
+    std::optional<Color8Bit> color;
+  };
+
+  Pending &GetPending(MechanismLigament2d *ligament);
+  const Pending *FindPending(MechanismLigament2d *ligament) const;
+  void Deactivate();
+
+  const Mechanism2d *m_mechanism;
+
+  // ligaments are kept in the order they were first modified
+  std::vector<Pending> m_pending;
+
+  // m_pending at each nested Enter, restored by Exit(true)
+  std::vector<std::vector<Pending>> m_saved;
+
+  // the batch that was active when this one was entered
+  MechanismBatch *m_previous = nullptr;
+  size_t m_skipped = 0;
+};
+
+} // namespace frc
@@ -9,7 +9,7 @@
 using namespace frc;
 
 void PyMotorControllerGroup::Initialize() {
-  for (auto motorController : m_motorControllers) {
+  for (auto& motorController : m_motorControllers) {
     wpi::SendableRegistry::AddChild(this, motorController.get());
   }
   static int instances = 0;
@@ -18,13 +18,13 @@ void PyMotorControllerGroup::Initialize() {
 }
 
 void PyMotorControllerGroup::Set(double speed) {
-  for (auto motorController : m_motorControllers) {
+  for (auto& motorController : m_motorControllers) {
     motorController->Set(m_isInverted ? -speed : speed);
   }
 }
 
 void PyMotorControllerGroup::SetVoltage(units::volt_t output) {
-  for (auto motorController : m_motorControllers) {
+  for (auto& motorController : m_motorControllers) {
     motorController->SetVoltage(m_isInverted ? -output : output);
   }
 }
@@ -43,13 +43,13 @@ void PyMotorControllerGroup::SetInverted(bool isInverted) {
 bool PyMotorControllerGroup::GetInverted() const { return m_isInverted; }
 
 void PyMotorControllerGroup::Disable() {
-  for (auto motorController : m_motorControllers) {
+  for (auto& motorController : m_motorControllers) {
     motorController->Disable();
   }
 }
 
 void PyMotorControllerGroup::StopMotor() {
-  for (auto motorController : m_motorControllers) {
+  for (auto& motorController : m_motorControllers) {
     motorController->StopMotor();
   }
 }
@@ -20,7 +20,7 @@ class PyMotorControllerGroup : public wpi::Sendable,
                              public wpi::SendableHelper<PyMotorControllerGroup> {
  public:
   PyMotorControllerGroup(std::vector<std::shared_ptr<frc::MotorController>> &&args) :
-    m_motorControllers(args) {}
+    m_motorControllers(std::move(args)) {}
   ~PyMotorControllerGroup() override = default;
 
   PyMotorControllerGroup(PyMotorControllerGroup&&) = default;
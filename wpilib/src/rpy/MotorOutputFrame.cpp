@@ -0,0 +1,69 @@
+
+#include "rpy/MotorOutputFrame.h"
+
+#include <frc/Errors.h>
+
+using namespace frc;
+
+MotorOutputFrame::MotorOutputFrame(
+    std::vector<std::shared_ptr<MotorController>> motorControllers)
+    : m_motorControllers(std::move(motorControllers)) {
+  m_safety.reserve(m_motorControllers.size());
+  for (auto &motorController : m_motorControllers) {
+    if (!motorController) {
+      throw FRC_MakeError(err::NullParameter, "motorController");
+    }
+    m_safety.push_back(dynamic_cast<MotorSafety *>(motorController.get()));
+  }
+}
+
+void MotorOutputFrame::CheckSize(size_t size) const {
+  if (size != m_motorControllers.size()) {
+    throw FRC_MakeError(err::ParameterOutOfRange,
+                        "expected {} values, got {}",
+                        m_motorControllers.size(), size);
+  }
+}
+
+void MotorOutputFrame::Set(std::span<const double> speeds) {
+  CheckSize(speeds.size());
+  for (size_t i = 0; i < speeds.size(); i++) {
+    m_motorControllers[i]->Set(speeds[i]);
+  }
+}
+
+void MotorOutputFrame::SetVoltage(std::span<const double> volts) {
+  CheckSize(volts.size());
+  for (size_t i = 0; i < volts.size(); i++) {
+    m_motorControllers[i]->SetVoltage(units::volt_t{volts[i]});
+  }
+}
+
+std::vector<double> MotorOutputFrame::Get() const {
+  std::vector<double> speeds;
+  speeds.reserve(m_motorControllers.size());
+  for (auto &motorController : m_motorControllers) {
+    speeds.push_back(motorController->Get());
+  }
+  return speeds;
+}
+
+void MotorOutputFrame::Feed() {
+  for (auto safety : m_safety) {
+    if (safety) {
+      safety->Feed();
+    }
+  }
+}
+
+void MotorOutputFrame::Disable() {
+  for (auto &motorController : m_motorControllers) {
+    motorController->Disable();
+  }
+}
+
+void MotorOutputFrame::StopMotor() {
+  for (auto &motorController : m_motorControllers) {
+    motorController->StopMotor();
+  }
+}
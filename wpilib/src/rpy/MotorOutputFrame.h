@@ -0,0 +1,71 @@
+#pragma once
+
+#include <memory>
+#include <span>
+#include <vector>
+
+#include <frc/MotorSafety.h>
+#include <frc/motorcontrol/MotorController.h>
+
+namespace frc {
+
+/**
+ * Sets the outputs of several motor controllers at once.
+ *
+ * The motor controllers are registered when the frame is created, and each
+ * call to Set or SetVoltage applies one value to each of them, in order.
+ * This replaces one call per motor controller with a single call.
+ */
+class MotorOutputFrame {
+ public:
+  /**
+   * @param motorControllers The motor controllers, in the order that values
+   *                         are given in
+   */
+  explicit MotorOutputFrame(
+      std::vector<std::shared_ptr<MotorController>> motorControllers);
+
+  MotorOutputFrame(const MotorOutputFrame &) = delete;
+  MotorOutputFrame &operator=(const MotorOutputFrame &) = delete;
+
+  /** Returns the number of motor controllers */
+  size_t GetSize() const { return m_motorControllers.size(); }
+
+  /**
+   * Sets the speed of each motor controller.
+   *
+   * @param speeds One speed between -1.0 and 1.0 per motor controller
+   */
+  void Set(std::span<const double> speeds);
+
+  /**
+   * Sets the voltage output of each motor controller.
+   *
+   * @param volts One voltage per motor controller
+   */
+  void SetVoltage(std::span<const double> volts);
+
+  /** Returns the speed of each motor controller */
+  std::vector<double> Get() const;
+
+  /**
+   * Feeds the motor safety watchdog of each motor controller that has one,
+   * without changing its output.
+   */
+  void Feed();
+
+  /** Disables each motor controller */
+  void Disable();
+
+  /** Stops each motor controller */
+  void StopMotor();
+
+ private:
+  void CheckSize(size_t size) const;
+
+  std::vector<std::shared_ptr<MotorController>> m_motorControllers;
+  // the motor controllers that implement MotorSafety, or nullptr
+  std::vector<MotorSafety *> m_safety;
+};
+
+} // namespace frc
@@ -0,0 +1,97 @@
+
+#include "rpy/PeriodicWorker.h"
+
+#include <algorithm>
+#include <optional>
+
+#include <frc/Errors.h>
+
+#include <robotpy_build.h>
+
+namespace rpy {
+
+PeriodicWorker::~PeriodicWorker() {
+  Stop();
+  if (m_thread.joinable()) {
+    // destroyed by its own thread
+    m_thread.detach();
+  }
+}
+
+bool PeriodicWorker::Start(Clock::duration period, Step step,
+                           std::function<void()> onStart) {
+  if (std::this_thread::get_id() == m_threadId) {
+    std::scoped_lock lock{m_mutex};
+    if (m_running) {
+      return false;
+    }
+    throw FRC_MakeError(frc::err::IncompatibleState,
+                        "cannot be restarted by its own thread");
+  }
+
+  std::scoped_lock threadLock{m_threadMutex};
+  {
+    std::scoped_lock lock{m_mutex};
+    if (m_running) {
+      return false;
+    }
+  }
+  // a previous thread that stopped itself
+  if (m_thread.joinable()) {
+    m_thread.join();
+  }
+
+  std::scoped_lock lock{m_mutex};
+  m_running = true;
+  if (onStart) {
+    onStart();
+  }
+  m_thread = std::thread([this, period, step = std::move(step)] {
+    Run(period, step);
+  });
+  m_threadId = m_thread.get_id();
+  return true;
+}
+
+void PeriodicWorker::Stop() {
+  {
+    std::scoped_lock lock{m_mutex};
+    m_running = false;
+    m_cv.notify_all();
+  }
+  if (std::this_thread::get_id() == m_threadId) {
+    // called by the step; the thread exits once it returns, and is joined
+    // by the next Start
+    return;
+  }
+
+  // the step may need the GIL, so it can't be held while joining
+  std::optional<py::gil_scoped_release> release;
+  if (Py_IsInitialized() && PyGILState_Check()) {
+    release.emplace();
+  }
+  std::scoped_lock threadLock{m_threadMutex};
+  if (m_thread.joinable()) {
+    m_thread.join();
+  }
+}
+
+bool PeriodicWorker::IsRunning() {
+  std::scoped_lock lock{m_mutex};
+  return m_running;
+}
+
+void PeriodicWorker::Run(Clock::duration period, Step step) {
+  auto next = Clock::now();
+  std::unique_lock lock{m_mutex};
+  while (m_running) {
+    if (step(lock)) {
+      continue;
+    }
+    next = std::max(next + period, Clock::now());
+    m_cv.wait_until(lock, next, [this] { return !m_running; });
+  }
+  m_threadId = std::thread::id{};
+}
+
+} // namespace rpy
@@ -0,0 +1,71 @@
+#pragma once
+
+#include <atomic>
+#include <chrono>
+#include <condition_variable>
+#include <functional>
+#include <mutex>
+#include <thread>
+
+namespace rpy {
+
+/**
+ * A background thread that calls a step function at a fixed period until
+ * it is stopped. If a step runs long, the worker doesn't try to catch up.
+ * Used by the classes that sample or render in the background, such as
+ * frc::SensorHistory.
+ *
+ * The worker shares the mutex of its owner. The step is called with the
+ * mutex locked, and may unlock it while it works, but must return with it
+ * locked. It returns true to be called again right away instead of at the
+ * next period.
+ *
+ * Stop may be called by the step itself. Otherwise it waits for the
+ * thread to finish, releasing the GIL while it waits if the caller holds
+ * it, so steps may call into Python.
+ */
+class PeriodicWorker {
+ public:
+  using Clock = std::chrono::steady_clock;
+  using Step = std::function<bool(std::unique_lock<std::mutex> &lock)>;
+
+  explicit PeriodicWorker(std::mutex &mutex) : m_mutex(mutex) {}
+  ~PeriodicWorker();
+
+  PeriodicWorker(const PeriodicWorker &) = delete;
+  PeriodicWorker &operator=(const PeriodicWorker &) = delete;
+
+  /**
+   * Starts the thread, unless it is already running.
+   *
+   * @param period  Time between steps
+   * @param step    Called on the thread every period
+   * @param onStart If the thread is started, called with the mutex locked
+   *                before the first step
+   * @return true if the thread was started
+   */
+  bool Start(Clock::duration period, Step step,
+             std::function<void()> onStart = {});
+
+  /** Stops the thread. */
+  void Stop();
+
+  bool IsRunning();
+
+  /** Same as IsRunning, for callers that hold the mutex */
+  bool IsRunningLocked() const { return m_running; }
+
+ private:
+  void Run(Clock::duration period, Step step);
+
+  std::mutex &m_mutex;
+  std::condition_variable m_cv;
+  bool m_running = false;
+
+  // serializes starting and joining the thread
+  std::mutex m_threadMutex;
+  std::thread m_thread;
+  std::atomic<std::thread::id> m_threadId;
+};
+
+} // namespace rpy
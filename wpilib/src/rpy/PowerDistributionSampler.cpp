@@ -0,0 +1,111 @@
+
+#include "rpy/PowerDistributionSampler.h"
+
+#include <utility>
+
+#include <frc/Errors.h>
+#include <frc/Timer.h>
+
+using namespace frc;
+
+PowerDistributionSampler::PowerDistributionSampler(
+    std::shared_ptr<PowerDistribution> module, units::second_t period)
+    : m_module(std::move(module)) {
+  if (!m_module) {
+    throw FRC_MakeError(err::NullParameter, "module");
+  }
+  if (period <= 0_s) {
+    throw FRC_MakeError(err::ParameterOutOfRange, "period {}",
+                        period.value());
+  }
+  m_period = std::chrono::duration_cast<std::chrono::steady_clock::duration>(
+      std::chrono::duration<double>(period.value()));
+  m_latest.currents.resize(GetNumChannels(m_module->GetType()));
+}
+
+PowerDistributionSampler::~PowerDistributionSampler() { Stop(); }
+
+int PowerDistributionSampler::GetNumChannels(
+    PowerDistribution::ModuleType type) {
+  return type == PowerDistribution::ModuleType::kRev ? 24 : 16;
+}
+
+std::vector<double>
+PowerDistributionSampler::ReadAllCurrents(PowerDistribution &module) {
+  std::vector<double> currents(GetNumChannels(module.GetType()));
+  for (size_t i = 0; i < currents.size(); i++) {
+    currents[i] = module.GetCurrent(i);
+  }
+  return currents;
+}
+
+void PowerDistributionSampler::Start() {
+  m_worker.Start(m_period, [this](auto &lock) { return Step(lock); });
+}
+
+void PowerDistributionSampler::Stop() { m_worker.Stop(); }
+
+bool PowerDistributionSampler::IsRunning() { return m_worker.IsRunning(); }
+
+void PowerDistributionSampler::SampleNow() {
+  std::scoped_lock sampleLock{m_sampleMutex};
+  m_pending.voltage = m_module->GetVoltage();
+  m_pending.temperature = m_module->GetTemperature();
+  m_pending.totalCurrent = m_module->GetTotalCurrent();
+  m_pending.currents = ReadAllCurrents(*m_module);
+  m_pending.timestamp = Timer::GetFPGATimestamp();
+
+  std::scoped_lock lock{m_mutex};
+  std::swap(m_latest, m_pending);
+  m_sampleCount++;
+}
+
+int64_t PowerDistributionSampler::GetSampleCount() {
+  std::scoped_lock lock{m_mutex};
+  return m_sampleCount;
+}
+
+units::second_t PowerDistributionSampler::GetTimestamp() {
+  std::scoped_lock lock{m_mutex};
+  return m_latest.timestamp;
+}
+
+double PowerDistributionSampler::GetVoltage() {
+  std::scoped_lock lock{m_mutex};
+  return m_latest.voltage;
+}
+
+double PowerDistributionSampler::GetTemperature() {
+  std::scoped_lock lock{m_mutex};
+  return m_latest.temperature;
+}
+
+double PowerDistributionSampler::GetTotalCurrent() {
+  std::scoped_lock lock{m_mutex};
+  return m_latest.totalCurrent;
+}
+
+double PowerDistributionSampler::GetCurrent(int channel) {
+  std::scoped_lock lock{m_mutex};
+  if (channel < 0 || static_cast<size_t>(channel) >= m_latest.currents.size()) {
+    throw FRC_MakeError(err::ChannelIndexOutOfRange, "channel {}", channel);
+  }
+  return m_latest.currents[channel];
+}
+
+std::vector<double> PowerDistributionSampler::GetAllCurrents() {
+  std::scoped_lock lock{m_mutex};
+  return m_latest.currents;
+}
+
+bool PowerDistributionSampler::Step(std::unique_lock<std::mutex> &lock) {
+  lock.unlock();
+  try {
+    SampleNow();
+  } catch (const RuntimeError &e) {
+    // keep the previous readings, and try again next time
+    e.Report();
+  }
+  lock.lock();
+  return false;
+}
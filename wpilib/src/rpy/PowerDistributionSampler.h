@@ -0,0 +1,114 @@
+#pragma once
+
+#include <stdint.h>
+
+#include <chrono>
+#include <memory>
+#include <mutex>
+#include <vector>
+
+#include <frc/PowerDistribution.h>
+#include <units/time.h>
+
+#include "rpy/PeriodicWorker.h"
+
+namespace frc {
+
+/**
+ * Reads a PowerDistribution module on a background thread at a fixed
+ * rate, and keeps the latest readings.
+ *
+ * Reading the module goes over CAN; the getters of the sampler only return
+ * the cached readings, so they never wait for the module.
+ */
+class PowerDistributionSampler {
+ public:
+  /**
+   * @param module The power distribution module to read
+   * @param period Time between readings
+   */
+  explicit PowerDistributionSampler(std::shared_ptr<PowerDistribution> module,
+                                    units::second_t period = 20_ms);
+  ~PowerDistributionSampler();
+
+  PowerDistributionSampler(const PowerDistributionSampler &) = delete;
+  PowerDistributionSampler &operator=(const PowerDistributionSampler &) =
+      delete;
+
+  /**
+   * Returns the number of channels of a type of module.
+   */
+  static int GetNumChannels(PowerDistribution::ModuleType type);
+
+  /**
+   * Reads the current of every channel of a module.
+   *
+   * @return the currents in amps, one per channel
+   */
+  static std::vector<double> ReadAllCurrents(PowerDistribution &module);
+
+  std::shared_ptr<PowerDistribution> GetModule() const { return m_module; }
+
+  /** Starts reading in the background */
+  void Start();
+
+  /** Stops reading. The latest readings can still be read. */
+  void Stop();
+
+  bool IsRunning();
+
+  /** Reads the module immediately, in addition to background readings */
+  void SampleNow();
+
+  /** Returns the number of readings that have been taken */
+  int64_t GetSampleCount();
+
+  /**
+   * Returns the FPGA time of the latest reading, or 0 if there hasn't been
+   * one.
+   */
+  units::second_t GetTimestamp();
+
+  /** Returns the latest input voltage, in volts */
+  double GetVoltage();
+
+  /** Returns the latest temperature, in degrees Celsius */
+  double GetTemperature();
+
+  /** Returns the latest total current of all channels, in amps */
+  double GetTotalCurrent();
+
+  /** Returns the latest current of a channel, in amps */
+  double GetCurrent(int channel);
+
+  /** Returns the latest current of every channel, in amps */
+  std::vector<double> GetAllCurrents();
+
+ private:
+  struct Reading {
+    units::second_t timestamp = 0_s;
+    double voltage = 0;
+    double temperature = 0;
+    double totalCurrent = 0;
+    std::vector<double> currents;
+  };
+
+  bool Step(std::unique_lock<std::mutex> &lock);
+
+  std::shared_ptr<PowerDistribution> m_module;
+  std::chrono::steady_clock::duration m_period;
+
+  std::mutex m_mutex;
+  int64_t m_sampleCount = 0;
+  Reading m_latest;
+
+  // the reading being taken; SampleNow and the background thread take
+  // turns
+  std::mutex m_sampleMutex;
+  Reading m_pending;
+
+  // last, so the thread is stopped before the rest is destroyed
+  rpy::PeriodicWorker m_worker{m_mutex};
+};
+
+} // namespace frc
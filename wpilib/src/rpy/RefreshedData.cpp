@@ -0,0 +1,20 @@
+
+#include "rpy/RefreshedData.h"
+
+#include <frc/DriverStation.h>
+
+namespace rpy {
+
+bool RefreshedDataTracker::Check() {
+  if (m_event == 0) {
+    m_event = wpi::CreateEvent(false, false);
+    frc::DriverStation::ProvideRefreshedDataEventHandle(m_event);
+    return true;
+  }
+
+  // the event is set each time the driver station data is refreshed
+  bool timedOut = false;
+  return wpi::WaitForObject(m_event, 0, &timedOut);
+}
+
+} // namespace rpy
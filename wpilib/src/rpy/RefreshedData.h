@@ -0,0 +1,33 @@
+#pragma once
+
+#include <wpi/Synchronization.h>
+
+namespace rpy {
+
+/**
+ * Tells whether the driver station data has been refreshed (by
+ * DriverStation::RefreshData, at the start of each robot loop) since the
+ * last check. Used to cache values that are read once per robot loop.
+ *
+ * Not thread safe: the caller must serialize calls to Check.
+ */
+class RefreshedDataTracker {
+ public:
+  RefreshedDataTracker() = default;
+
+  RefreshedDataTracker(const RefreshedDataTracker &) = delete;
+  RefreshedDataTracker &operator=(const RefreshedDataTracker &) = delete;
+
+  /**
+   * Returns true if this is the first call, or if the data has been
+   * refreshed since the previous call.
+   */
+  bool Check();
+
+ private:
+  // created on first use, and never destroyed because the trackers are
+  // static and DriverStation may already be gone at exit
+  WPI_EventHandle m_event = 0;
+};
+
+} // namespace rpy
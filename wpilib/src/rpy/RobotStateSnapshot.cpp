@@ -0,0 +1,51 @@
+
+#include "rpy/RobotStateSnapshot.h"
+
+#include <mutex>
+
+#include <hal/DriverStation.h>
+
+#include "rpy/RefreshedData.h"
+
+using namespace frc;
+
+RobotStateSnapshot RobotStateSnapshot::Read() {
+  RobotStateSnapshot state;
+  state.timestamp = RobotController::GetFPGATime();
+
+  HAL_ControlWord word;
+  HAL_GetControlWord(&word);
+  state.enabled = word.enabled && word.dsAttached;
+  state.autonomous = word.autonomous;
+  state.test = word.test;
+  state.teleop = !word.autonomous && !word.test;
+  state.eStopped = word.eStop;
+  state.dsAttached = word.dsAttached;
+  state.fmsAttached = word.fmsAttached;
+
+  state.alliance = DriverStation::GetAlliance();
+  state.location = DriverStation::GetLocation();
+  state.matchNumber = DriverStation::GetMatchNumber();
+  state.matchTime = DriverStation::GetMatchTime();
+  state.batteryVoltage = DriverStation::GetBatteryVoltage();
+
+  state.inputVoltage = RobotController::GetInputVoltage();
+  state.inputCurrent = RobotController::GetInputCurrent();
+  state.brownedOut = RobotController::IsBrownedOut();
+  state.sysActive = RobotController::IsSysActive();
+  state.canStatus = RobotController::GetCANStatus();
+
+  return state;
+}
+
+RobotStateSnapshot RobotStateSnapshot::GetCurrent() {
+  static std::mutex mutex;
+  static rpy::RefreshedDataTracker refreshed;
+  static RobotStateSnapshot current;
+
+  std::scoped_lock lock{mutex};
+  if (refreshed.Check()) {
+    current = Read();
+  }
+  return current;
+}
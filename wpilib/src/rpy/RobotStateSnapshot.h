@@ -0,0 +1,64 @@
+#pragma once
+
+#include <stdint.h>
+
+#include <frc/DriverStation.h>
+#include <frc/RobotController.h>
+
+namespace frc {
+
+/**
+ * The robot and driver station state, read all at once.
+ *
+ * Use GetCurrent() in periodic code: the state is read once per robot
+ * loop and then shared, so subsystems that need the state don't each
+ * call into the driver station and the HAL.
+ */
+struct RobotStateSnapshot {
+  /**
+   * Reads the state now.
+   */
+  static RobotStateSnapshot Read();
+
+  /**
+   * Returns the state for the current robot loop. The state is read the
+   * first time this is called after the driver station data has been
+   * refreshed (at the start of each robot loop), and the same state is
+   * returned for the rest of the loop.
+   */
+  static RobotStateSnapshot GetCurrent();
+
+  /** FPGA time (in microseconds) when the state was read */
+  int64_t timestamp = 0;
+
+  bool enabled = false;
+  bool autonomous = false;
+  bool teleop = false;
+  bool test = false;
+  bool eStopped = false;
+  bool dsAttached = false;
+  bool fmsAttached = false;
+
+  DriverStation::Alliance alliance = DriverStation::Alliance::kInvalid;
+  int location = 0;
+  int matchNumber = 0;
+
+  /** Approximate match time in seconds, see DriverStation::GetMatchTime */
+  double matchTime = -1.0;
+
+  /** Battery voltage reported by the driver station */
+  double batteryVoltage = 0.0;
+
+  /** Input voltage to the robot controller */
+  double inputVoltage = 0.0;
+
+  /** Input current to the robot controller */
+  double inputCurrent = 0.0;
+
+  bool brownedOut = false;
+  bool sysActive = false;
+
+  CANStatus canStatus{};
+};
+
+} // namespace frc
@@ -0,0 +1,353 @@
+
+#include "rpy/RotatingDataLog.h"
+
+#include <filesystem>
+
+#include <fmt/format.h>
+#include <frc/Errors.h>
+
+namespace rpy {
+
+namespace {
+
+constexpr uint8_t kControlStart = 0;
+constexpr uint8_t kControlFinish = 1;
+constexpr uint8_t kControlSetMetadata = 2;
+
+uint64_t ReadInt(const uint8_t *p, size_t len) {
+  uint64_t v = 0;
+  for (size_t i = 0; i < len; i++) {
+    v |= static_cast<uint64_t>(p[i]) << (i * 8);
+  }
+  return v;
+}
+
+void WriteInt(std::vector<uint8_t> &out, uint64_t v, size_t len) {
+  for (size_t i = 0; i < len; i++) {
+    out.push_back((v >> (i * 8)) & 0xff);
+  }
+}
+
+bool ReadString(const uint8_t *&p, const uint8_t *end, std::string &out) {
+  if (end - p < 4) {
+    return false;
+  }
+  uint64_t len = ReadInt(p, 4);
+  p += 4;
+  if (static_cast<uint64_t>(end - p) < len) {
+    return false;
+  }
+  out.assign(reinterpret_cast<const char *>(p), len);
+  p += len;
+  return true;
+}
+
+void WriteString(std::vector<uint8_t> &out, std::string_view s) {
+  WriteInt(out, s.size(), 4);
+  out.insert(out.end(), s.begin(), s.end());
+}
+
+} // namespace
+
+RotatingDataLog::RotatingDataLog(std::string_view dir, std::string_view session,
+                                 uint64_t maxSegmentSize,
+                                 units::second_t maxSegmentTime, double period)
+    : m_writer{std::make_shared<Writer>(dir, session, maxSegmentSize,
+                                        maxSegmentTime)} {
+  std::filesystem::create_directories(m_writer->m_dir);
+  // the writer is captured by value so that it is still valid if the
+  // DataLog is used after this object is destroyed
+  m_log = new wpi::log::DataLog(
+      [writer = m_writer](std::span<const uint8_t> data) {
+        writer->Write(data);
+      },
+      period);
+}
+
+RotatingDataLog::~RotatingDataLog() { Stop(); }
+
+wpi::log::DataLog &RotatingDataLog::GetLog() {
+  if (m_writer->m_stopping) {
+    throw FRC_MakeError(frc::err::IncompatibleState,
+                        "the log has been stopped");
+  }
+  return *m_log;
+}
+
+std::string RotatingDataLog::GetCurrentSegment() {
+  std::scoped_lock lock{m_writer->m_mutex};
+  return m_writer->m_current;
+}
+
+void RotatingDataLog::Rotate() {
+  if (m_writer->m_stopping) {
+    return;
+  }
+  m_writer->m_rotate = true;
+  m_log->Flush();
+}
+
+std::optional<std::string>
+RotatingDataLog::WaitForClosedSegment(units::second_t timeout) {
+  auto &w = *m_writer;
+  std::unique_lock lock{w.m_mutex};
+  w.m_cv.wait_for(lock, std::chrono::duration<double>(timeout.value()),
+                  [&] { return !w.m_closed.empty() || w.m_stopped; });
+  if (w.m_closed.empty()) {
+    return std::nullopt;
+  }
+  auto path = std::move(w.m_closed.front());
+  w.m_closed.pop_front();
+  return path;
+}
+
+void RotatingDataLog::Stop() {
+  auto &w = *m_writer;
+  if (!w.m_stopping.exchange(true)) {
+    // DataLog can't flush synchronously, so an empty record is appended
+    // after everything else; the writer detaches from the DataLog when it
+    // sees it, and anything appended after that is discarded
+    m_log->Resume();
+    m_log->AppendRaw(kStopMarker, {}, 0);
+    m_log->Flush();
+  }
+
+  std::unique_lock lock{w.m_mutex};
+  w.m_cv.wait(lock, [&] { return w.m_stopped; });
+}
+
+RotatingDataLog::Writer::Writer(std::string_view dir, std::string_view session,
+                                uint64_t maxSegmentSize,
+                                units::second_t maxSegmentTime)
+    : m_dir(dir), m_session(session), m_maxSegmentSize(maxSegmentSize),
+      m_maxSegmentTime(std::chrono::duration_cast<
+                       std::chrono::steady_clock::duration>(
+          std::chrono::duration<double>(maxSegmentTime.value()))) {}
+
+bool RotatingDataLog::Writer::ShouldRotate(uint64_t unwritten) const {
+  if (!m_file.is_open()) {
+    return true;
+  }
+  if (m_maxSegmentSize != 0 &&
+      m_segmentSize + unwritten >= m_maxSegmentSize) {
+    return true;
+  }
+  return m_maxSegmentTime.count() > 0 &&
+         std::chrono::steady_clock::now() - m_segmentStart >= m_maxSegmentTime;
+}
+
+void RotatingDataLog::Writer::OpenSegment() {
+  auto path = fmt::format("{}/{}_{:04}.wpilog", m_dir, m_session, m_sequence++);
+  // if this fails, records are dropped and opening is retried at the next
+  // record boundary
+  m_file.open(path, std::ios::binary | std::ios::trunc);
+  if (!m_file.is_open()) {
+    return;
+  }
+  m_segmentSize = 0;
+  m_segmentStart = std::chrono::steady_clock::now();
+  {
+    std::scoped_lock lock{m_mutex};
+    m_current = path;
+  }
+
+  // every segment starts with the header and the entries that are active,
+  // so it can be read without the segments before it
+  std::vector<uint8_t> buf{m_header};
+  for (auto &&[id, entry] : m_active) {
+    std::vector<uint8_t> payload;
+    payload.push_back(kControlStart);
+    WriteInt(payload, id, 4);
+    WriteString(payload, entry.name);
+    WriteString(payload, entry.type);
+    WriteString(payload, entry.metadata);
+
+    // 1 byte id, 4 byte size, 8 byte timestamp
+    buf.push_back(0x7c);
+    WriteInt(buf, 0, 1);
+    WriteInt(buf, payload.size(), 4);
+    WriteInt(buf, entry.timestamp, 8);
+    buf.insert(buf.end(), payload.begin(), payload.end());
+  }
+  WriteOut(buf);
+}
+
+void RotatingDataLog::Writer::CloseSegment(std::optional<uint64_t> size) {
+  if (!m_file.is_open()) {
+    return;
+  }
+  m_file.close();
+
+  std::scoped_lock lock{m_mutex};
+  if (size) {
+    std::error_code ec;
+    std::filesystem::resize_file(m_current, *size, ec);
+  }
+  m_closed.emplace_back(std::move(m_current));
+  m_current.clear();
+  m_cv.notify_all();
+}
+
+void RotatingDataLog::Writer::Detach(std::optional<uint64_t> size) {
+  CloseSegment(size);
+  m_detached = true;
+  std::scoped_lock lock{m_mutex};
+  m_stopped = true;
+  m_cv.notify_all();
+}
+
+void RotatingDataLog::Writer::WriteOut(std::span<const uint8_t> data) {
+  if (data.empty()) {
+    return;
+  }
+  m_file.write(reinterpret_cast<const char *>(data.data()), data.size());
+  m_segmentSize += data.size();
+}
+
+void RotatingDataLog::Writer::HandleControl() {
+  const uint8_t *p = m_pending.data();
+  const uint8_t *end = p + m_pending.size();
+  if (end - p < 5) {
+    return;
+  }
+  uint8_t control = p[0];
+  uint32_t id = ReadInt(p + 1, 4);
+  p += 5;
+
+  if (control == kControlStart) {
+    ActiveEntry entry;
+    if (ReadString(p, end, entry.name) && ReadString(p, end, entry.type) &&
+        ReadString(p, end, entry.metadata)) {
+      entry.timestamp = m_controlTimestamp;
+      m_active[id] = std::move(entry);
+    }
+  } else if (control == kControlFinish) {
+    m_active.erase(id);
+  } else if (control == kControlSetMetadata) {
+    auto it = m_active.find(id);
+    if (it != m_active.end()) {
+      ReadString(p, end, it->second.metadata);
+    }
+  }
+}
+
+void RotatingDataLog::Writer::Write(std::span<const uint8_t> data) {
+  if (m_detached) {
+    return;
+  }
+  if (data.empty()) {
+    // the DataLog is being destroyed
+    Detach();
+    return;
+  }
+
+  // The data is a byte stream that can split records anywhere, so it is
+  // parsed incrementally to find record boundaries (the only places where
+  // a segment can be split) and to track which entries are active.
+  size_t pos = 0;
+  size_t written = 0;
+  while (pos < data.size()) {
+    switch (m_state) {
+      case State::kFileHeader: {
+        size_t n = std::min(m_need, data.size() - pos);
+        m_header.insert(m_header.end(), data.begin() + pos,
+                        data.begin() + pos + n);
+        pos += n;
+        m_need -= n;
+        if (m_need == 0) {
+          if (m_header.size() == 12) {
+            // extra header length
+            m_need = ReadInt(m_header.data() + 8, 4);
+          }
+          if (m_need == 0) {
+            m_state = State::kRecordHeader;
+          }
+        }
+        if (m_state == State::kRecordHeader) {
+          // the header is written by OpenSegment
+          written = pos;
+        }
+        break;
+      }
+
+      case State::kRecordHeader: {
+        if (m_pending.empty()) {
+          // record boundary
+          if (m_rotate.exchange(false) || ShouldRotate(pos - written)) {
+            WriteOut(data.subspan(written, pos - written));
+            written = pos;
+            CloseSegment();
+            OpenSegment();
+          }
+          m_recordStart = m_segmentSize + (pos - written);
+
+          uint8_t hdr = data[pos];
+          m_need = 1 + (hdr & 0x3) + 1 + ((hdr >> 2) & 0x3) + 1 +
+                   ((hdr >> 4) & 0x7) + 1;
+        }
+        size_t n = std::min(m_need - m_pending.size(), data.size() - pos);
+        m_pending.insert(m_pending.end(), data.begin() + pos,
+                         data.begin() + pos + n);
+        pos += n;
+        if (m_pending.size() == m_need) {
+          uint8_t hdr = m_pending[0];
+          size_t idLen = (hdr & 0x3) + 1;
+          size_t sizeLen = ((hdr >> 2) & 0x3) + 1;
+          size_t tsLen = ((hdr >> 4) & 0x7) + 1;
+          const uint8_t *p = m_pending.data() + 1;
+          uint32_t id = ReadInt(p, idLen);
+          m_skip = ReadInt(p + idLen, sizeLen);
+          m_controlTimestamp = ReadInt(p + idLen + sizeLen, tsLen);
+          m_pending.clear();
+          if (id == kStopMarker && m_stopping) {
+            // the marker itself is not part of the log
+            if (m_file.is_open()) {
+              WriteOut(data.subspan(written, pos - written));
+            }
+            Detach(m_recordStart);
+            return;
+          }
+          m_state = id == 0 ? State::kControlPayload : State::kSkip;
+          if (m_skip == 0) {
+            if (id == 0) {
+              HandleControl();
+            }
+            m_state = State::kRecordHeader;
+          }
+        }
+        break;
+      }
+
+      case State::kControlPayload: {
+        size_t n = std::min<uint64_t>(m_skip, data.size() - pos);
+        m_pending.insert(m_pending.end(), data.begin() + pos,
+                         data.begin() + pos + n);
+        pos += n;
+        m_skip -= n;
+        if (m_skip == 0) {
+          HandleControl();
+          m_pending.clear();
+          m_state = State::kRecordHeader;
+        }
+        break;
+      }
+
+      case State::kSkip: {
+        size_t n = std::min<uint64_t>(m_skip, data.size() - pos);
+        pos += n;
+        m_skip -= n;
+        if (m_skip == 0) {
+          m_state = State::kRecordHeader;
+        }
+        break;
+      }
+    }
+  }
+
+  if (m_file.is_open()) {
+    WriteOut(data.subspan(written));
+    m_file.flush();
+  }
+}
+
+} // namespace rpy
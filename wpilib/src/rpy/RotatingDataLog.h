@@ -0,0 +1,151 @@
+#pragma once
+
+#include <stdint.h>
+
+#include <atomic>
+#include <chrono>
+#include <condition_variable>
+#include <deque>
+#include <fstream>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <optional>
+#include <span>
+#include <string>
+#include <string_view>
+#include <vector>
+
+#include <units/time.h>
+#include <wpi/DataLog.h>
+
+namespace rpy {
+
+/**
+ * A DataLog that writes its output to a series of segment files instead of
+ * a single file. Used by wpilib.RotatingDataLogManager.
+ *
+ * Segments are named ``<dir>/<session>_<NNNN>.wpilog``. A new segment is
+ * started at the next record boundary once the current segment reaches
+ * maxSegmentSize bytes or is older than maxSegmentTime. Each segment
+ * starts with the log header and a Start record for every entry that is
+ * active, so every segment can be read on its own.
+ *
+ * All file I/O is done on the DataLog writer thread. When a segment is
+ * closed its path is queued, and can be retrieved with
+ * WaitForClosedSegment.
+ *
+ * Like the log of DataLogManager, the DataLog is never destroyed, because
+ * users such as DriverStation::StartDataLog can't be detached from it.
+ * Once stopped, anything appended to it is discarded.
+ */
+class RotatingDataLog {
+ public:
+  /**
+   * @param dir            Directory to write segments to
+   * @param session        Name prefix of the segments
+   * @param maxSegmentSize Segment size in bytes that causes a rotation, or 0
+   * @param maxSegmentTime Segment age that causes a rotation, or 0
+   * @param period         Time between DataLog writes to disk
+   */
+  RotatingDataLog(std::string_view dir, std::string_view session,
+                  uint64_t maxSegmentSize, units::second_t maxSegmentTime,
+                  double period);
+  ~RotatingDataLog();
+
+  RotatingDataLog(const RotatingDataLog &) = delete;
+  RotatingDataLog &operator=(const RotatingDataLog &) = delete;
+
+  /** Returns the log. Throws once the log is stopped. */
+  wpi::log::DataLog &GetLog();
+
+  /** Returns the path of the segment currently being written */
+  std::string GetCurrentSegment();
+
+  /** Starts a new segment at the next record boundary */
+  void Rotate();
+
+  /**
+   * Waits for a segment to be closed and returns its path. Returns nullopt
+   * if the timeout expires, or if the log is stopped and every closed
+   * segment has been returned.
+   */
+  std::optional<std::string> WaitForClosedSegment(units::second_t timeout);
+
+  /**
+   * Writes any remaining data, closes the current segment and stops. The
+   * log can still be used afterwards, but its data is discarded.
+   */
+  void Stop();
+
+ private:
+  // entry id of the record appended by Stop
+  static constexpr int kStopMarker = 0x7fffffff;
+
+  // parses the output of the DataLog and writes it to the segments; it is
+  // shared with the DataLog writer thread, which outlives this object
+  class Writer {
+   public:
+    Writer(std::string_view dir, std::string_view session,
+           uint64_t maxSegmentSize, units::second_t maxSegmentTime);
+
+    void Write(std::span<const uint8_t> data);
+
+   private:
+    friend class RotatingDataLog;
+
+    struct ActiveEntry {
+      std::string name;
+      std::string type;
+      std::string metadata;
+      int64_t timestamp;
+    };
+
+    enum class State { kFileHeader, kRecordHeader, kControlPayload, kSkip };
+
+    // unwritten is the number of bytes not yet passed to WriteOut
+    bool ShouldRotate(uint64_t unwritten) const;
+    void OpenSegment();
+    // if size is set, the segment is truncated to it
+    void CloseSegment(std::optional<uint64_t> size = std::nullopt);
+    void WriteOut(std::span<const uint8_t> data);
+    void HandleControl();
+    void Detach(std::optional<uint64_t> size = std::nullopt);
+
+    std::string m_dir;
+    std::string m_session;
+    uint64_t m_maxSegmentSize;
+    std::chrono::steady_clock::duration m_maxSegmentTime;
+
+    // only used by the writer thread
+    State m_state = State::kFileHeader;
+    std::vector<uint8_t> m_header;
+    std::vector<uint8_t> m_pending;
+    size_t m_need = 12;
+    uint64_t m_skip = 0;
+    int64_t m_controlTimestamp = 0;
+    std::map<uint32_t, ActiveEntry> m_active;
+    std::ofstream m_file;
+    uint64_t m_segmentSize = 0;
+    uint64_t m_recordStart = 0;
+    std::chrono::steady_clock::time_point m_segmentStart;
+    int m_sequence = 0;
+    bool m_detached = false;
+
+    std::atomic_bool m_rotate{false};
+    std::atomic_bool m_stopping{false};
+
+    std::mutex m_mutex;
+    std::condition_variable m_cv;
+    std::deque<std::string> m_closed;
+    std::string m_current;
+    bool m_stopped = false;
+  };
+
+  std::shared_ptr<Writer> m_writer;
+
+  // never destroyed, see the class documentation
+  wpi::log::DataLog *m_log;
+};
+
+} // namespace rpy
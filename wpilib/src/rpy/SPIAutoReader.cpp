@@ -0,0 +1,106 @@
+
+#include "rpy/SPIAutoReader.h"
+
+#include <algorithm>
+
+#include <frc/Errors.h>
+#include <frc/RobotController.h>
+
+using namespace frc;
+
+SPIAutoReader::SPIAutoReader(std::shared_ptr<SPI> spi, int frameSize,
+                             size_t capacity, units::second_t pollPeriod)
+    : m_spi(std::move(spi)), m_frameSize(frameSize), m_capacity(capacity),
+      m_pollPeriod(
+          std::chrono::duration_cast<std::chrono::steady_clock::duration>(
+              std::chrono::duration<double>(pollPeriod.value()))) {
+  if (!m_spi) {
+    throw FRC_MakeError(err::NullParameter, "spi");
+  }
+  if (frameSize <= 0) {
+    throw FRC_MakeError(err::ParameterOutOfRange,
+                        "frameSize {} must be positive", frameSize);
+  }
+  if (capacity == 0) {
+    throw FRC_MakeError(err::ParameterOutOfRange, "capacity must not be 0");
+  }
+  m_timestamps.resize(capacity);
+  m_data.resize(capacity * frameSize);
+}
+
+SPIAutoReader::~SPIAutoReader() { Stop(); }
+
+void SPIAutoReader::Start() {
+  m_worker.Start(m_pollPeriod, [this](auto &lock) { return Step(lock); });
+}
+
+void SPIAutoReader::Stop() { m_worker.Stop(); }
+
+bool SPIAutoReader::IsRunning() { return m_worker.IsRunning(); }
+
+size_t SPIAutoReader::GetAvailable() {
+  std::scoped_lock lock{m_mutex};
+  return m_count;
+}
+
+int64_t SPIAutoReader::GetOverflowCount() {
+  std::scoped_lock lock{m_mutex};
+  return m_overflowCount;
+}
+
+size_t SPIAutoReader::ReadInto(std::span<uint64_t> timestamps,
+                               std::span<uint8_t> data) {
+  std::scoped_lock lock{m_mutex};
+  size_t n = std::min({m_count, timestamps.size(), data.size() / m_frameSize});
+  for (size_t i = 0; i < n; i++) {
+    size_t slot = (m_head + m_capacity - m_count + i) % m_capacity;
+    timestamps[i] = m_timestamps[slot];
+    std::copy_n(m_data.begin() + slot * m_frameSize, m_frameSize,
+                data.begin() + i * m_frameSize);
+  }
+  m_count -= n;
+  return n;
+}
+
+// must be called with the mutex held
+void SPIAutoReader::Push(uint64_t timestamp, const uint32_t *words) {
+  m_timestamps[m_head] = timestamp;
+  for (int i = 0; i < m_frameSize; i++) {
+    m_data[m_head * m_frameSize + i] = static_cast<uint8_t>(words[i]);
+  }
+  m_head = (m_head + 1) % m_capacity;
+  if (m_count == m_capacity) {
+    m_overflowCount++;
+  } else {
+    m_count++;
+  }
+}
+
+bool SPIAutoReader::Step(std::unique_lock<std::mutex> &lock) {
+  // each frame is a timestamp word followed by one word per byte
+  const int frameWords = m_frameSize + 1;
+
+  lock.unlock();
+  int available = m_spi->ReadAutoReceivedData(nullptr, 0, 0_s);
+  int frames = available / frameWords;
+  if (frames > 0) {
+    // don't read more than the ring buffer can hold at once
+    frames = std::min<size_t>(frames, m_capacity);
+    m_buffer.resize(frames * frameWords);
+    m_spi->ReadAutoReceivedData(m_buffer.data(), m_buffer.size(), 0_s);
+
+    // the hardware timestamps are the low 32 bits of the FPGA time
+    uint64_t now = RobotController::GetFPGATime();
+    lock.lock();
+    for (int i = 0; i < frames; i++) {
+      const uint32_t *frame = m_buffer.data() + i * frameWords;
+      uint64_t age = static_cast<uint32_t>(now - frame[0]);
+      Push(age <= now ? now - age : frame[0], frame + 1);
+    }
+    // check again right away, more frames may have arrived
+    return true;
+  }
+
+  lock.lock();
+  return false;
+}
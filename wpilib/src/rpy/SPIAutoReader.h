@@ -0,0 +1,100 @@
+#pragma once
+
+#include <stdint.h>
+
+#include <memory>
+#include <mutex>
+#include <span>
+#include <vector>
+
+#include <frc/SPI.h>
+#include <units/time.h>
+
+#include "rpy/PeriodicWorker.h"
+
+namespace frc {
+
+/**
+ * Reads the frames received by SPI automatic transfers on a background
+ * thread, and keeps them in a ring buffer until they are read.
+ *
+ * Configure the automatic transfers with SPI::InitAuto,
+ * SPI::SetAutoTransmitData and SPI::StartAutoRate (or StartAutoTrigger)
+ * first. The background thread is then the only user of
+ * SPI::ReadAutoReceivedData: don't call it while the reader is running.
+ *
+ * Each frame is the timestamp of the transfer and the bytes received. The
+ * 32-bit timestamps of the hardware are extended to 64-bit FPGA times.
+ * If the ring buffer is full, the oldest frames are discarded.
+ */
+class SPIAutoReader {
+ public:
+  /**
+   * @param spi        The SPI port
+   * @param frameSize  Number of bytes received in each transfer (the size
+   *                   of the transmit data plus the zero size)
+   * @param capacity   Number of frames the ring buffer holds
+   * @param pollPeriod How often the background thread checks for frames
+   */
+  SPIAutoReader(std::shared_ptr<SPI> spi, int frameSize,
+                size_t capacity = 4096, units::second_t pollPeriod = 5_ms);
+  ~SPIAutoReader();
+
+  SPIAutoReader(const SPIAutoReader &) = delete;
+  SPIAutoReader &operator=(const SPIAutoReader &) = delete;
+
+  /** Starts reading frames in the background */
+  void Start();
+
+  /** Stops reading frames. Frames already read can still be read. */
+  void Stop();
+
+  bool IsRunning();
+
+  int GetFrameSize() const { return m_frameSize; }
+
+  size_t GetCapacity() const { return m_capacity; }
+
+  /** Returns the number of frames that can be read */
+  size_t GetAvailable();
+
+  /** Returns the number of frames discarded because the buffer was full */
+  int64_t GetOverflowCount();
+
+  /**
+   * Removes frames from the buffer, oldest first. Never blocks.
+   *
+   * @param timestamps Receives the FPGA timestamp of each frame, in
+   *                   microseconds
+   * @param data       Receives the bytes of each frame, GetFrameSize()
+   *                   bytes per frame
+   * @return the number of frames read
+   */
+  size_t ReadInto(std::span<uint64_t> timestamps, std::span<uint8_t> data);
+
+ private:
+  bool Step(std::unique_lock<std::mutex> &lock);
+  void Push(uint64_t timestamp, const uint32_t *words);
+
+  std::shared_ptr<SPI> m_spi;
+  int m_frameSize;
+  size_t m_capacity;
+  std::chrono::steady_clock::duration m_pollPeriod;
+
+  std::mutex m_mutex;
+
+  // ring buffer
+  std::vector<uint64_t> m_timestamps;
+  std::vector<uint8_t> m_data;
+  size_t m_head = 0;
+  size_t m_count = 0;
+  int64_t m_overflowCount = 0;
+
+  // only used by the reader thread
+  std::vector<uint32_t> m_buffer;
+
+  // last, so the thread is stopped before the rest is destroyed
+  rpy::PeriodicWorker m_worker{m_mutex};
+};
+
+} // namespace frc
@@ -0,0 +1,44 @@
+
+#include "rpy/SPIAutoReceiveSim.h"
+
+#include <algorithm>
+
+#include <hal/simulation/SPIData.h>
+
+using namespace frc::sim;
+
+SPIAutoReceiveSim::SPIAutoReceiveSim(const SPI &spi)
+    : SPIAutoReceiveSim(spi.GetPort()) {}
+
+SPIAutoReceiveSim::SPIAutoReceiveSim(int port) : m_port(port) {
+  m_uid = HALSIM_RegisterSPIReadAutoReceivedDataCallback(port, Callback, this);
+}
+
+SPIAutoReceiveSim::~SPIAutoReceiveSim() {
+  HALSIM_CancelSPIReadAutoReceivedDataCallback(m_port, m_uid);
+}
+
+void SPIAutoReceiveSim::AddTransfer(uint64_t timestamp,
+                                    std::span<const uint8_t> data) {
+  std::scoped_lock lock{m_mutex};
+  m_words.push_back(static_cast<uint32_t>(timestamp));
+  m_words.insert(m_words.end(), data.begin(), data.end());
+}
+
+int SPIAutoReceiveSim::GetPendingWords() {
+  std::scoped_lock lock{m_mutex};
+  return m_words.size();
+}
+
+void SPIAutoReceiveSim::Callback(const char *name, void *param,
+                                 uint32_t *buffer, int32_t numToRead,
+                                 int32_t *outputCount) {
+  auto self = static_cast<SPIAutoReceiveSim *>(param);
+  std::scoped_lock lock{self->m_mutex};
+
+  // like the hardware, returns the number of words left after reading
+  auto n = std::min<size_t>(std::max(numToRead, 0), self->m_words.size());
+  std::copy_n(self->m_words.begin(), n, buffer);
+  self->m_words.erase(self->m_words.begin(), self->m_words.begin() + n);
+  *outputCount = self->m_words.size();
+}
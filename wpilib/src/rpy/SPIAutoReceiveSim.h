@@ -0,0 +1,59 @@
+#pragma once
+
+#include <stdint.h>
+
+#include <deque>
+#include <mutex>
+#include <span>
+
+#include <frc/SPI.h>
+
+namespace frc::sim {
+
+/**
+ * Provides the data received by SPI automatic transfers in simulation.
+ *
+ * Transfers added with AddTransfer are returned by
+ * SPI::ReadAutoReceivedData, in the same format as the hardware: a
+ * timestamp word followed by one word per byte.
+ */
+class SPIAutoReceiveSim {
+ public:
+  /**
+   * @param spi The SPI port to provide data for
+   */
+  explicit SPIAutoReceiveSim(const SPI &spi);
+
+  /**
+   * @param port The SPI port to provide data for
+   */
+  explicit SPIAutoReceiveSim(int port);
+
+  ~SPIAutoReceiveSim();
+
+  SPIAutoReceiveSim(const SPIAutoReceiveSim &) = delete;
+  SPIAutoReceiveSim &operator=(const SPIAutoReceiveSim &) = delete;
+
+  /**
+   * Adds a received transfer.
+   *
+   * @param timestamp FPGA time of the transfer, in microseconds. Only the
+   *                  low 32 bits are kept, like the hardware does.
+   * @param data      The bytes received
+   */
+  void AddTransfer(uint64_t timestamp, std::span<const uint8_t> data);
+
+  /** Returns the number of words that haven't been read yet */
+  int GetPendingWords();
+
+ private:
+  static void Callback(const char *name, void *param, uint32_t *buffer,
+                       int32_t numToRead, int32_t *outputCount);
+
+  int m_port;
+  int32_t m_uid;
+  std::mutex m_mutex;
+  std::deque<uint32_t> m_words;
+};
+
+} // namespace frc::sim
@@ -0,0 +1,141 @@
+
+#include "rpy/SensorGroup.h"
+
+#include <algorithm>
+
+#include <frc/Errors.h>
+#include <frc/Timer.h>
+
+using namespace frc;
+
+int SensorGroup::AddColumns(std::string_view name,
+                            std::initializer_list<std::string_view> suffixes,
+                            std::function<void(double *)> read) {
+  if (m_frozen) {
+    throw FRC_MakeError(err::IncompatibleState,
+                        "sensors can't be added after the group is sampled");
+  }
+
+  std::vector<std::string> names;
+  for (auto suffix : suffixes) {
+    std::string column{name};
+    if (!suffix.empty()) {
+      column += '.';
+      column += suffix;
+    }
+    if (GetIndex(column) != -1) {
+      throw FRC_MakeError(err::ParameterOutOfRange, "duplicate column {}",
+                          column);
+    }
+    names.emplace_back(std::move(column));
+  }
+
+  int index = m_names.size();
+  m_offsets.push_back(index);
+  m_readers.emplace_back(std::move(read));
+  m_names.insert(m_names.end(), std::make_move_iterator(names.begin()),
+                 std::make_move_iterator(names.end()));
+  m_values.resize(m_names.size());
+  return index;
+}
+
+int SensorGroup::AddEncoder(std::string_view name,
+                            std::shared_ptr<Encoder> encoder) {
+  if (!encoder) {
+    throw FRC_MakeError(err::NullParameter, "encoder");
+  }
+  return AddColumns(name, {"distance", "rate"}, [encoder](double *out) {
+    out[0] = encoder->GetDistance();
+    out[1] = encoder->GetRate();
+  });
+}
+
+int SensorGroup::AddDutyCycleEncoder(
+    std::string_view name, std::shared_ptr<DutyCycleEncoder> encoder) {
+  if (!encoder) {
+    throw FRC_MakeError(err::NullParameter, "encoder");
+  }
+  return AddColumns(name, {"distance", "absolute"}, [encoder](double *out) {
+    out[0] = encoder->GetDistance();
+    out[1] = encoder->GetAbsolutePosition();
+  });
+}
+
+int SensorGroup::AddAnalogInput(std::string_view name,
+                                std::shared_ptr<AnalogInput> input,
+                                bool averaged) {
+  if (!input) {
+    throw FRC_MakeError(err::NullParameter, "input");
+  }
+  if (averaged) {
+    return AddColumns(name, {"voltage"}, [input](double *out) {
+      out[0] = input->GetAverageVoltage();
+    });
+  }
+  return AddColumns(name, {"voltage"},
+                    [input](double *out) { out[0] = input->GetVoltage(); });
+}
+
+int SensorGroup::AddDigitalInput(std::string_view name,
+                                 std::shared_ptr<DigitalInput> input) {
+  if (!input) {
+    throw FRC_MakeError(err::NullParameter, "input");
+  }
+  return AddColumns(name, {""},
+                    [input](double *out) { out[0] = input->Get() ? 1 : 0; });
+}
+
+int SensorGroup::AddGyro(std::string_view name, std::shared_ptr<Gyro> gyro) {
+  if (!gyro) {
+    throw FRC_MakeError(err::NullParameter, "gyro");
+  }
+  return AddColumns(name, {"angle", "rate"}, [gyro](double *out) {
+    out[0] = gyro->GetAngle();
+    out[1] = gyro->GetRate();
+  });
+}
+
+int SensorGroup::AddADIS16470_IMU(std::string_view name,
+                                  std::shared_ptr<ADIS16470_IMU> imu) {
+  if (!imu) {
+    throw FRC_MakeError(err::NullParameter, "imu");
+  }
+  return AddColumns(name, {"angle", "rate"}, [imu](double *out) {
+    out[0] = units::degree_t{imu->GetAngle()}.value();
+    out[1] = units::degrees_per_second_t{imu->GetRate()}.value();
+  });
+}
+
+int SensorGroup::GetIndex(std::string_view name) const {
+  auto it = std::find(m_names.begin(), m_names.end(), name);
+  if (it == m_names.end()) {
+    return -1;
+  }
+  return it - m_names.begin();
+}
+
+units::second_t SensorGroup::Sample() {
+  m_frozen = true;
+  m_timestamp = SampleInto(m_values);
+  return m_timestamp;
+}
+
+units::second_t SensorGroup::SampleInto(std::span<double> values) {
+  if (values.size() != m_names.size()) {
+    throw FRC_MakeError(err::ParameterOutOfRange,
+                        "expected {} values, got {}", m_names.size(),
+                        values.size());
+  }
+
+  auto start = Timer::GetFPGATimestamp();
+  for (size_t i = 0; i < m_readers.size(); i++) {
+    m_readers[i](values.data() + m_offsets[i]);
+  }
+  auto end = Timer::GetFPGATimestamp();
+  return (start + end) / 2;
+}
+
+std::span<const double> SensorGroup::GetValues() {
+  m_frozen = true;
+  return m_values;
+}
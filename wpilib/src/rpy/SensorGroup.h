@@ -0,0 +1,144 @@
+#pragma once
+
+#include <functional>
+#include <initializer_list>
+#include <memory>
+#include <span>
+#include <string>
+#include <string_view>
+#include <vector>
+
+#include <frc/ADIS16470_IMU.h>
+#include <frc/AnalogInput.h>
+#include <frc/DigitalInput.h>
+#include <frc/DutyCycleEncoder.h>
+#include <frc/Encoder.h>
+#include <frc/interfaces/Gyro.h>
+#include <units/time.h>
+
+namespace frc {
+
+/**
+ * Reads several sensors at once.
+ *
+ * The sensors are registered once, and each call to Sample reads all of
+ * them into an array of values with a single timestamp. Each sensor
+ * provides one or more named columns of the array:
+ *
+ * - Encoder: "<name>.distance", "<name>.rate"
+ * - DutyCycleEncoder: "<name>.distance", "<name>.absolute"
+ * - AnalogInput: "<name>.voltage"
+ * - DigitalInput: "<name>" (1.0 or 0.0)
+ * - Gyro, ADIS16470_IMU: "<name>.angle", "<name>.rate"
+ *
+ * Sensors can't be added after the group has been sampled.
+ */
+class SensorGroup {
+ public:
+  SensorGroup() = default;
+
+  SensorGroup(const SensorGroup &) = delete;
+  SensorGroup &operator=(const SensorGroup &) = delete;
+
+  /**
+   * Adds an encoder, read with GetDistance and GetRate.
+   *
+   * @return the index of the first column of the encoder
+   */
+  int AddEncoder(std::string_view name, std::shared_ptr<Encoder> encoder);
+
+  /**
+   * Adds a duty cycle encoder, read with GetDistance and
+   * GetAbsolutePosition.
+   *
+   * @return the index of the first column of the encoder
+   */
+  int AddDutyCycleEncoder(std::string_view name,
+                          std::shared_ptr<DutyCycleEncoder> encoder);
+
+  /**
+   * Adds an analog input, read with GetVoltage (or GetAverageVoltage if
+   * averaged is true).
+   *
+   * @return the index of the column of the input
+   */
+  int AddAnalogInput(std::string_view name,
+                     std::shared_ptr<AnalogInput> input,
+                     bool averaged = false);
+
+  /**
+   * Adds a digital input, read with Get.
+   *
+   * @return the index of the column of the input
+   */
+  int AddDigitalInput(std::string_view name,
+                      std::shared_ptr<DigitalInput> input);
+
+  /**
+   * Adds a gyro, read with GetAngle and GetRate.
+   *
+   * @return the index of the first column of the gyro
+   */
+  int AddGyro(std::string_view name, std::shared_ptr<Gyro> gyro);
+
+  /**
+   * Adds an ADIS16470 IMU, read with GetAngle (in degrees) and GetRate (in
+   * degrees per second).
+   *
+   * @return the index of the first column of the IMU
+   */
+  int AddADIS16470_IMU(std::string_view name,
+                       std::shared_ptr<ADIS16470_IMU> imu);
+
+  /** Returns the number of columns */
+  size_t GetSize() const { return m_names.size(); }
+
+  /** Returns the names of the columns */
+  const std::vector<std::string> &GetNames() const { return m_names; }
+
+  /** Returns the index of a column, or -1 if there is no such column */
+  int GetIndex(std::string_view name) const;
+
+  /**
+   * Reads every sensor into the values of the group.
+   *
+   * @return the FPGA time of the sample: the middle of the time it took
+   *         to read the sensors
+   */
+  units::second_t Sample();
+
+  /**
+   * Reads every sensor into an array.
+   *
+   * @param values Receives GetSize() values
+   * @return the FPGA time of the sample
+   */
+  units::second_t SampleInto(std::span<double> values);
+
+  /** Returns the values read by the last call to Sample */
+  std::span<const double> GetValues();
+
+  /** Returns the timestamp of the last call to Sample */
+  units::second_t GetTimestamp() const { return m_timestamp; }
+
+ private:
+  friend class SensorHistory;
+
+  int AddColumns(std::string_view name,
+                 std::initializer_list<std::string_view> suffixes,
+                 std::function<void(double *)> read);
+
+  std::vector<std::string> m_names;
+
+  // each reader writes the columns of one sensor
+  std::vector<std::function<void(double *)>> m_readers;
+  std::vector<size_t> m_offsets;
+
+  std::vector<double> m_values;
+  units::second_t m_timestamp = 0_s;
+
+  // once the values have been used, columns can't be added
+  bool m_frozen = false;
+};
+
+} // namespace frc
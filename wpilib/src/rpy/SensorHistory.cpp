@@ -0,0 +1,163 @@
+
+#include "rpy/SensorHistory.h"
+
+#include <algorithm>
+#include <limits>
+
+#include <frc/Errors.h>
+
+using namespace frc;
+
+SensorHistory::SensorHistory(std::shared_ptr<SensorGroup> group,
+                             size_t capacity, units::second_t period)
+    : m_group(std::move(group)), m_capacity(capacity) {
+  if (!m_group) {
+    throw FRC_MakeError(err::NullParameter, "group");
+  }
+  if (capacity == 0) {
+    throw FRC_MakeError(err::ParameterOutOfRange, "capacity {}", capacity);
+  }
+  if (period <= 0_s) {
+    throw FRC_MakeError(err::ParameterOutOfRange, "period {}",
+                        period.value());
+  }
+  // the group is sampled from another thread, so its sensors must not
+  // change
+  m_group->m_frozen = true;
+  m_columns = m_group->GetSize();
+  m_period = std::chrono::duration_cast<std::chrono::steady_clock::duration>(
+      std::chrono::duration<double>(period.value()));
+
+  m_row.resize(m_columns);
+  m_timestamps.resize(capacity);
+  m_values.resize(capacity * m_columns);
+}
+
+SensorHistory::~SensorHistory() { Stop(); }
+
+void SensorHistory::Start() {
+  m_worker.Start(m_period, [this](auto &lock) { return Step(lock); });
+}
+
+void SensorHistory::Stop() { m_worker.Stop(); }
+
+bool SensorHistory::IsRunning() { return m_worker.IsRunning(); }
+
+void SensorHistory::SampleNow() {
+  std::scoped_lock sampleLock{m_sampleMutex};
+  auto timestamp = m_group->SampleInto(m_row);
+  Push(timestamp.value(), m_row);
+}
+
+void SensorHistory::Clear() {
+  std::scoped_lock lock{m_mutex};
+  m_head = 0;
+  m_count = 0;
+}
+
+size_t SensorHistory::GetSampleCount() {
+  std::scoped_lock lock{m_mutex};
+  return m_count;
+}
+
+units::second_t SensorHistory::GetOldestTimestamp() {
+  std::scoped_lock lock{m_mutex};
+  if (m_count == 0) {
+    return 0_s;
+  }
+  return units::second_t{m_timestamps[m_head]};
+}
+
+units::second_t SensorHistory::GetNewestTimestamp() {
+  std::scoped_lock lock{m_mutex};
+  if (m_count == 0) {
+    return 0_s;
+  }
+  return units::second_t{m_timestamps[(m_head + m_count - 1) % m_capacity]};
+}
+
+bool SensorHistory::GetAt(units::second_t timestamp,
+                          std::span<double> values) {
+  CheckSize(values.size(), m_columns);
+  std::scoped_lock lock{m_mutex};
+  if (m_count == 0) {
+    return false;
+  }
+  Interpolate(timestamp.value(), values.data());
+  return true;
+}
+
+bool SensorHistory::GetAtMany(std::span<const double> timestamps,
+                              std::span<double> values) {
+  CheckSize(values.size(), timestamps.size() * m_columns);
+  std::scoped_lock lock{m_mutex};
+  if (m_count == 0) {
+    std::fill(values.begin(), values.end(),
+              std::numeric_limits<double>::quiet_NaN());
+    return false;
+  }
+  for (size_t i = 0; i < timestamps.size(); i++) {
+    Interpolate(timestamps[i], values.data() + i * m_columns);
+  }
+  return true;
+}
+
+void SensorHistory::CheckSize(size_t size, size_t expected) const {
+  if (size != expected) {
+    throw FRC_MakeError(err::ParameterOutOfRange,
+                        "expected {} values, got {}", expected, size);
+  }
+}
+
+void SensorHistory::Push(double timestamp, std::span<const double> values) {
+  std::scoped_lock lock{m_mutex};
+  if (m_count == m_capacity) {
+    // discard the oldest sample
+    m_head = (m_head + 1) % m_capacity;
+    m_count--;
+  }
+  size_t slot = (m_head + m_count) % m_capacity;
+  m_timestamps[slot] = timestamp;
+  std::copy(values.begin(), values.end(),
+            m_values.begin() + slot * m_columns);
+  m_count++;
+}
+
+void SensorHistory::Interpolate(double timestamp, double *out) const {
+  auto slot = [&](size_t i) { return (m_head + i) % m_capacity; };
+  auto row = [&](size_t i) { return m_values.data() + slot(i) * m_columns; };
+
+  // index of the first sample at or after the timestamp
+  size_t lo = 0;
+  size_t hi = m_count;
+  while (lo < hi) {
+    size_t mid = lo + (hi - lo) / 2;
+    if (m_timestamps[slot(mid)] < timestamp) {
+      lo = mid + 1;
+    } else {
+      hi = mid;
+    }
+  }
+
+  if (lo == 0 || lo == m_count) {
+    auto r = row(lo == 0 ? 0 : m_count - 1);
+    std::copy(r, r + m_columns, out);
+    return;
+  }
+
+  double t0 = m_timestamps[slot(lo - 1)];
+  double t1 = m_timestamps[slot(lo)];
+  const double *r0 = row(lo - 1);
+  const double *r1 = row(lo);
+  double frac = t1 > t0 ? (timestamp - t0) / (t1 - t0) : 1.0;
+  for (size_t c = 0; c < m_columns; c++) {
+    out[c] = r0[c] + (r1[c] - r0[c]) * frac;
+  }
+}
+
+bool SensorHistory::Step(std::unique_lock<std::mutex> &lock) {
+  lock.unlock();
+  SampleNow();
+  lock.lock();
+  return false;
+}
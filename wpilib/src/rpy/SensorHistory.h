@@ -0,0 +1,121 @@
+#pragma once
+
+#include <stdint.h>
+
+#include <chrono>
+#include <memory>
+#include <mutex>
+#include <span>
+#include <vector>
+
+#include <units/time.h>
+
+#include "rpy/PeriodicWorker.h"
+#include "rpy/SensorGroup.h"
+
+namespace frc {
+
+/**
+ * Keeps a history of the values of a SensorGroup, so that the values at
+ * an earlier time can be looked up. This is useful for latency
+ * compensation, such as combining a late vision measurement with the gyro
+ * angle at the time the image was taken.
+ *
+ * The group is sampled on a background thread at a fixed rate, and the
+ * samples are kept in a ring buffer of a fixed capacity. Lookups
+ * interpolate linearly between the two samples around the requested
+ * time; times before the oldest sample or after the newest sample return
+ * that sample.
+ *
+ * Once a history has been created, sensors can't be added to its group.
+ */
+class SensorHistory {
+ public:
+  /**
+   * @param group    The sensors to sample
+   * @param capacity Number of samples to keep
+   * @param period   Time between samples
+   */
+  explicit SensorHistory(std::shared_ptr<SensorGroup> group,
+                         size_t capacity = 256,
+                         units::second_t period = 10_ms);
+  ~SensorHistory();
+
+  SensorHistory(const SensorHistory &) = delete;
+  SensorHistory &operator=(const SensorHistory &) = delete;
+
+  std::shared_ptr<SensorGroup> GetGroup() const { return m_group; }
+
+  /** Starts sampling in the background */
+  void Start();
+
+  /** Stops sampling. The samples already taken can still be looked up. */
+  void Stop();
+
+  bool IsRunning();
+
+  /** Samples the group immediately, in addition to background samples */
+  void SampleNow();
+
+  /** Removes all samples */
+  void Clear();
+
+  size_t GetCapacity() const { return m_capacity; }
+
+  /** Returns the number of samples kept */
+  size_t GetSampleCount();
+
+  /** Returns the timestamp of the oldest sample, or 0 if there is none */
+  units::second_t GetOldestTimestamp();
+
+  /** Returns the timestamp of the newest sample, or 0 if there is none */
+  units::second_t GetNewestTimestamp();
+
+  /**
+   * Looks up the values of the group at a time.
+   *
+   * @param timestamp The FPGA time, in seconds
+   * @param values    Receives one value per column of the group
+   * @return false if there are no samples
+   */
+  bool GetAt(units::second_t timestamp, std::span<double> values);
+
+  /**
+   * Looks up the values of the group at several times.
+   *
+   * @param timestamps The FPGA times, in seconds
+   * @param values     Receives one row of values per timestamp. If there
+   *                   are no samples, the values are set to NaN
+   * @return false if there are no samples
+   */
+  bool GetAtMany(std::span<const double> timestamps,
+                 std::span<double> values);
+
+ private:
+  void CheckSize(size_t size, size_t expected) const;
+  void Push(double timestamp, std::span<const double> values);
+  void Interpolate(double timestamp, double *out) const;
+  bool Step(std::unique_lock<std::mutex> &lock);
+
+  std::shared_ptr<SensorGroup> m_group;
+  size_t m_columns;
+  size_t m_capacity;
+  std::chrono::steady_clock::duration m_period;
+
+  std::mutex m_mutex;
+
+  // the row being sampled; SampleNow and the background thread take turns
+  std::mutex m_sampleMutex;
+  std::vector<double> m_row;
+
+  // ring buffer of samples
+  std::vector<double> m_timestamps;
+  std::vector<double> m_values;
+  size_t m_head = 0;
+  size_t m_count = 0;
+
+  // last, so the thread is stopped before the rest is destroyed
+  rpy::PeriodicWorker m_worker{m_mutex};
+};
+
+} // namespace frc
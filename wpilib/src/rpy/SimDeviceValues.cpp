@@ -0,0 +1,219 @@
+
+#include "rpy/SimDeviceValues.h"
+
+#include <cstring>
+#include <mutex>
+#include <unordered_map>
+#include <utility>
+
+#include <hal/simulation/SimDeviceData.h>
+#include <wpi/StringMap.h>
+
+namespace rpy {
+
+namespace {
+
+struct DeviceCache {
+  std::string name;
+  wpi::StringMap<HAL_SimValueHandle> values;
+};
+
+struct Cache {
+  std::mutex mutex;
+  std::unordered_map<HAL_SimDeviceHandle, DeviceCache> devices;
+
+  Cache() { HALSIM_RegisterSimDeviceFreedCallback("", this, Freed); }
+
+  static void Freed(const char *name, void *param,
+                    HAL_SimDeviceHandle handle) {
+    auto cache = static_cast<Cache *>(param);
+    std::scoped_lock lock{cache->mutex};
+    cache->devices.erase(handle);
+  }
+};
+
+Cache &GetCache() {
+  // never destroyed, so that the freed callback stays valid
+  static Cache *cache = new Cache;
+  return *cache;
+}
+
+// Discards the cached handles of a device if its handle now belongs to a
+// different device. The HAL is never called with the cache locked, because
+// the HAL calls Freed with its own lock held.
+void CheckDevice(HAL_SimDeviceHandle device) {
+  const char *name = HALSIM_GetSimDeviceName(device);
+  auto &cache = GetCache();
+  std::scoped_lock lock{cache.mutex};
+  if (!name) {
+    cache.devices.erase(device);
+    return;
+  }
+  auto &entry = cache.devices[device];
+  if (entry.name != name) {
+    entry.name = name;
+    entry.values.clear();
+  }
+}
+
+HAL_SimValueHandle LookupCached(HAL_SimDeviceHandle device,
+                                std::string_view name) {
+  auto &cache = GetCache();
+  std::scoped_lock lock{cache.mutex};
+  auto it = cache.devices.find(device);
+  if (it == cache.devices.end()) {
+    return 0;
+  }
+  auto value = it->second.values.find(name);
+  return value == it->second.values.end() ? 0 : value->second;
+}
+
+py::object ToPython(const HAL_Value &value) {
+  switch (value.type) {
+    case HAL_BOOLEAN:
+      return py::bool_(value.data.v_boolean != 0);
+    case HAL_DOUBLE:
+      return py::float_(value.data.v_double);
+    case HAL_ENUM:
+      return py::int_(value.data.v_enum);
+    case HAL_INT:
+      return py::int_(value.data.v_int);
+    case HAL_LONG:
+      return py::int_(value.data.v_long);
+    default:
+      return py::none();
+  }
+}
+
+HAL_Value FromPython(HAL_SimValueHandle handle, HAL_Type type,
+                     const std::string &name, py::handle obj) {
+  switch (type) {
+    case HAL_BOOLEAN:
+      return HAL_MakeBoolean(obj.cast<bool>());
+    case HAL_DOUBLE:
+      return HAL_MakeDouble(obj.cast<double>());
+    case HAL_ENUM:
+      if (py::isinstance<py::str>(obj)) {
+        auto option = obj.cast<std::string>();
+        int32_t numOptions = 0;
+        const char **options =
+            HALSIM_GetSimValueEnumOptions(handle, &numOptions);
+        for (int32_t i = 0; i < numOptions; i++) {
+          if (option == options[i]) {
+            return HAL_MakeEnum(i);
+          }
+        }
+        throw py::value_error("'" + option + "' is not an option of " + name);
+      }
+      return HAL_MakeEnum(obj.cast<int32_t>());
+    case HAL_INT:
+      return HAL_MakeInt(obj.cast<int32_t>());
+    case HAL_LONG:
+      return HAL_MakeLong(obj.cast<int64_t>());
+    default:
+      throw py::type_error(name + " has no type");
+  }
+}
+
+} // namespace
+
+HAL_SimValueHandle GetSimValueHandle(HAL_SimDeviceHandle device,
+                                     std::string_view name) {
+  HAL_SimValueHandle handle = LookupCached(device, name);
+  if (handle != 0) {
+    return handle;
+  }
+
+  std::string nameStr{name};
+  handle = HAL_GetSimValueHandle(device, nameStr.c_str());
+  if (handle == 0) {
+    // not cached, the value may be created later
+    return 0;
+  }
+
+  auto &cache = GetCache();
+  std::scoped_lock lock{cache.mutex};
+  cache.devices[device].values[name] = handle;
+  return handle;
+}
+
+py::dict GetSimDeviceValues(frc::sim::SimDeviceSim &sim,
+                            std::optional<std::vector<std::string>> names) {
+  HAL_SimDeviceHandle device = sim;
+  std::vector<std::string> keys;
+  std::vector<HAL_SimValueHandle> handles;
+  std::vector<HAL_Value> values;
+  {
+    py::gil_scoped_release release;
+    CheckDevice(device);
+    if (names) {
+      keys = std::move(*names);
+      handles.reserve(keys.size());
+      for (auto &name : keys) {
+        handles.push_back(GetSimValueHandle(device, name));
+      }
+    } else {
+      // not cached: the HAL calls this with its lock held
+      sim.EnumerateValues([&](const char *name, HAL_SimValueHandle handle,
+                              int32_t direction, const HAL_Value *value) {
+        keys.emplace_back(name);
+        handles.push_back(handle);
+      });
+    }
+
+    values.resize(handles.size());
+    for (size_t i = 0; i < handles.size(); i++) {
+      if (handles[i] != 0) {
+        HAL_GetSimValue(handles[i], &values[i]);
+      }
+    }
+  }
+
+  py::dict result;
+  for (size_t i = 0; i < keys.size(); i++) {
+    if (handles[i] == 0) {
+      throw py::key_error(keys[i]);
+    }
+    result[py::str(keys[i])] = ToPython(values[i]);
+  }
+  return result;
+}
+
+void SetSimDeviceValues(frc::sim::SimDeviceSim &sim, py::dict values) {
+  HAL_SimDeviceHandle device = sim;
+  std::vector<std::string> keys;
+  std::vector<py::handle> objects;
+  for (auto item : values) {
+    keys.push_back(item.first.cast<std::string>());
+    objects.push_back(item.second);
+  }
+
+  std::vector<HAL_SimValueHandle> handles(keys.size());
+  std::vector<HAL_Value> current(keys.size());
+  {
+    py::gil_scoped_release release;
+    CheckDevice(device);
+    for (size_t i = 0; i < keys.size(); i++) {
+      handles[i] = GetSimValueHandle(device, keys[i]);
+      if (handles[i] != 0) {
+        HAL_GetSimValue(handles[i], &current[i]);
+      }
+    }
+  }
+
+  // convert everything first, so that nothing is set if a value is invalid
+  std::vector<HAL_Value> updates(keys.size());
+  for (size_t i = 0; i < keys.size(); i++) {
+    if (handles[i] == 0) {
+      throw py::key_error(keys[i]);
+    }
+    updates[i] = FromPython(handles[i], current[i].type, keys[i], objects[i]);
+  }
+
+  py::gil_scoped_release release;
+  for (size_t i = 0; i < keys.size(); i++) {
+    HAL_SetSimValue(handles[i], &updates[i]);
+  }
+}
+
+} // namespace rpy
@@ -0,0 +1,44 @@
+#pragma once
+
+#include <optional>
+#include <string>
+#include <string_view>
+#include <vector>
+
+#include <frc/simulation/SimDeviceSim.h>
+#include <hal/SimDevice.h>
+
+#include <robotpy_build.h>
+
+namespace rpy {
+
+/**
+ * Returns the handle of a value of a simulated device, or 0 if the device
+ * has no such value.
+ *
+ * Handles are cached by device and name after the first lookup, and the
+ * cache entries of a device are discarded when the device is freed.
+ */
+HAL_SimValueHandle GetSimValueHandle(HAL_SimDeviceHandle device,
+                                     std::string_view name);
+
+/**
+ * Returns a dict of the values of a simulated device, by name. The values
+ * are converted to bool, float or int depending on their type (enums are
+ * returned as the index of their option).
+ *
+ * @param names The names of the values, or all values of the device
+ */
+py::dict GetSimDeviceValues(frc::sim::SimDeviceSim &sim,
+                            std::optional<std::vector<std::string>> names);
+
+/**
+ * Sets several values of a simulated device. Each value is converted to
+ * the type of the device value; enums can be set by index or by option
+ * name.
+ *
+ * @param values Dict of new values, by name
+ */
+void SetSimDeviceValues(frc::sim::SimDeviceSim &sim, py::dict values);
+
+} // namespace rpy
@@ -0,0 +1,27 @@
+#pragma once
+
+#include <robotpy_build.h>
+
+namespace rpy {
+
+/**
+ * Adds __enter__ and __exit__ to a binding of a class with Start and Stop
+ * methods, so that it runs for the duration of a with statement.
+ */
+template <typename T, typename... Extra>
+void DefStartStopContext(py::class_<T, Extra...> &cls) {
+  cls.def(
+         "__enter__",
+         [](T *self) -> T * {
+           py::gil_scoped_release release;
+           self->Start();
+           return self;
+         },
+         py::return_value_policy::reference)
+      .def("__exit__", [](T *self, py::args) {
+        py::gil_scoped_release release;
+        self->Stop();
+      });
+}
+
+} // namespace rpy
@@ -0,0 +1,200 @@
+
+#include "rpy/TelemetryGovernor.h"
+
+#include <atomic>
+#include <cmath>
+#include <map>
+#include <optional>
+
+#include <frc/Timer.h>
+#include <wpi/StringMap.h>
+#include <wpi/mutex.h>
+
+using namespace frc;
+
+namespace {
+
+struct Rule {
+  double minPeriod;
+  double absDeadband;
+  double relDeadband;
+  double heartbeat;
+};
+
+struct KeyState {
+  // rule lookups are cached until the rules change
+  uint64_t generation = 0;
+  std::optional<Rule> rule;
+
+  bool hasValue = false;
+  double lastValue = 0;
+  double lastTime = 0;
+
+  uint64_t published = 0;
+  uint64_t suppressed = 0;
+};
+
+struct GovernorData {
+  wpi::mutex mutex;
+  std::map<std::string, Rule, std::less<>> rules;
+  wpi::StringMap<KeyState> keys;
+  uint64_t generation = 1;
+  uint64_t totalSuppressed = 0;
+
+  // checked without the lock so ungoverned puts stay cheap
+  std::atomic<bool> hasRules{false};
+};
+
+GovernorData &GetData() {
+  static GovernorData data;
+  return data;
+}
+
+// must be called with the lock held
+std::optional<Rule> FindRule(GovernorData &data, std::string_view key) {
+  std::optional<Rule> found;
+  size_t foundLen = 0;
+  for (auto &&[prefix, rule] : data.rules) {
+    if (prefix.size() >= foundLen && key.substr(0, prefix.size()) == prefix) {
+      found = rule;
+      foundLen = prefix.size();
+    }
+  }
+  return found;
+}
+
+// must be called with the lock held, and state must have a rule
+bool Check(GovernorData &data, KeyState &state, double value) {
+  auto &rule = *state.rule;
+  double now = Timer::GetFPGATimestamp().value();
+
+  bool publish;
+  if (!state.hasValue) {
+    publish = true;
+  } else {
+    double elapsed = now - state.lastTime;
+    double change = std::abs(value - state.lastValue);
+    if (rule.heartbeat > 0 && elapsed >= rule.heartbeat) {
+      publish = true;
+    } else if (elapsed < rule.minPeriod) {
+      publish = false;
+    } else if (change <= rule.absDeadband ||
+               change <= rule.relDeadband * std::abs(state.lastValue)) {
+      publish = false;
+    } else {
+      publish = true;
+    }
+  }
+
+  if (publish) {
+    state.hasValue = true;
+    state.lastValue = value;
+    state.lastTime = now;
+    state.published++;
+  } else {
+    state.suppressed++;
+    data.totalSuppressed++;
+  }
+  return publish;
+}
+
+// must be called with the lock held; returns nullptr if the key is
+// not governed
+KeyState *GetState(GovernorData &data, std::string_view key) {
+  auto &state = data.keys[key];
+  if (state.generation != data.generation) {
+    state.rule = FindRule(data, key);
+    state.generation = data.generation;
+  }
+  return state.rule ? &state : nullptr;
+}
+
+} // namespace
+
+void TelemetryGovernor::Configure(std::string_view prefix, double maxRate,
+                                  double absDeadband, double relDeadband,
+                                  units::second_t heartbeat) {
+  auto &data = GetData();
+  std::scoped_lock lock(data.mutex);
+  data.rules.insert_or_assign(
+      std::string{prefix},
+      Rule{maxRate > 0 ? 1.0 / maxRate : 0.0, absDeadband, relDeadband,
+           heartbeat.value()});
+  data.generation++;
+  data.hasRules = true;
+}
+
+bool TelemetryGovernor::Remove(std::string_view prefix) {
+  auto &data = GetData();
+  std::scoped_lock lock(data.mutex);
+  auto it = data.rules.find(prefix);
+  if (it == data.rules.end()) {
+    return false;
+  }
+  data.rules.erase(it);
+  data.generation++;
+  data.hasRules = !data.rules.empty();
+  return true;
+}
+
+void TelemetryGovernor::Clear() {
+  auto &data = GetData();
+  std::scoped_lock lock(data.mutex);
+  data.rules.clear();
+  data.keys.clear();
+  data.generation++;
+  data.totalSuppressed = 0;
+  data.hasRules = false;
+}
+
+std::tuple<uint64_t, uint64_t>
+TelemetryGovernor::GetCounts(std::string_view key) {
+  auto &data = GetData();
+  std::scoped_lock lock(data.mutex);
+  auto it = data.keys.find(key);
+  if (it == data.keys.end()) {
+    return {0, 0};
+  }
+  return {it->second.published, it->second.suppressed};
+}
+
+uint64_t TelemetryGovernor::GetTotalSuppressed() {
+  auto &data = GetData();
+  std::scoped_lock lock(data.mutex);
+  return data.totalSuppressed;
+}
+
+void TelemetryGovernor::ResetCounts() {
+  auto &data = GetData();
+  std::scoped_lock lock(data.mutex);
+  for (auto &&entry : data.keys) {
+    entry.second.published = 0;
+    entry.second.suppressed = 0;
+  }
+  data.totalSuppressed = 0;
+}
+
+bool TelemetryGovernor::IsEnabled() { return GetData().hasRules; }
+
+bool TelemetryGovernor::ShouldPublish(std::string_view key, double value) {
+  auto &data = GetData();
+  if (!data.hasRules) {
+    return true;
+  }
+  std::scoped_lock lock(data.mutex);
+  auto state = GetState(data, key);
+  return state ? Check(data, *state, value) : true;
+}
+
+double TelemetryGovernor::Filter(std::string_view key, double value) {
+  auto &data = GetData();
+  if (!data.hasRules) {
+    return value;
+  }
+  std::scoped_lock lock(data.mutex);
+  auto state = GetState(data, key);
+  if (!state || Check(data, *state, value)) {
+    return value;
+  }
+  return state->lastValue;
+}
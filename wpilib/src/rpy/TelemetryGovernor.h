@@ -0,0 +1,145 @@
+
+#pragma once
+
+#include <stdint.h>
+
+#include <functional>
+#include <memory>
+#include <optional>
+#include <string>
+#include <string_view>
+#include <tuple>
+#include <type_traits>
+#include <utility>
+
+#include <fmt/format.h>
+#include <networktables/NetworkTable.h>
+
+#include <units/time.h>
+
+namespace frc {
+
+/**
+ * Limits how often numeric and boolean telemetry is published to
+ * NetworkTables.
+ *
+ * Rules are configured for a topic name or a topic name prefix (the
+ * longest matching prefix wins). Keys are full NetworkTables topic names,
+ * so a SmartDashboard key "drive/speed" is governed by rules for
+ * "/SmartDashboard/drive/speed", "/SmartDashboard/drive/", and so on.
+ *
+ * The governor applies to SmartDashboard.putNumber, putBoolean, and
+ * boolean/integer/float/double properties added to a SendableBuilder from
+ * Python. Properties of sendables implemented in C++ are not governed.
+ *
+ * A value is published when any of the following is true:
+ *
+ * - it is the first value seen for the key
+ * - the heartbeat interval has elapsed since the last publish
+ * - the minimum period (1 / maxRate) has elapsed since the last publish,
+ *   and the value has moved outside of the deadband
+ *
+ * Otherwise it is suppressed.
+ */
+class TelemetryGovernor {
+ public:
+  /**
+   * Configures a rule for a topic name or topic name prefix. Replaces any
+   * existing rule for the same prefix.
+   *
+   * @param prefix      Topic name or prefix (such as "/SmartDashboard/drive/")
+   * @param maxRate     Maximum publish rate in Hz, or 0 for no limit
+   * @param absDeadband Changes smaller than or equal to this are suppressed
+   * @param relDeadband Changes smaller than or equal to this fraction of the
+   *                    last published value are suppressed
+   * @param heartbeat   Always publish if it has been this long since the last
+   *                    publish, or 0 to disable
+   */
+  static void Configure(std::string_view prefix, double maxRate = 0,
+                        double absDeadband = 0, double relDeadband = 0,
+                        units::second_t heartbeat = 0_s);
+
+  /**
+   * Removes the rule for a prefix.
+   *
+   * @return true if a rule was removed
+   */
+  static bool Remove(std::string_view prefix);
+
+  /**
+   * Removes all rules, state, and counters.
+   */
+  static void Clear();
+
+  /**
+   * Returns the number of times a key was published and suppressed.
+   *
+   * @param key Topic name
+   * @return (published, suppressed)
+   */
+  static std::tuple<uint64_t, uint64_t> GetCounts(std::string_view key);
+
+  /**
+   * Returns the total number of suppressed updates across all keys.
+   */
+  static uint64_t GetTotalSuppressed();
+
+  /**
+   * Resets the published and suppressed counters for all keys.
+   */
+  static void ResetCounts();
+
+  /**
+   * Returns true if any rules are configured.
+   */
+  static bool IsEnabled();
+
+  /**
+   * Determines whether a value should be published for a key. If it
+   * should, the value is recorded as the last published value.
+   *
+   * @param key   Topic name
+   * @param value New value
+   * @return true if the value should be published
+   */
+  static bool ShouldPublish(std::string_view key, double value);
+
+  /**
+   * Returns the value that should be published for a key: the new value if
+   * it passes the rule, otherwise the last published value (which
+   * NetworkTables does not send again).
+   */
+  static double Filter(std::string_view key, double value);
+
+  /**
+   * Wraps a sendable property getter so that its value is governed. Returns
+   * the getter unchanged if it is empty or the table is not set.
+   */
+  template <typename T>
+  static std::function<T()> WrapGetter(std::shared_ptr<nt::NetworkTable> table,
+                                       std::string_view key,
+                                       std::function<T()> getter) {
+    if (!getter || !table) {
+      return getter;
+    }
+    return [name = fmt::format("{}/{}", table->GetPath(), key),
+            getter = std::move(getter), last = std::optional<T>{}]() mutable
+           -> T {
+      if constexpr (std::is_same_v<T, bool>) {
+        return Filter(name, getter() ? 1.0 : 0.0) != 0.0;
+      } else if constexpr (std::is_integral_v<T>) {
+        // the double is only used to decide; integers above 2^53 can't be
+        // converted back from it exactly
+        T value = getter();
+        if (ShouldPublish(name, static_cast<double>(value)) || !last) {
+          last = value;
+        }
+        return *last;
+      } else {
+        return static_cast<T>(Filter(name, static_cast<double>(getter())));
+      }
+    };
+  }
+};
+
+} // namespace frc